@@ -1,5 +1,12 @@
+import os
+
 import streamlit as st
+from src.cache import get_shared_cache
+from src.dataflow import Dataflow
+from src.precompute import Precomputation
+from src.profiling import get_executor
 from src.settings import AppConfig
+from src.store import ProfileStore, get_namespace
 
 from data_explorer.domain.sections.data import OverallSection
 from data_explorer.domain.sections.datetime import DatetimeSection
@@ -31,30 +38,134 @@ class Canvas:
     def build(self) -> None:
         """Render each one of the sections."""
         st.title(self._title)
-        upload_section = UploadSection()
+
+        # Artefacts of the previous run, only the ones whose inputs changed are recomputed
+        if "dataflow" not in st.session_state:
+            st.session_state.dataflow = Dataflow()
+        dataflow = st.session_state.dataflow
+        dataflow.start()
+
+        upload_section = UploadSection(dataflow=dataflow)
         upload_section.render()
 
         if upload_section.loaded_file is None:
+            dataflow.prune()
             return None
 
-        overall_section = OverallSection(upload_section.loaded_file)
+        # Shared by every session, so the same upload is parsed and profiled once
+        cache = get_shared_cache(self._parameters.CACHE.MAX_MEMORY_MB)
+
+        store = None
+        if self._parameters.STORE.ENABLED:
+            if "profile_store" not in st.session_state:
+                config = AppConfig.Config
+                st.session_state.profile_store = ProfileStore(
+                    self._parameters.STORE.FOLDER,
+                    self._parameters.STORE.MAX_SIZE_MB,
+                    get_namespace(
+                        os.path.join(config.config_folder, config.config_file_name),
+                        self._version,
+                    ),
+                )
+            store = st.session_state.profile_store
+
+        overall_section = OverallSection(
+            upload_section.loaded_file,
+            cache=cache,
+            ingestion=self._parameters.INGESTION,
+            columns=upload_section.selected_columns,
+            optimisation=self._parameters.OPTIMISATION,
+            store=store,
+            approximation=self._parameters.APPROXIMATION,
+            max_bins=self._parameters.NUMERIC_COLS.PLOT.MAX_BINS,
+            dataflow=dataflow,
+        )
+        executor = get_executor(
+            self._parameters.PROFILING.EXECUTOR, self._parameters.PROFILING.MAX_WORKERS
+        )
+
+        precomputation = None
+        if self._parameters.PROFILING.PRECOMPUTE:
+            precomputation = st.session_state.get("precomputation")
+            # Every column is profiled in the background as soon as the file is uploaded
+            if (
+                precomputation is None
+                or precomputation.key != overall_section.dataset_key
+            ):
+                if precomputation is not None:
+                    precomputation.close()
+                precomputation = Precomputation(
+                    overall_section.get_dataset_loader(),
+                    {
+                        "numeric": self._parameters.NUMERIC_COLS,
+                        "text": self._parameters.TEXT_COLS,
+                        "date": self._parameters.DATE_COLS,
+                    },
+                    overall_section.dataset_key,
+                    executor=executor,
+                    partition_rows=self._parameters.PROFILING.PARTITION_ROWS,
+                    store=store,
+                    cache=cache,
+                    approximation=self._parameters.APPROXIMATION,
+                )
+                for kind in ["numeric", "text", "date"]:
+                    precomputation.schedule(kind)
+                st.session_state.precomputation = precomputation
+
         overall_section.render()
-        dataset = overall_section.processed_dataset
+
+        # Only the columns newly converted to datetime are profiled again
+        if precomputation is not None:
+            precomputation.schedule("date", overall_section.selection)
+
+        # The file is only read if one of the sections is not stored yet, and only
+        # the datetime section depends on the columns converted to datetime
+        dataset = overall_section.get_dataset_loader()
 
         numeric_section = NumericSection(
             dataset=dataset,
             params=self._parameters.NUMERIC_COLS,
+            executor=executor,
+            partition_rows=self._parameters.PROFILING.PARTITION_ROWS,
+            store=store,
+            key=overall_section.dataset_key,
+            cache=cache,
+            approximation=self._parameters.APPROXIMATION,
+            layout=self._parameters.LAYOUT,
+            precomputation=precomputation,
+            dataflow=dataflow,
         )
         numeric_section.render()
 
         text_section = TextSection(
             dataset=dataset,
             params=self._parameters.TEXT_COLS,
+            executor=executor,
+            partition_rows=self._parameters.PROFILING.PARTITION_ROWS,
+            store=store,
+            key=overall_section.dataset_key,
+            cache=cache,
+            approximation=self._parameters.APPROXIMATION,
+            layout=self._parameters.LAYOUT,
+            precomputation=precomputation,
+            dataflow=dataflow,
+            exclude=overall_section.selection,
         )
         text_section.render()
 
         datetime_section = DatetimeSection(
-            dataset=dataset,
+            dataset=overall_section.get_processed_dataset,
             params=self._parameters.DATE_COLS,
+            executor=executor,
+            partition_rows=self._parameters.PROFILING.PARTITION_ROWS,
+            store=store,
+            key=overall_section.key,
+            cache=cache,
+            approximation=self._parameters.APPROXIMATION,
+            layout=self._parameters.LAYOUT,
+            precomputation=precomputation,
+            dataflow=dataflow,
         )
         datetime_section.render()
+
+        dataflow.prune()
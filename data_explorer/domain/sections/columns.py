@@ -0,0 +1,169 @@
+from abc import abstractmethod
+from concurrent.futures import Executor
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+import streamlit as st
+from data_explorer.domain.entities import Section
+from data_explorer.domain.sections.pagination import select_columns
+from data_explorer.domain.sections.progress import is_cancelled, render_reports
+from src.cache import DataFrameCache
+from src.data import Dataset
+from src.dataflow import Dataflow
+from src.precompute import Precomputation
+from src.profiling import (
+    ColumnReport,
+    get_report_inputs,
+    iter_reports,
+    load_column_names,
+)
+from src.settings import ParamsApproximation, ParamsLayout, ParamsSections
+from src.store import ProfileStore
+
+
+class ColumnSection(Section):
+    """
+    Class that stores the content of a section with a report per column of a kind.
+
+    Subclasses set the name, kind, number and header of the section, and render
+    the report of a column.
+
+    Attributes
+    ----------
+    dataset : DataSet
+        Dataset object with the transformed dataframe, or a function returning it.
+    params: ParamsSections
+        Object with the parameters for the section.
+    executor : Executor, default = None
+        Pool profiling the columns concurrently, None to profile them one by one.
+    partition_rows : int, default = None
+        Number of rows above which a column is profiled by partitions of that size.
+    store : ProfileStore, default = None
+        On-disk store of the column reports, reused across sessions.
+    key : str, default = None
+        Digest identifying the dataset in the store.
+    cache : DataFrameCache, default = None
+        In-memory cache of the column reports, shared by the sessions of the process.
+    approximation : ParamsApproximation, default = None
+        Object with the parameters to estimate the unique values, counted exactly if not given.
+    layout : ParamsLayout, default = None
+        Object with the parameters to search and page through the columns, all shown if not given.
+    precomputation : Precomputation, default = None
+        Background profiling of the columns since the upload, waited for instead of profiling them.
+    dataflow : Dataflow, default = None
+        Artefacts of the previous run of the session, recomputed only if their inputs changed.
+    header : str, default = None
+        Section header, the one of the subclass if not given.
+    exclude : List[str], default = None
+        Columns left out of the section, such as the ones converted to datetime.
+    """
+
+    _name: str
+    _kind: str
+    _number: int
+    _header: str
+
+    def __init__(
+        self,
+        dataset: Union[Dataset, Callable[[], Dataset]],
+        params: ParamsSections,
+        executor: Optional[Executor] = None,
+        partition_rows: Optional[int] = None,
+        store: Optional[ProfileStore] = None,
+        key: Optional[str] = None,
+        cache: Optional[DataFrameCache] = None,
+        approximation: Optional[ParamsApproximation] = None,
+        layout: Optional[ParamsLayout] = None,
+        precomputation: Optional[Precomputation] = None,
+        dataflow: Optional[Dataflow] = None,
+        header: Optional[str] = None,
+        exclude: Optional[List[str]] = None,
+    ):
+        if header is not None:
+            self._header = header
+        self._params = params
+        self._dataset = dataset
+        self._executor = executor
+        self._partition_rows = partition_rows
+        self._store = store
+        self._key = key
+        self._cache = cache
+        self._approximation = approximation
+        self._layout = layout
+        self._precomputation = precomputation
+        self._dataflow = Dataflow() if dataflow is None else dataflow
+        self._exclude = [] if exclude is None else exclude
+
+    def render(self) -> None:
+        """Render the section."""
+
+        # Header
+        st.header(self._header)
+
+        # Only the columns of the selected page are profiled
+        names = self._dataflow.node(
+            f"{self._name}.columns",
+            lambda: load_column_names(
+                self._dataset,
+                self._kind,
+                store=self._store,
+                key=self._key,
+                cache=self._cache,
+            ),
+            key=self._key,
+        )
+        columns = select_columns(
+            [col for col in names if col not in self._exclude],
+            self._name,
+            self._layout,
+        )
+        names = [col for _, col in columns]
+        cancelled = is_cancelled(self._name)
+        if self._precomputation is not None and cancelled:
+            self._precomputation.cancel()
+
+        # Columns whose dataset and parameters did not change keep their report
+        reports = self._dataflow.iter_nodes(
+            [f"{self._name}.{col}" for col in names],
+            lambda missing: self._get_reports([names[n] for n in missing], cancelled),
+            key=self._key if self._precomputation is None else self._precomputation.key,
+            params=self._params,
+            approximation=self._approximation,
+            partition_rows=self._partition_rows,
+            **get_report_inputs(self._kind),
+        )
+        render_reports(
+            reports,
+            [f"{self._number}.{n} Field Name: {col}" for n, col in columns],
+            self._render_report,
+            expanded=self._layout is None or self._layout.EXPANDED,
+        )
+
+    def _get_reports(
+        self, columns: List[str], cached_only: bool
+    ) -> Iterator[Tuple[int, ColumnReport]]:
+        """Return the reports of the columns, the ones already computed first."""
+        if self._precomputation is not None:
+            # Profiled in the background since the upload, the columns shown first
+            return self._precomputation.iter_reports(
+                self._kind, columns, cached_only=cached_only
+            )
+
+        return iter_reports(
+            self._dataset,
+            self._kind,
+            self._params,
+            columns,
+            executor=self._executor,
+            partition_rows=self._partition_rows,
+            store=self._store,
+            key=self._key,
+            cache=self._cache,
+            approximation=self._approximation,
+            cached_only=cached_only,
+        )
+
+    @staticmethod
+    @abstractmethod
+    def _render_report(report: ColumnReport) -> None:
+        """Render the report of a column."""
+        pass
@@ -1,7 +1,17 @@
+from functools import partial
+from typing import Callable, List, Optional
+
 import pandas as pd
 import streamlit as st
 from data_explorer.domain.entities import Section
+from data_explorer.domain.sections.upload import get_file_id
+from src.cache import DataFrameCache, get_digest
 from src.data import Dataset
+from src.dataflow import Dataflow
+from src.loader import get_dataset_key, load_dataset
+from src.profiling import OverallReport
+from src.settings import ParamsApproximation, ParamsIngestion, ParamsOptimisation
+from src.store import ProfileStore
 
 
 class OverallSection(Section):
@@ -13,6 +23,30 @@ class OverallSection(Section):
     loaded_file : st.uploaded_file_manager.UploadedFile.
         Uploaded file object to use as the dataframe source.
 
+    cache : DataFrameCache, default = None
+        Cache of parsed Datasets and reports, shared by the sessions of the process.
+
+    ingestion : ParamsIngestion, default = None
+        Object with the parameters to read the file, at once if not given.
+
+    columns : List[str], default = None
+        Names of the columns to read, all of them if not given.
+
+    optimisation : ParamsOptimisation, default = None
+        Object with the parameters to compact the data types, kept as read if not given.
+
+    store : ProfileStore, default = None
+        On-disk store of the rendered results, reused across sessions.
+
+    approximation : ParamsApproximation, default = None
+        Object with the parameters to estimate the distinct rows, counted exactly if not given.
+
+    max_bins : int, default = None
+        Number of histogram bins of the numeric columns, counted exactly as the file is read in chunks.
+
+    dataflow : Dataflow, default = None
+        Artefacts of the previous run of the session, recomputed only if their inputs changed.
+
     header : str, default = "1. Overall Information"
         Section header.
 
@@ -32,6 +66,14 @@ class OverallSection(Section):
     def __init__(
         self,
         loaded_file: st.uploaded_file_manager.UploadedFile,
+        cache: Optional[DataFrameCache] = None,
+        ingestion: Optional[ParamsIngestion] = None,
+        columns: Optional[List[str]] = None,
+        optimisation: Optional[ParamsOptimisation] = None,
+        store: Optional[ProfileStore] = None,
+        approximation: Optional[ParamsApproximation] = None,
+        max_bins: Optional[int] = None,
+        dataflow: Optional[Dataflow] = None,
         header: str = "1. Overall Information",
         slider_text: str = "Select the number of rows to be displayed",
         min_slider: int = 5,
@@ -44,8 +86,63 @@ class OverallSection(Section):
         self._min_slider = min_slider
         self._max_slider = max_slider
         self._multiselect_title = multiselect_title
-        self._raw_df = Dataset(loaded_file.name, pd.read_csv(loaded_file))
-        self._processed_df = None
+        self._load_arguments = dict(
+            name=loaded_file.name,
+            loaded_file=loaded_file,
+            params=ingestion,
+            columns=columns,
+            n_kept_rows=max_slider,
+            optimisation=optimisation,
+            approximation=approximation,
+            max_bins=max_bins,
+        )
+        self._cache = cache
+        self._raw_df = None
+        self._processed_dataset = None
+        self._selection = []
+        self._dataflow = Dataflow() if dataflow is None else dataflow
+
+        # The content of the file is only hashed again when another one is uploaded
+        self._key = self._dataflow.node(
+            f"{self._name}.key",
+            lambda: get_dataset_key(**self._load_arguments),
+            file=get_file_id(loaded_file),
+            arguments=[
+                ingestion,
+                columns,
+                max_slider,
+                optimisation,
+                approximation,
+                max_bins,
+            ],
+        )
+        self._report = self._dataflow.node(
+            f"{self._name}.report", lambda: self._load_report(store), key=self._key
+        )
+
+    def _load_report(self, store: Optional[ProfileStore] = None) -> OverallReport:
+        """Return the report of the file, only read when it is neither cached nor stored yet."""
+        report_key = get_digest(self._key.encode(), report=self._name)
+        report = None if self._cache is None else self._cache.get(report_key)
+        if report is None and store is not None:
+            report = store.get(self._key)
+        if report is None:
+            report = OverallReport.from_dataset(
+                self.raw_dataset,
+                self._max_slider,
+                self._load_arguments["approximation"],
+            )
+            if store is not None:
+                store.put(self._key, report)
+        if self._cache is not None and report_key not in self._cache:
+            size = int(
+                sum(
+                    df.memory_usage(deep=True, index=True).sum()
+                    for df in [report.head, report.tail, report.sample]
+                )
+            )
+            self._cache.put(report_key, report, size=size)
+        return report
 
     def render(self) -> None:
         """Render the overall section."""
@@ -54,23 +151,33 @@ class OverallSection(Section):
         st.header(self._header)
 
         # Description
-        st.write(f"**Name of Table:** {self._raw_df.get_name()}")
-        st.write(f"**Number of Rows:** {self._raw_df.get_n_rows():,.0f}")
-        st.write(f"**Number of Columns:** {self._raw_df.get_n_cols():,.0f}")
+        st.write(f"**Name of Table:** {self._load_arguments['name']}")
+        st.write(f"**Number of Rows:** {self._report.n_rows:,.0f}")
+        st.write(f"**Number of Columns:** {self._report.n_cols:,.0f}")
+        label = "Number of Duplicated Rows"
+        if self._report.n_duplicates_estimated:
+            # The error is relative to the distinct rows, so given as a number of rows
+            error = self._load_arguments["approximation"].ERROR * (
+                self._report.n_rows - self._report.n_duplicates
+            )
+            label = f"{label} (estimate, ±{error:,.0f} rows)"
+        st.write(f"**{label}:** {self._report.n_duplicates:,.0f}")
         st.write(
-            f"**Number of Duplicated Rows:** {self._raw_df.get_n_duplicates():,.0f}"
-        )
-        st.write(
-            f"**Number of Rows with Missing Values:** {self._raw_df.get_n_missing():,.0f}"
+            f"**Number of Rows with Missing Values:** {self._report.n_missing:,.0f}"
         )
 
         # List of columns
         st.write("**List of Columns:**")
-        st.code(", ".join(self._raw_df.get_cols_list()))
+        st.code(", ".join(self._report.cols_dtype))
 
         # Type of columns
         st.write("**Type of Columns:**")
-        st.dataframe(pd.Series(self._raw_df.get_cols_dtype(), name="type"))
+        st.dataframe(pd.Series(self._report.cols_dtype, name="type"))
+
+        # Memory usage of columns
+        if self._report.memory_report is not None:
+            st.write("**Memory Usage of Columns (bytes):**")
+            st.dataframe(self._report.memory_report)
 
         # Select number of rows
         n_rows = st.slider(
@@ -79,25 +186,71 @@ class OverallSection(Section):
             max_value=self._max_slider,
         )
 
+        # Only moving the slider draws another sample
+        head, tail, sample = self._dataflow.node(
+            f"{self._name}.rows",
+            lambda: (
+                self._report.head.head(n_rows),
+                self._report.tail.tail(n_rows),
+                self._report.sample.sample(min(n_rows, len(self._report.sample))),
+            ),
+            key=self._key,
+            n_rows=n_rows,
+        )
+
         # Display top n rows of dataframe
         st.write("**Top Rows of Table**")
-        st.dataframe(self._raw_df.get_head(n=n_rows))
+        st.dataframe(head)
 
         # Display bottom n rows of dataframe
         st.write("**Bottom Rows of Table**")
-        st.dataframe(self._raw_df.get_tail(n=n_rows))
+        st.dataframe(tail)
 
         # Display sample n rows of dataframe
         st.write("**Random Sample Rows of Table**")
-        st.dataframe(self._raw_df.get_sample(n=n_rows))
+        st.dataframe(sample)
 
         # Select datetime columns
         selection = st.multiselect(
-            label=self._multiselect_title, options=self._raw_df.get_text_columns()
+            label=self._multiselect_title, options=self._report.text_columns
         )
-        self._processed_df = self._raw_df.convert_to_datetime(selection)
+        self._selection = selection
+        self._processed_dataset = None
+
+    @property
+    def raw_dataset(self) -> Dataset:
+        """Return the Dataset of the uploaded file, read on first use."""
+        if self._raw_df is None:
+            self._raw_df = load_dataset(cache=self._cache, **self._load_arguments)
+        return self._raw_df
+
+    def get_dataset_loader(self) -> Callable[[], Dataset]:
+        """Return a function reading the Dataset through the cache, holding neither the section nor the Dataset."""
+        return partial(load_dataset, cache=self._cache, **self._load_arguments)
+
+    def get_processed_dataset(self) -> Dataset:
+        """Return the Dataset with the selected columns as datetime type, read on first use."""
+        # The raw Dataset is shared and remembers the columns converted before
+        if self._processed_dataset is None:
+            self._processed_dataset = self.raw_dataset.with_datetime(self._selection)
+        return self._processed_dataset
 
     @property
     def processed_dataset(self) -> Dataset:
         """Return the Dataset with the selected columns as datetime type."""
-        return Dataset(self._raw_df.get_name(), self._processed_df)
+        return self.get_processed_dataset()
+
+    @property
+    def dataset_key(self) -> str:
+        """Return the digest identifying the file and the read arguments."""
+        return self._key
+
+    @property
+    def selection(self) -> List[str]:
+        """Return the text columns selected to be converted to datetime."""
+        return self._selection
+
+    @property
+    def key(self) -> str:
+        """Return the digest identifying the file, the read arguments and the selection."""
+        return get_digest(self._key.encode(), datetime=sorted(self._selection))
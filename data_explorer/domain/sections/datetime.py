@@ -1,78 +1,29 @@
-import pandas as pd
 import streamlit as st
-from data_explorer.domain.entities import Section
-from src.data import Dataset
-from src.datetime import DateColumn
-from src.settings import ParamsSections
+from data_explorer.domain.sections.columns import ColumnSection
+from src.profiling import ColumnReport
 
 
-class DatetimeSection(Section):
+class DatetimeSection(ColumnSection):
     """
     Class that stores the content of the datetime section.
 
-    Attributes
-    ----------
-    dataset : DataSet
-        Dataset object with the transformed dataframe.
-    params: ParamsSections
-        Object with the parameters for the datetime section.
-    header : str, default = "4. Date Column Information"
-        Section header.
+    Takes the attributes of ColumnSection, with the header "4. Date Column Information" by default.
     """
 
-    def __init__(
-        self,
-        dataset: Dataset,
-        params: ParamsSections,
-        header: str = "4. Date Column Information",
-    ):
-        self._name = "Datetime"
-        self._header = header
-        self._params = params
-        self._dataset = dataset
+    _name = "Datetime"
+    _kind = "date"
+    _number = 4
+    _header = "4. Date Column Information"
 
-    def render(self) -> None:
-        """Render the datetime section."""
+    @staticmethod
+    def _render_report(report: ColumnReport) -> None:
+        """Render the metrics, chart and most frequent values of a datetime column."""
+        # Display table with metrics
+        st.dataframe(report.metrics)
 
-        # Header
-        st.header(self._header)
+        # Display the Bar chart
+        st.plotly_chart(report.chart)
 
-        for n, col in enumerate(self._dataset.get_date_columns()):
-            date_col = DateColumn(col, self._dataset.df[col])
-
-            # Subheader
-            st.subheader(f"4.{n} Field Name: *{date_col.get_name()}*")
-
-            # Display table with metrics
-            st.dataframe(
-                pd.Series(
-                    {
-                        "Number of Unique Values": date_col.get_unique(
-                            self._params.DROP_NA
-                        ),
-                        "Number of Rows with Missing Values": date_col.get_missing(),
-                        "Number of Weekend Dates": date_col.get_weekend(),
-                        "Number of Weekday Dates": date_col.get_weekday(),
-                        "Number of Dates in Future": date_col.get_future(),
-                        "Number of Rows with 1900-01-01": date_col.get_empty_1900(),
-                        "Number of Rows with 1970-01-01": date_col.get_empty_1970(),
-                        "Minimum Value": date_col.get_min(),
-                        "Maximum Value": date_col.get_max(),
-                    },
-                    name="value",
-                )
-            )
-
-            # Display the Bar chart
-            st.plotly_chart(
-                date_col.get_barchart(self._params.PLOT, self._params.DROP_NA)
-            )
-
-            # Display most frequent values
-            st.write("**Most Frequent Values**")
-            st.dataframe(
-                date_col.get_frequent(self._params.TOP_FREQUENCY, self._params.DROP_NA)
-            )
-
-            # Add a horizontal rule
-            st.markdown("---")
+        # Display most frequent values
+        st.write("**Most Frequent Values**")
+        st.dataframe(report.frequent)
@@ -0,0 +1,48 @@
+import math
+from typing import List, Optional, Tuple
+
+import streamlit as st
+from src.settings import ParamsLayout
+
+
+def search_columns(names: List[str], query: str) -> List[Tuple[int, str]]:
+    """Return the position and name of the columns containing the query, ignoring case."""
+    query = query.strip().lower()
+    return [(n, name) for n, name in enumerate(names) if query in name.lower()]
+
+
+def select_columns(
+    names: List[str], section: str, layout: Optional[ParamsLayout] = None
+) -> List[Tuple[int, str]]:
+    """
+    Render the column search box and page selector, and return the columns to show.
+
+    Only the position and name of the columns of the selected page are returned,
+    so the section profiles as many columns as it shows whatever its width. Every
+    column is shown at once if no layout is given.
+    """
+    if layout is None:
+        return list(enumerate(names))
+
+    query = st.text_input(f"Search {section.lower()} columns", key=f"{section}_search")
+    matches = search_columns(names, query)
+    if not matches:
+        st.write("No column matches the search.")
+        return []
+
+    n_pages = math.ceil(len(matches) / layout.COLUMNS_PER_PAGE)
+    page = 1
+    if n_pages > 1:
+        page = st.number_input(
+            f"Page of {section.lower()} columns (out of {n_pages})",
+            min_value=1,
+            max_value=n_pages,
+            value=1,
+            step=1,
+            # A new search starts again from the first page
+            key=f"{section}_page_{query}",
+        )
+    start = (int(page) - 1) * layout.COLUMNS_PER_PAGE
+    stop = min(start + layout.COLUMNS_PER_PAGE, len(matches))
+    st.caption(f"Showing columns {start + 1} to {stop} of {len(matches)}")
+    return matches[start:stop]
@@ -0,0 +1,59 @@
+from typing import Callable, Iterator, List, Tuple
+
+import streamlit as st
+from src.profiling import ColumnReport
+
+
+def is_cancelled(section: str) -> bool:
+    """
+    Render the button stopping or resuming the profiling, and return whether it is stopped.
+
+    Clicking the stop button while the columns are profiled interrupts the run, and
+    the rerun it triggers finds the button pressed. The section then only shows
+    the columns already profiled until the profiling is resumed.
+    """
+    key = f"{section}_cancelled"
+    if st.session_state.get(key, False):
+        label = f"Resume profiling the {section.lower()} columns"
+        cancelled = not st.button(label, key=f"{section}_resume")
+    else:
+        label = f"Stop profiling the {section.lower()} columns"
+        cancelled = st.button(label, key=f"{section}_stop")
+    st.session_state[key] = cancelled
+    return cancelled
+
+
+def render_reports(
+    reports: Iterator[Tuple[int, ColumnReport]],
+    labels: List[str],
+    render: Callable[[ColumnReport], None],
+    expanded: bool = False,
+) -> None:
+    """
+    Lay out one placeholder per column at once, and fill each one as its report comes.
+
+    The reports are given with the position of their column, in any order, and a
+    progress bar counts the columns rendered so far.
+    """
+    if not labels:
+        return None
+
+    progress = st.progress(0.0)
+    placeholders = []
+    for label in labels:
+        with st.expander(label, expanded=expanded):
+            placeholders.append(st.empty())
+            placeholders[-1].write("*Profiling...*")
+
+    filled = set()
+    for n, report in reports:
+        with placeholders[n].container():
+            render(report)
+        filled.add(n)
+        progress.progress(len(filled) / len(labels))
+
+    # The columns left are the ones whose profiling was stopped
+    progress.empty()
+    for n, placeholder in enumerate(placeholders):
+        if n not in filled:
+            placeholder.write("*Profiling stopped*")
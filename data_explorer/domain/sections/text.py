@@ -1,78 +1,29 @@
-import pandas as pd
 import streamlit as st
-from data_explorer.domain.entities import Section
-from src.data import Dataset
-from src.settings import ParamsSections
-from src.text import TextColumn
+from data_explorer.domain.sections.columns import ColumnSection
+from src.profiling import ColumnReport
 
 
-class TextSection(Section):
+class TextSection(ColumnSection):
     """
     Class that stores the content of the text section.
 
-    Attributes
-    ----------
-    dataset : DataSet
-        Dataset object with the transformed dataframe.
-    params: ParamsSections
-        Object with the parameters for the datetime section.
-    header : str, default = "3. Text Column Information"
-        Section header.
+    Takes the attributes of ColumnSection, with the header "3. Text Column Information" by default.
     """
 
-    def __init__(
-        self,
-        dataset: Dataset,
-        params: ParamsSections,
-        header: str = "3. Text Column Information",
-    ):
-        self._name = "Text"
-        self._header = header
-        self._params = params
-        self._dataset = dataset
+    _name = "Text"
+    _kind = "text"
+    _number = 3
+    _header = "3. Text Column Information"
 
-    def render(self) -> None:
-        """Render the text section."""
+    @staticmethod
+    def _render_report(report: ColumnReport) -> None:
+        """Render the metrics, chart and most frequent values of a text column."""
+        # Display table with metrics
+        st.dataframe(report.metrics)
 
-        # Header
-        st.header(self._header)
+        # Display the Bar chart
+        st.plotly_chart(report.chart)
 
-        for n, col in enumerate(self._dataset.get_text_columns()):
-            text_col = TextColumn(col, self._dataset.df[col])
-
-            # Subheader
-            st.subheader(f"3.{n} Field Name: *{text_col.get_name()}*")
-
-            # Display table with metrics
-            st.dataframe(
-                pd.Series(
-                    {
-                        "Number of Unique Values": text_col.get_unique(
-                            self._params.DROP_NA
-                        ),
-                        "Number of Rows with Missing Values": text_col.get_missing(),
-                        "Number of Empty Rows": text_col.get_empty(),
-                        "Number of Rows with Only Whitespace": text_col.get_whitespace(),
-                        "Number of Rows with Only Lowercases": text_col.get_lowercase(),
-                        "Number of Rows with Only Uppercases": text_col.get_uppercase(),
-                        "Number of Rows with Only Alphabet": text_col.get_alphabet(),
-                        "Number of Rows with only Digits": text_col.get_digit(),
-                        "Mode Value": text_col.get_mode(self._params.DROP_NA),
-                    },
-                    name="value",
-                )
-            )
-
-            # Display the Bar chart
-            st.plotly_chart(
-                text_col.get_barchart(self._params.PLOT, self._params.DROP_NA)
-            )
-
-            # Display most frequent values
-            st.write("**Most Frequent Values**")
-            st.dataframe(
-                text_col.get_frequent(self._params.TOP_FREQUENCY, self._params.DROP_NA)
-            )
-
-            # Add a horizontal rule
-            st.markdown("---")
+        # Display most frequent values
+        st.write("**Most Frequent Values**")
+        st.dataframe(report.frequent)
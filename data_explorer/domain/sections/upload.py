@@ -1,5 +1,14 @@
+from typing import Any, List, Optional
+
 import streamlit as st
 from data_explorer.domain.entities import Section
+from src.dataflow import Dataflow
+from src.formats import get_format, read_columns
+
+
+def get_file_id(loaded_file: st.uploaded_file_manager.UploadedFile) -> List[Any]:
+    """Return the name, size and upload identifier of the file, cheaper to compare than its content."""
+    return [loaded_file.name, loaded_file.size, loaded_file.id]
 
 
 class UploadSection(Section):
@@ -10,18 +19,55 @@ class UploadSection(Section):
     ----------
     button_text : str
         Text to be displayed in the upload button.
+
+    file_types : List[str], default = ["csv", "parquet", "feather", "arrow"]
+        Extensions of the files that can be uploaded.
+
+    multiselect_title : str, default = "Which columns do you want to profile? ..."
+        Text to be displayed on the multiselect widget.
+
+    dataflow : Dataflow, default = None
+        Artefacts of the previous run of the session, recomputed only if their inputs changed.
     """
 
-    def __init__(self, button_text: str = "Choose a CSV file"):
+    def __init__(
+        self,
+        button_text: str = "Choose a CSV, Parquet, Feather or Arrow file",
+        file_types: Optional[List[str]] = None,
+        multiselect_title: str = "Which columns do you want to profile? (all of them if none is selected)",
+        dataflow: Optional[Dataflow] = None,
+    ):
         self._name = "Upload"
         self._button_text = button_text
+        self._file_types = file_types or ["csv", "parquet", "feather", "arrow"]
+        self._multiselect_title = multiselect_title
         self._loaded_file = None
+        self._selected_columns = []
+        self._dataflow = Dataflow() if dataflow is None else dataflow
 
     def render(self) -> None:
         """Render the upload section."""
-        self._loaded_file = st.file_uploader(self._button_text, type="csv")
+        self._loaded_file = st.file_uploader(self._button_text, type=self._file_types)
+
+        if self._loaded_file is None:
+            return None
+
+        # Select the columns to read, listed again only when another file is uploaded
+        options = self._dataflow.node(
+            f"{self._name}.columns",
+            lambda: read_columns(self._loaded_file, get_format(self._loaded_file.name)),
+            file=get_file_id(self._loaded_file),
+        )
+        self._selected_columns = st.multiselect(
+            label=self._multiselect_title, options=options
+        )
 
     @property
     def loaded_file(self) -> st.uploaded_file_manager.UploadedFile:
         """Return the uploaded file object."""
         return self._loaded_file
+
+    @property
+    def selected_columns(self) -> Optional[List[str]]:
+        """Return the names of the columns to read, or None to read all of them."""
+        return self._selected_columns or None
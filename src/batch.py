@@ -0,0 +1,255 @@
+import argparse
+import json
+import os
+import resource
+import sys
+import time
+from dataclasses import dataclass
+from functools import partial
+from multiprocessing import Pool
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from src.loader import load_dataset
+from src.profiling import ColumnReport, OverallReport, profile_columns
+from src.settings import AppConfig
+
+# Configuration of the section of each kind of column
+SECTIONS = {"numeric": "NUMERIC_COLS", "text": "TEXT_COLS", "date": "DATE_COLS"}
+
+
+@dataclass
+class FileProfile:
+    """
+    Class for storing the outcome of profiling one file.
+
+    Attributes
+    ----------
+    path : str
+        Path of the profiled file.
+
+    output : str
+        Path of the JSON file with the profile, None if the profiling failed.
+
+    wall_time : float
+        Seconds taken to read, profile and write the file.
+
+    peak_memory : int
+        Peak resident memory in bytes of the process that profiled only this file.
+
+    error : str, default = None
+        Description of the error raised while profiling the file, if any.
+    """
+
+    path: str
+    output: Optional[str]
+    wall_time: float
+    peak_memory: int
+    error: Optional[str] = None
+
+
+def _to_json(data: pd.core.generic.NDFrame, **options: Any) -> Any:
+    """Return the serie or dataframe as JSON values, with dates in ISO format."""
+    return json.loads(data.to_json(date_format="iso", **options))
+
+
+def column_to_dict(report: ColumnReport) -> Dict[str, Any]:
+    """Return the report of a column as JSON values."""
+    profile = {
+        "name": report.col_name,
+        "metrics": _to_json(report.metrics),
+        "frequent": _to_json(report.frequent, orient="records"),
+    }
+    if report.percentiles is not None:
+        profile["percentiles"] = _to_json(report.percentiles)
+    if report.chart is not None:
+        profile["chart"] = json.loads(report.chart.to_json())
+    return profile
+
+
+def overall_to_dict(report: OverallReport) -> Dict[str, Any]:
+    """Return the report of a dataset as JSON values, without the rows kept for display."""
+    profile = {
+        "name": report.name,
+        "n_rows": report.n_rows,
+        "n_cols": report.n_cols,
+        "n_duplicates": report.n_duplicates,
+        "n_duplicates_estimated": report.n_duplicates_estimated,
+        "n_missing": report.n_missing,
+        "cols_dtype": report.cols_dtype,
+        "text_columns": report.text_columns,
+    }
+    if report.memory_report is not None:
+        profile["memory_report"] = _to_json(report.memory_report)
+    return profile
+
+
+def profile_file(
+    path: str,
+    params: AppConfig,
+    charts: bool = False,
+    datetime: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Return the profile of the file as JSON values, as shown by each section of the application.
+
+    The given text columns the file has are converted to datetime first. The
+    charts are only drawn if asked for, which is the only case plotly is loaded.
+    """
+    dataset = load_dataset(
+        os.path.basename(path),
+        path,
+        params.INGESTION,
+        optimisation=params.OPTIMISATION,
+        approximation=params.APPROXIMATION,
+        max_bins=getattr(params.NUMERIC_COLS.PLOT, "MAX_BINS", None),
+    )
+    if datetime:
+        text_columns = dataset.get_text_columns()
+        dataset = dataset.with_datetime(
+            [col for col in datetime if col in text_columns]
+        )
+
+    profile = {
+        "overall": overall_to_dict(
+            OverallReport.from_dataset(dataset, 0, params.APPROXIMATION)
+        )
+    }
+    for kind, section in SECTIONS.items():
+        section_params = getattr(params, section)
+        if not charts:
+            section_params = section_params.copy(update={"PLOT": None})
+        reports = profile_columns(
+            dataset,
+            kind,
+            section_params,
+            partition_rows=params.PROFILING.PARTITION_ROWS,
+            approximation=params.APPROXIMATION,
+        )
+        profile[kind] = [column_to_dict(report) for report in reports]
+    return profile
+
+
+def get_destinations(paths: List[str], output: str) -> List[str]:
+    """
+    Return the path of the JSON file each file is profiled into.
+
+    The folders of the files are mirrored in the output folder from their
+    deepest common folder, so files named the same in different folders are
+    written to different JSON files.
+    """
+    absolute = [os.path.abspath(path) for path in paths]
+    if len(set(absolute)) < len(absolute):
+        raise ValueError("Cannot profile the same file twice.")
+
+    root = os.path.commonpath([os.path.dirname(path) for path in absolute])
+    return [
+        os.path.join(output, f"{os.path.relpath(path, root)}.json") for path in absolute
+    ]
+
+
+def _get_peak_memory() -> int:
+    """Return the peak resident memory of the current process in bytes."""
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak_memory if sys.platform == "darwin" else peak_memory * 1024
+
+
+def _write_profile(
+    files: Tuple[str, str],
+    params: AppConfig,
+    charts: bool = False,
+    datetime: Optional[List[str]] = None,
+) -> FileProfile:
+    """Profile the file into the JSON file, given as a pair of paths, measuring its time and memory."""
+    path, destination = files
+    error = None
+    start = time.perf_counter()
+    try:
+        profile = profile_file(path, params, charts, datetime)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        with open(destination, "w") as file:
+            json.dump(profile, file, indent=2)
+    except Exception as exception:
+        destination = None
+        error = f"{type(exception).__name__}: {exception}"
+    wall_time = time.perf_counter() - start
+    return FileProfile(path, destination, wall_time, _get_peak_memory(), error)
+
+
+def iter_profile_files(
+    paths: List[str],
+    output: str,
+    params: AppConfig,
+    charts: bool = False,
+    datetime: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+) -> Iterator[FileProfile]:
+    """
+    Profile the files into JSON files of the output folder, yielding each outcome as it completes.
+
+    Each file is written to the JSON file given by get_destinations.
+
+    The files are profiled concurrently on a pool of max_workers processes, one
+    per core by default, while their columns are profiled one by one. Each file
+    is profiled by a new process, so the peak resident memory measured is the
+    file's own, with no tracing slowing the profiling down.
+    """
+    write_profile = partial(
+        _write_profile, params=params, charts=charts, datetime=datetime
+    )
+    files = list(zip(paths, get_destinations(paths, output)))
+    with Pool(processes=max_workers, maxtasksperchild=1) as pool:
+        yield from pool.imap_unordered(write_profile, files)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Profile the files given in the command line and return the exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.batch",
+        description="Profile files without the application and write their profiles as JSON.",
+    )
+    parser.add_argument("paths", nargs="+", help="files to profile")
+    parser.add_argument(
+        "-o", "--output", default=".", help="folder of the JSON profiles"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of files profiled at once, one per core by default",
+    )
+    parser.add_argument(
+        "--datetime",
+        nargs="+",
+        default=None,
+        metavar="COLUMN",
+        help="text columns to convert to datetime, in the files that have them",
+    )
+    parser.add_argument(
+        "--charts", action="store_true", help="add the charts as plotly JSON"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    n_failed = 0
+    for result in iter_profile_files(
+        args.paths, args.output, AppConfig(), args.charts, args.datetime, args.workers
+    ):
+        status = result.output if result.error is None else result.error
+        print(
+            f"{result.path}: {result.wall_time:.2f} s, "
+            f"{result.peak_memory / 1024 ** 2:,.1f} MB peak, {status}"
+        )
+        n_failed += result.error is not None
+    print(
+        f"Profiled {len(args.paths) - n_failed} of {len(args.paths)} files "
+        f"in {time.perf_counter() - start:.2f} s"
+    )
+    return 1 if n_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+import pandas as pd
+
+
+def get_digest(content: bytes, **options: Any) -> str:
+    """Return the SHA-256 digest of the given bytes combined with the parse options."""
+    digest = hashlib.sha256(content)
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class DataFrameCache:
+    """
+    Class for storing parsed DataFrames with a least-recently-used eviction policy.
+
+    Datasets, summaries of files read in chunks and column reports can be stored
+    too by giving their size. Every method holds a lock, so one cache can be
+    shared by the sessions served from different threads; two sessions missing
+    the same key at once both compute it and the last one stored is kept.
+
+    Attributes
+    ----------
+    max_memory_mb : float
+        Maximum amount of memory (in MB) that the stored DataFrames can use.
+    """
+
+    def __init__(self, max_memory_mb: float):
+        self._max_memory = int(max_memory_mb * 1024 ** 2)
+        self._memory = 0
+        self._entries: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def memory_usage(self) -> int:
+        """Return the number of bytes used by the stored DataFrames."""
+        return self._memory
+
+    @property
+    def hits(self) -> int:
+        """Return the number of lookups that found a stored DataFrame."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Return the number of lookups that found nothing."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Return the number of DataFrames evicted to make room for newer ones."""
+        return self._evictions
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Return the DataFrame stored under the given key, if any."""
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: str, df: pd.DataFrame, size: Optional[int] = None) -> None:
+        """Store the DataFrame under the given key, evicting the oldest entries if needed."""
+        if size is None:
+            size = int(df.memory_usage(deep=True, index=True).sum())
+        if size > self._max_memory:
+            return None
+
+        with self._lock:
+            self.pop(key)
+            while self._entries and self._memory + size > self._max_memory:
+                self.pop(next(iter(self._entries)))
+                self._evictions += 1
+
+            self._entries[key] = df
+            self._sizes[key] = size
+            self._memory += size
+
+    def pop(self, key: str) -> Optional[pd.DataFrame]:
+        """Remove and return the DataFrame stored under the given key, if any."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            self._memory -= self._sizes.pop(key)
+            return self._entries.pop(key)
+
+    def clear(self) -> None:
+        """Remove every stored DataFrame."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._memory = 0
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_cache(max_memory_mb: float) -> DataFrameCache:
+    """Return the process-wide cache with the given memory cap, shared by every session."""
+    return DataFrameCache(max_memory_mb)
@@ -0,0 +1,82 @@
+from typing import Optional
+
+import pandas as pd
+import plotly.express as px
+from plotly.graph_objs._figure import Figure
+
+from src.numeric import bin_values, plot_histogram
+from src.settings import FormatBarPlot
+
+
+def get_top_occurrences(
+    occurrences: pd.Series, max_bars: int, n_values: Optional[int] = None
+) -> pd.Series:
+    """
+    Return the max_bars - 1 most frequent values and the rest added up in one "Other" bar.
+
+    n_values is the total number of values when the occurrences only hold the most
+    frequent ones, so that the values not counted also go to the "Other" bar.
+    """
+    if n_values is None:
+        if len(occurrences) <= max_bars:
+            return occurrences
+        n_values = occurrences.sum()
+
+    occurrences = occurrences.sort_values(ascending=False, kind="mergesort")
+    top = occurrences.iloc[: max_bars - 1]
+    other = pd.Series([n_values - top.sum()], index=["Other"])
+    return pd.concat([top, other]).rename(occurrences.name)
+
+
+def _format_barchart(
+    fig: Figure, x_title: str, y_title: str, params: FormatBarPlot
+) -> Figure:
+    """Return the bar chart with the layout given in the parameters."""
+    fig.update_layout(
+        title=params.TITLE,
+        xaxis=dict(
+            title=x_title,
+            titlefont_size=params.AXIS_FONT_SIZE,
+            tickfont_size=params.TICK_FONT_SIZE,
+        ),
+        yaxis=dict(
+            title=y_title,
+            titlefont_size=params.AXIS_FONT_SIZE,
+            tickfont_size=params.TICK_FONT_SIZE,
+        ),
+        showlegend=False,
+        template=params.TEMPLATE,
+    )
+    return fig
+
+
+def plot_occurrences(
+    occurrences: pd.Series,
+    col_name: str,
+    params: FormatBarPlot,
+    n_values: Optional[int] = None,
+) -> Figure:
+    """
+    Return the bar chart of the occurrences per value, with at most MAX_BARS bars.
+
+    Columns with more than MAX_CARDINALITY distinct values are summarised instead by
+    the histogram of their occurrences, i.e. how many values appear how many times,
+    unless the occurrences only hold the most frequent of n_values values.
+    """
+    if n_values is None and len(occurrences) > params.MAX_CARDINALITY:
+        edges, counts = bin_values(
+            occurrences.to_numpy(dtype="float64"), params.MAX_BARS
+        )
+        fig = _format_barchart(
+            plot_histogram(edges, counts),
+            f"Occurrences per value of {col_name} (binned)",
+            "Number of Values",
+            params,
+        )
+        fig.update_layout(title=f"{params.TITLE} ({len(occurrences)} distinct values)")
+        return fig
+
+    fig = px.bar(get_top_occurrences(occurrences, params.MAX_BARS, n_values))
+    fig = _format_barchart(fig, col_name, params.Y_AXIS_LABEL, params)
+    fig.update_xaxes(type="category")
+    return fig
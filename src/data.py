@@ -1,9 +1,14 @@
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
+from src.datetime import DateColumn, parse_datetime
+from src.numeric import NumericColumn
+from src.sketches import HASH_CHUNK_ROWS, hash_values
+from src.text import TextColumn
+
 
 @dataclass
 class Dataset:
@@ -17,10 +22,17 @@ class Dataset:
 
     df : pd.DataFrame
         Pandas DataFrame.
+
+    memory_report : pd.DataFrame, default = None
+        Data types and memory usage of each column before and after compaction.
     """
 
     name: str
     df: pd.DataFrame
+    memory_report: Optional[pd.DataFrame] = None
+    _datetime_series: Dict[str, pd.Series] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def get_name(self) -> str:
         """Return filename of loaded dataset."""
@@ -46,6 +58,24 @@ class Dataset:
         """Return number of duplicated rows of loaded dataset."""
         return int(self.df.duplicated().sum())
 
+    def get_n_duplicates_estimate(
+        self, error: float = 0.01, threshold: int = 100_000
+    ) -> Tuple[int, bool]:
+        """Return number of duplicated rows of loaded dataset and whether it is estimated."""
+        n_rows = self.get_n_rows()
+        if n_rows <= threshold or self.get_n_cols() == 0:
+            return self.get_n_duplicates(), False
+
+        # Deduplicating the 64-bit hashes of the rows takes 8 bytes per row, and is
+        # exact unless two of the rows collide, a chance of about n_rows ** 2 / 2 ** 65
+        hashes = np.concatenate(
+            [
+                hash_values(self.df.iloc[start : start + HASH_CHUNK_ROWS])
+                for start in range(0, n_rows, HASH_CHUNK_ROWS)
+            ]
+        )
+        return n_rows - len(pd.unique(hashes)), False
+
     def get_n_missing(self) -> int:
         """Return number of rows with missing values of loaded dataset."""
         return int(self.df.isnull().any(axis=1).sum())
@@ -70,19 +100,63 @@ class Dataset:
         return self.df.select_dtypes(np.number).columns.tolist()
 
     def get_text_columns(self) -> List[str]:
-        """Return list column names of text type from loaded dataset."""
-        return self.df.select_dtypes(object).columns.tolist()
+        """Return list column names of text type (compacted or not) from loaded dataset."""
+        return [
+            col
+            for col, dtype in self.df.dtypes.items()
+            if dtype == object
+            or (
+                isinstance(dtype, pd.CategoricalDtype)
+                and dtype.categories.dtype == object
+            )
+        ]
 
     def get_date_columns(self) -> List[str]:
         """Return list column names of datetime type from loaded dataset."""
         return self.df.select_dtypes(np.datetime64).columns.tolist()
 
+    def get_memory_usage(self) -> int:
+        """Return number of bytes used by the loaded dataset."""
+        return int(self.df.memory_usage(deep=True, index=True).sum())
+
+    def get_numeric_column(self, col: str) -> NumericColumn:
+        """Return the NumericColumn of the given column name."""
+        return NumericColumn(col, self.df[col])
+
+    def get_text_column(self, col: str) -> TextColumn:
+        """Return the TextColumn of the given column name."""
+        return TextColumn(col, self.df[col])
+
+    def get_date_column(self, col: str) -> DateColumn:
+        """Return the DateColumn of the given column name."""
+        return DateColumn(col, self.df[col])
+
+    def _get_datetime(self, col: str) -> pd.Series:
+        """Return the given column converted to datetime, converting it only once."""
+        if col not in self._datetime_series:
+            self._datetime_series[col] = parse_datetime(self.df[col])
+        return self._datetime_series[col]
+
     def convert_to_datetime(self, columns: List[str]) -> pd.DataFrame:
         """Convert the given columns to datetime if possible."""
-        return pd.concat(
+        if not columns:
+            return self.df.copy(deep=False)
+
+        # Concatenated without copy, the frame shares the buffers of every column
+        df = pd.concat(
             [
-                self.df.drop(columns, axis=1),
-                self.df[columns].apply(pd.to_datetime, errors="coerce"),
+                self._get_datetime(col) if col in columns else self.df.iloc[:, i]
+                for i, col in enumerate(self.df.columns)
             ],
             axis=1,
-        ).reindex(columns=self.df.columns)
+            copy=False,
+        )
+        df.columns = self.df.columns
+        return df
+
+    def with_datetime(self, columns: List[str]) -> "Dataset":
+        """Return the Dataset with the given columns converted to datetime."""
+        if not columns:
+            return self
+
+        return Dataset(self.name, self.convert_to_datetime(columns))
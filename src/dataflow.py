@@ -0,0 +1,102 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.cache import get_digest
+
+
+class Dataflow:
+    """
+    Class for memoising the artefacts computed by a run, recomputed only when their inputs change.
+
+    Each artefact is a node with a name and the inputs it depends on, such as the
+    digest of the dataset, the value of a widget or the parameters of a section.
+    A node whose inputs are the same as on the previous run returns its value
+    without computing it again, while a node whose inputs changed is recomputed
+    and replaces its previous value. Only the latest value of each node is kept,
+    and the nodes not used by a run are dropped once it completes. A Dataflow is
+    meant to be kept by a single session, so it holds no lock.
+    """
+
+    def __init__(self):
+        # Digest of the inputs and value of each node, with the run it was last used in
+        self._nodes: Dict[str, Tuple[str, Any]] = {}
+        self._runs: Dict[str, int] = {}
+        self._run = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._nodes
+
+    @property
+    def hits(self) -> int:
+        """Return the number of nodes served from their memoised value."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Return the number of nodes computed because their inputs changed."""
+        return self._misses
+
+    def start(self) -> None:
+        """Start a new run, the nodes it uses being the ones kept when it completes."""
+        self._run += 1
+
+    def prune(self) -> None:
+        """Drop the nodes not used since the run started."""
+        for name in [name for name, run in self._runs.items() if run != self._run]:
+            del self._nodes[name], self._runs[name]
+
+    def get(self, name: str, **inputs: Any) -> Optional[Any]:
+        """Return the value of the node if its inputs did not change, None otherwise."""
+        entry = self._nodes.get(name)
+        if entry is None or entry[0] != get_digest(b"", **inputs):
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._runs[name] = self._run
+        return entry[1]
+
+    def put(self, name: str, value: Any, **inputs: Any) -> None:
+        """Store the value of the node computed from the given inputs."""
+        self._nodes[name] = (get_digest(b"", **inputs), value)
+        self._runs[name] = self._run
+
+    def node(self, name: str, compute: Callable[[], Any], **inputs: Any) -> Any:
+        """Return the value of the node, computed only if its inputs changed."""
+        value = self.get(name, **inputs)
+        if value is None:
+            value = compute()
+            self.put(name, value, **inputs)
+        return value
+
+    def iter_nodes(
+        self,
+        names: List[str],
+        compute: Callable[[List[int]], Iterator[Tuple[int, Any]]],
+        **inputs: Any,
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield the position and value of each node as soon as it is available.
+
+        The nodes sharing the same inputs are looked up first, and the ones whose
+        inputs changed are computed together by compute, given their positions and
+        yielding the position in that list and value of each node in any order.
+        """
+        missing = []
+        for n, name in enumerate(names):
+            value = self.get(name, **inputs)
+            if value is None:
+                missing.append(n)
+            else:
+                yield n, value
+
+        if not missing:
+            return None
+
+        for m, value in compute(missing):
+            self.put(names[missing[m]], value, **inputs)
+            yield missing[m], value
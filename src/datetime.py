@@ -1,11 +1,154 @@
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
-from plotly.graph_objs._figure import Figure
+from pandas._libs.tslibs.parsing import guess_datetime_format
 
 from src.settings import FormatBarPlot
+from src.sketches import count_distinct
+
+if TYPE_CHECKING:
+    from plotly.graph_objs._figure import Figure
+
+
+NS_PER_DAY = 86_400 * 10 ** 9
+
+# Days since 1970-01-01, which was a Thursday (weekday 3)
+DAY_1900 = (date(1900, 1, 1) - date(1970, 1, 1)).days
+WEEKDAY_1970 = 3
+
+# Number of distinct values the format of a column is guessed from
+FORMAT_SAMPLE_SIZE = 100
+
+
+def get_future_cutoff() -> int:
+    """Return the start of tomorrow as int64 nanoseconds, the dates from which are in the future."""
+    return (pd.Timestamp(date.today()) + pd.Timedelta(days=1)).value
+
+
+def _get_nanoseconds(serie: pd.Series) -> np.ndarray:
+    """Return the wall-clock datetimes of the serie as int64 nanoseconds, NaT included."""
+    if getattr(serie.dtype, "tz", None) is not None:
+        serie = serie.dt.tz_localize(None)
+    return serie.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+def _guess_format(values: np.ndarray) -> Optional[str]:
+    """Return the most common format of the first distinct strings, if it is safe to use."""
+    sample = [value for value in values[:FORMAT_SAMPLE_SIZE] if isinstance(value, str)]
+    formats = Counter(guess_datetime_format(value) for value in sample)
+    formats.pop(None, None)
+    if not formats:
+        return None
+
+    expected = pd.Series(pd.to_datetime(sample, errors="coerce"))
+    for date_format, _ in formats.most_common():
+        # Day-first formats read ambiguous dates unlike the default parser
+        if 0 <= date_format.find("%d") < date_format.find("%m"):
+            continue
+
+        result = pd.Series(pd.to_datetime(sample, format=date_format, errors="coerce"))
+        matched = result.notna()
+        try:
+            if (result[matched] == expected[matched]).all():
+                return date_format
+        except TypeError:
+            continue
+
+    return None
+
+
+def parse_datetime(serie: pd.Series) -> pd.Series:
+    """
+    Return the serie converted to datetime, with NaT for the values that cannot be.
+
+    Only the distinct values are parsed, with the format guessed from the first of
+    them, and mapped back to the rows. Values not matching the format are parsed
+    one by one, so the result is the one of `pd.to_datetime(errors="coerce")`.
+    """
+    if not (serie.dtype == object or isinstance(serie.dtype, pd.CategoricalDtype)):
+        return pd.to_datetime(serie, errors="coerce")
+
+    codes, uniques = pd.factorize(serie)
+    uniques = np.asarray(uniques, dtype=object)
+    date_format = _guess_format(uniques)
+    if date_format is None:
+        parsed = pd.Series(pd.to_datetime(uniques, errors="coerce"))
+    else:
+        parsed = pd.Series(pd.to_datetime(uniques, format=date_format, errors="coerce"))
+        mismatched = parsed.isna().to_numpy()
+        if mismatched.any():
+            parsed[mismatched] = pd.to_datetime(uniques[mismatched], errors="coerce")
+
+    # Mixed time zones are left to the parser of the whole serie
+    if not pd.api.types.is_datetime64_any_dtype(parsed):
+        return pd.to_datetime(serie, errors="coerce")
+
+    values = parsed.array.take(codes, allow_fill=True)
+    return pd.Series(values, index=serie.index, name=serie.name)
+
+
+@dataclass(frozen=True)
+class DateProfile:
+    """
+    Class for storing the scalar metrics of a datetime column.
+
+    Attributes
+    ----------
+    n_missing: int
+        Number of missing values.
+
+    n_weekend, n_weekday: int
+        Number of dates falling on Saturday or Sunday and on the other days.
+
+    n_future: int
+        Number of dates after the day the profile was computed.
+
+    n_empty_1900, n_empty_1970: int
+        Number of dates on 1900-01-01 and on 1970-01-01.
+
+    min, max: int
+        Earliest and latest dates as int64 nanoseconds, None if there are none.
+    """
+
+    n_missing: int
+    n_weekend: int
+    n_weekday: int
+    n_future: int
+    n_empty_1900: int
+    n_empty_1970: int
+    min: Optional[int]
+    max: Optional[int]
+
+    @classmethod
+    def from_nanoseconds(
+        cls, nanoseconds: np.ndarray, future: Optional[int] = None
+    ) -> "DateProfile":
+        """Return the profile of int64 nanoseconds using integer arithmetic only, the future starting tomorrow unless given."""
+        valid = nanoseconds[nanoseconds != pd.NaT.value]
+        n_missing = len(nanoseconds) - len(valid)
+        if len(valid) == 0:
+            return cls(n_missing, 0, 0, 0, 0, 0, None, None)
+
+        days = valid // NS_PER_DAY
+        n_weekend = int(np.count_nonzero((days + WEEKDAY_1970) % 7 >= 5))
+        return cls(
+            n_missing=n_missing,
+            n_weekend=n_weekend,
+            n_weekday=len(valid) - n_weekend,
+            n_future=int(
+                np.count_nonzero(
+                    valid >= (get_future_cutoff() if future is None else future)
+                )
+            ),
+            n_empty_1900=int(np.count_nonzero(days == DAY_1900)),
+            n_empty_1970=int(np.count_nonzero(days == 0)),
+            min=int(valid.min()),
+            max=int(valid.max()),
+        )
 
 
 @dataclass
@@ -24,6 +167,12 @@ class DateColumn:
 
     col_name: str
     serie: pd.Series
+    _value_counts: Dict[bool, pd.Series] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _profile: Optional[DateProfile] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_name(self) -> str:
         """Return name of selected column."""
@@ -31,72 +180,86 @@ class DateColumn:
 
     def get_unique(self, dropna: bool = True) -> int:
         """Return number of unique values for selected column."""
-        return self.serie.nunique(dropna=dropna)
+        return len(self._get_counts(dropna))
+
+    def get_unique_estimate(
+        self, dropna: bool = True, error: float = 0.01, threshold: int = 100_000
+    ) -> Tuple[int, bool]:
+        """Return number of unique values for selected column and whether it is estimated."""
+        # Exact when the value counts are already there or the column is short
+        if dropna in self._value_counts or len(self.serie) <= threshold:
+            return self.get_unique(dropna), False
+
+        return count_distinct(self.serie, dropna, error, threshold)
+
+    def profile(self) -> DateProfile:
+        """Return the scalar metrics of selected column, computed once."""
+        if self._profile is None:
+            self._profile = DateProfile.from_nanoseconds(_get_nanoseconds(self.serie))
+        return self._profile
+
+    def _to_timestamp(self, nanoseconds: Optional[int]) -> datetime:
+        """Return the int64 nanoseconds as a timestamp in the time zone of the column."""
+        if nanoseconds is None:
+            return pd.NaT
+        return pd.Timestamp(nanoseconds).tz_localize(
+            getattr(self.serie.dtype, "tz", None)
+        )
 
     def get_missing(self) -> int:
         """Return number of missing values for selected column."""
-        return int(self.serie.isna().sum())
+        return self.profile().n_missing
 
     def get_weekend(self) -> int:
         """Return number of occurrence of days falling during weekend (Saturday and Sunday)."""
-        return int(self.serie.dt.weekday.isin([5, 6]).sum())
+        return self.profile().n_weekend
 
     def get_weekday(self) -> int:
         """Return number of weekday days (not Saturday or Sunday)."""
-        return int(self.serie.dt.weekday.isin([0, 1, 2, 3, 4]).sum())
+        return self.profile().n_weekday
 
     def get_future(self) -> int:
         """Return number of cases with future dates (after today)."""
-        return int((self.serie > datetime.today()).sum())
+        return self.profile().n_future
 
     def get_empty_1900(self) -> int:
         """Return number of occurrence of 1900-01-01 value."""
-        return int((self.serie.dt.date == date(1900, 1, 1)).sum())
+        return self.profile().n_empty_1900
 
     def get_empty_1970(self) -> int:
         """Return number of occurrence of 1970-01-01 value."""
-        return int((self.serie.dt.date == date(1970, 1, 1)).sum())
+        return self.profile().n_empty_1970
 
     def get_min(self) -> datetime:
         """Return the minimum date."""
-        return self.serie.min()
+        return self._to_timestamp(self.profile().min)
 
     def get_max(self) -> datetime:
         """Return the maximum date."""
-        return self.serie.max()
+        return self._to_timestamp(self.profile().max)
+
+    def _get_counts(self, dropna: bool = True) -> pd.Series:
+        """Return the value count table of selected column, computed once per dropna setting."""
+        if dropna not in self._value_counts:
+            self._value_counts[dropna] = self.serie.value_counts(dropna=dropna)
+        return self._value_counts[dropna]
 
     def _get_occurrences(self, dropna: bool = True) -> pd.Series:
         """Return the occurrences per value for selected column."""
-        return self.serie.value_counts(dropna=dropna).rename("occurrence")
+        return self._get_counts(dropna).rename("occurrence")
 
     def _get_percentages(self, dropna: bool = True) -> pd.Series:
         """Return the normalised occurrences per value for selected column."""
-        return (
-            self.serie.value_counts(normalize=True, dropna=dropna)
-            .round(decimals=4)
-            .rename("percentage")
-        )
+        counts = self._get_counts(dropna)
+        return (counts / counts.sum()).round(decimals=4).rename("percentage")
 
-    def get_barchart(self, params: FormatBarPlot, dropna: bool = True) -> Figure:
+    def get_barchart(self, params: FormatBarPlot, dropna: bool = True) -> "Figure":
         """Return the generated bar chart for selected column."""
-        fig = px.bar(self._get_occurrences(dropna=dropna))
-        fig.update_layout(
-            title=params.TITLE,
-            xaxis=dict(
-                title=self.col_name,
-                titlefont_size=params.AXIS_FONT_SIZE,
-                tickfont_size=params.TICK_FONT_SIZE,
-                type="category",
-            ),
-            yaxis=dict(
-                title=params.Y_AXIS_LABEL,
-                titlefont_size=params.AXIS_FONT_SIZE,
-                tickfont_size=params.TICK_FONT_SIZE,
-            ),
-            showlegend=False,
-            template=params.TEMPLATE,
+        from src.charts import plot_occurrences
+
+        return plot_occurrences(
+            self._get_occurrences(dropna=dropna), self.col_name, params
         )
-        return fig
 
     def get_frequent(self, n_head: int = 20, dropna: bool = True) -> pd.DataFrame:
         """Return the Pandas dataframe containing the occurrences and percentage of the top n_head most frequent values."""
@@ -113,3 +276,10 @@ class DateColumn:
             .head(n_head)
             .reset_index()
         )
+
+    def get_frequent_estimate(
+        self, n_head: int = 20, dropna: bool = True, capacity: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, int]:
+        """Return the frequency table of the top n_head values and the maximum error of its occurrences."""
+        # The whole column is in memory, so its value counts cost no more than a sketch
+        return self.get_frequent(n_head, dropna), 0
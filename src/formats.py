@@ -0,0 +1,194 @@
+import os
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from pandas._libs.parsers import STR_NA_VALUES
+
+Source = Union[str, os.PathLike, BinaryIO]
+
+FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "arrow",
+    ".ipc": "arrow",
+}
+
+
+def get_format(name: str) -> str:
+    """Return the format of the file from the extension of its name, CSV by default."""
+    return FORMATS.get(os.path.splitext(name)[1].lower(), "csv")
+
+
+def _open(source: Source) -> pa.NativeFile:
+    """Return an Arrow file over the source without copying its bytes."""
+    if isinstance(source, (str, os.PathLike)):
+        return pa.memory_map(os.fspath(source), "r")
+
+    if hasattr(source, "getbuffer"):
+        return pa.BufferReader(pa.py_buffer(source.getbuffer()))
+
+    source.seek(0)
+    return pa.BufferReader(pa.py_buffer(source.read()))
+
+
+def _read_ipc(
+    source: Source, file_format: str, columns: Optional[List[str]] = None
+) -> pa.Table:
+    """Return the Arrow table of a Feather or Arrow IPC file, backed by its buffer."""
+    if file_format == "feather":
+        return feather.read_table(_open(source), columns=columns)
+
+    try:
+        table = pa.ipc.open_file(_open(source)).read_all()
+    except pa.ArrowInvalid:
+        table = pa.ipc.open_stream(_open(source)).read_all()
+
+    return table if columns is None else table.select(columns)
+
+
+def read_columns(source: Source, file_format: str) -> List[str]:
+    """Return the column names of the file without reading its values."""
+    if file_format == "csv":
+        _rewind(source)
+        return pd.read_csv(source, nrows=0).columns.tolist()
+
+    if file_format == "parquet":
+        return pq.ParquetFile(_open(source)).schema_arrow.names
+
+    try:
+        return pa.ipc.open_file(_open(source)).schema.names
+    except pa.ArrowInvalid:
+        return pa.ipc.open_stream(_open(source)).schema.names
+
+
+def _read_csv_arrow(
+    source: Source, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """Return the DataFrame of a CSV file parsed on every core, typed as `pd.read_csv` would."""
+    names = read_columns(source, "csv")
+    read_options = pa_csv.ReadOptions(column_names=names, skip_rows=1)
+    convert_options = dict(
+        null_values=sorted(STR_NA_VALUES),
+        strings_can_be_null=True,
+        true_values=["True", "TRUE", "true"],
+        false_values=["False", "FALSE", "false"],
+    )
+    include_columns = [col for col in names if columns is None or col in columns]
+    table = pa_csv.read_csv(
+        _open(source),
+        read_options=read_options,
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=include_columns, **convert_options
+        ),
+    )
+
+    # pd.read_csv keeps dates and times as text
+    temporal = [
+        field.name for field in table.schema if pa.types.is_temporal(field.type)
+    ]
+    if temporal:
+        text = pa_csv.read_csv(
+            _open(source),
+            read_options=read_options,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=temporal,
+                column_types={col: pa.string() for col in temporal},
+                **convert_options,
+            ),
+        )
+        for col in temporal:
+            table = table.set_column(
+                table.schema.get_field_index(col), col, text.column(col)
+            )
+
+    df = table.to_pandas(split_blocks=True)
+    for col, field in zip(table.column_names, table.schema):
+        if pa.types.is_null(field.type):
+            df[col] = df[col].astype("float64" if len(df) else object)
+        elif df[col].dtype == object:
+            # pd.read_csv marks missing text with NaN rather than None
+            df[col] = df[col].where(df[col].notna(), np.nan)
+
+    return df
+
+
+def read_table(
+    source: Source,
+    file_format: str,
+    columns: Optional[List[str]] = None,
+    engine: str = "c",
+    **options: Any,
+) -> pd.DataFrame:
+    """
+    Return the DataFrame of the file, materialising only the given columns.
+
+    CSV files are parsed with `pd.read_csv` and the options given, or on every core
+    by the Arrow CSV reader with the `pyarrow` engine. Parquet files are decoded
+    column by column, while uncompressed Feather and Arrow IPC files are read from
+    the memory-mapped (or uploaded) buffer without copying.
+    """
+    if file_format == "csv" and engine == "pyarrow":
+        if options:
+            raise ValueError(
+                f"The pyarrow engine does not support the options {list(options)}"
+            )
+        return _read_csv_arrow(source, columns)
+
+    if file_format == "csv":
+        _rewind(source)
+        return pd.read_csv(source, usecols=columns, **options)
+
+    if file_format == "parquet":
+        table = pq.read_table(_open(source), columns=columns)
+    else:
+        table = _read_ipc(source, file_format, columns)
+
+    # One block per column lets null-free numeric columns share the Arrow buffers
+    return table.to_pandas(split_blocks=True)
+
+
+def read_batches(
+    source: Source,
+    file_format: str,
+    chunk_size: int,
+    columns: Optional[List[str]] = None,
+    dtype: Optional[Union[type, Dict[str, Any]]] = None,
+    **options: Any,
+) -> Iterator[pd.DataFrame]:
+    """Yield the file in DataFrames of at most chunk_size rows, with the given data types."""
+    if file_format == "csv":
+        _rewind(source)
+        with pd.read_csv(
+            source, chunksize=chunk_size, usecols=columns, dtype=dtype, **options
+        ) as reader:
+            yield from reader
+        return None
+
+    if file_format == "parquet":
+        batches = pq.ParquetFile(_open(source)).iter_batches(
+            batch_size=chunk_size, columns=columns
+        )
+    else:
+        batches = _read_ipc(source, file_format, columns).to_batches(
+            max_chunksize=chunk_size
+        )
+
+    n_rows = 0
+    for batch in batches:
+        chunk = batch.to_pandas(split_blocks=True)
+        chunk.index = pd.RangeIndex(n_rows, n_rows + len(chunk))
+        n_rows += len(chunk)
+        yield chunk if dtype is None else chunk.astype(dtype)
+
+
+def _rewind(source: Source) -> None:
+    """Move back to the start of a file object, if the source is one."""
+    if hasattr(source, "seek"):
+        source.seek(0)
@@ -0,0 +1,129 @@
+from typing import Any, BinaryIO, List, Optional
+
+from src.cache import DataFrameCache, get_digest
+from src.data import Dataset
+from src.datetime import get_future_cutoff
+from src.formats import get_format, read_table
+from src.optimisation import optimise_dataframe
+from src.settings import ParamsApproximation, ParamsIngestion, ParamsOptimisation
+from src.streaming import stream_dataset
+
+
+def _read_dataset(
+    name: str,
+    loaded_file: BinaryIO,
+    params: Optional[ParamsIngestion],
+    optimisation: Optional[ParamsOptimisation],
+    file_format: str,
+    columns: Optional[List[str]],
+    n_kept_rows: int,
+    approximation: Optional[ParamsApproximation] = None,
+    max_bins: Optional[int] = None,
+    **options: Any,
+) -> Dataset:
+    """Return the Dataset of the file, read at once or in chunks as configured."""
+    if params is not None and params.MODE == "stream":
+        if approximation is not None and approximation.ENABLED:
+            options.update(
+                error=approximation.ERROR,
+                exact_threshold=approximation.EXACT_THRESHOLD,
+                frequent_capacity=approximation.FREQUENT_CAPACITY,
+            )
+        return stream_dataset(
+            name,
+            loaded_file,
+            params.CHUNK_SIZE,
+            n_kept_rows,
+            file_format,
+            columns,
+            max_bins=max_bins,
+            **options,
+        )
+
+    engine = "c" if params is None else params.ENGINE
+    df = read_table(loaded_file, file_format, columns, engine, **options)
+    if optimisation is None or not optimisation.ENABLED:
+        return Dataset(name, df)
+
+    df, memory_report = optimise_dataframe(df, optimisation.MAX_CATEGORY_RATIO)
+    return Dataset(name, df, memory_report)
+
+
+def get_dataset_key(
+    name: str,
+    loaded_file: BinaryIO,
+    params: Optional[ParamsIngestion] = None,
+    columns: Optional[List[str]] = None,
+    n_kept_rows: int = 50,
+    optimisation: Optional[ParamsOptimisation] = None,
+    approximation: Optional[ParamsApproximation] = None,
+    max_bins: Optional[int] = None,
+    **options: Any,
+) -> str:
+    """Return the digest identifying the Dataset read from the file with these arguments."""
+    arguments = (
+        params,
+        optimisation,
+        get_format(name),
+        columns,
+        n_kept_rows,
+        approximation,
+        max_bins,
+    )
+    return get_digest(loaded_file.getvalue(), arguments=arguments, **options)
+
+
+def load_dataset(
+    name: str,
+    loaded_file: BinaryIO,
+    params: Optional[ParamsIngestion] = None,
+    cache: Optional[DataFrameCache] = None,
+    columns: Optional[List[str]] = None,
+    n_kept_rows: int = 50,
+    optimisation: Optional[ParamsOptimisation] = None,
+    approximation: Optional[ParamsApproximation] = None,
+    max_bins: Optional[int] = None,
+    **options: Any,
+) -> Dataset:
+    """
+    Return the Dataset of the uploaded file, reusing the cached one if available.
+
+    The format of the file is taken from the extension of its name and only the
+    given columns (all of them if not given) are read. Files read at once have
+    their data types compacted when the optimisation is enabled, while files read
+    in chunks estimate their distinct rows when the approximation is enabled, and
+    count the histograms of their numeric columns in max_bins bins if given.
+    """
+    file_format = get_format(name)
+    arguments = (
+        params,
+        optimisation,
+        file_format,
+        columns,
+        n_kept_rows,
+        approximation,
+        max_bins,
+    )
+    if cache is None:
+        return _read_dataset(name, loaded_file, *arguments, **options)
+
+    key = get_dataset_key(
+        name,
+        loaded_file,
+        params,
+        columns,
+        n_kept_rows,
+        optimisation,
+        approximation,
+        max_bins,
+        **options,
+    )
+    if params is not None and params.MODE == "stream":
+        # The dates in the future of the chunks are counted from the day they are read
+        key = get_digest(key.encode(), future=get_future_cutoff())
+    dataset = cache.get(key)
+    if dataset is None:
+        dataset = _read_dataset(name, loaded_file, *arguments, **options)
+        cache.put(key, dataset, size=dataset.get_memory_usage())
+
+    return dataset
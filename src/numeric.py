@@ -1,11 +1,159 @@
-from dataclasses import dataclass
-from typing import Union
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
-from plotly.graph_objs._figure import Figure
 
 from src.settings import FormatHistogram
+from src.sketches import count_distinct, interpolate_quantiles
+
+if TYPE_CHECKING:
+    from plotly.graph_objs._figure import Figure
+
+
+def format_histogram(fig: "Figure", col_name: str, params: FormatHistogram) -> "Figure":
+    """Return the histogram with the layout given in the parameters."""
+    fig.update_layout(
+        title=params.TITLE,
+        xaxis=dict(
+            title=f"{col_name} (binned)",
+            titlefont_size=params.AXIS_FONT_SIZE,
+            tickfont_size=params.TICK_FONT_SIZE,
+        ),
+        yaxis=dict(
+            title=params.Y_AXIS_LABEL,
+            titlefont_size=params.AXIS_FONT_SIZE,
+            tickfont_size=params.TICK_FONT_SIZE,
+        ),
+        template=params.TEMPLATE,
+    )
+    return fig
+
+
+def bin_values(
+    values: np.ndarray, max_bins: int, weights: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the edges and counts of at most max_bins equal-width bins over the finite values."""
+    finite = np.isfinite(values)
+    if weights is not None:
+        weights = weights[finite]
+    counts, edges = np.histogram(values[finite], bins=max_bins, weights=weights)
+    return edges, counts.astype(np.int64)
+
+
+def plot_histogram(edges: np.ndarray, counts: np.ndarray) -> "Figure":
+    """Return the bar figure of pre-binned counts, one bar spanning each bin."""
+    # Imported on use, so the columns can be profiled without loading plotly
+    import plotly.graph_objects as go
+
+    fig = go.Figure(
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            customdata=np.stack([edges[:-1], edges[1:]], axis=-1),
+            hovertemplate="[%{customdata[0]:.4g}, %{customdata[1]:.4g}): %{y}<extra></extra>",
+        )
+    )
+    fig.update_layout(bargap=0)
+    return fig
+
+
+# Percentiles of the percentile table, besides the median
+PERCENTILES = (1, 5, 25, 75, 95, 99)
+
+
+def _get_values(serie: pd.Series) -> np.ndarray:
+    """
+    Return the NumPy array with the non-missing values of the serie.
+
+    Floats are widened to float64, so the metrics of a column downcast to float32
+    are computed as precisely as the ones of its original values.
+    """
+    if isinstance(serie.dtype, np.dtype):
+        values = serie.to_numpy()
+        if values.dtype.kind != "f":
+            return values
+        return values[~np.isnan(values)].astype(np.float64, copy=False)
+
+    # Nullable extension types (Int64, Float64, ...)
+    dtype = serie.dtype.numpy_dtype
+    return serie.dropna().to_numpy(dtype=np.float64 if dtype.kind == "f" else dtype)
+
+
+@dataclass(frozen=True)
+class NumericProfile:
+    """
+    Class for storing the scalar metrics of a numeric column.
+
+    Attributes
+    ----------
+    n_unique: int
+        Number of unique non-missing values.
+
+    n_missing: int
+        Number of missing values.
+
+    n_zeros: int
+        Number of values equal to 0.
+
+    n_negatives: int
+        Number of negative values.
+
+    mean, std, min, max, median: Union[int, float]
+        Statistics of the non-missing values, NaN if there are none.
+
+    percentiles: Tuple[float, ...], default = ()
+        Values at each of the `PERCENTILES`, NaN if there are no values.
+
+    quantiles_estimated: bool, default = False
+        Whether the median and the percentiles are estimated.
+    """
+
+    n_unique: int
+    n_missing: int
+    n_zeros: int
+    n_negatives: int
+    mean: float
+    std: float
+    min: Union[int, float]
+    max: Union[int, float]
+    median: Union[int, float]
+    percentiles: Tuple[float, ...] = ()
+    quantiles_estimated: bool = False
+
+    @classmethod
+    def from_values(
+        cls, values: np.ndarray, n_missing: int, n_unique: Optional[int] = None
+    ) -> "NumericProfile":
+        """Return the profile of the non-missing values, counting their unique values unless given."""
+        n_values = len(values)
+        if n_values == 0:
+            percentiles = (np.nan,) * len(PERCENTILES)
+            return cls(
+                0, n_missing, 0, 0, np.nan, np.nan, np.nan, np.nan, np.nan, percentiles
+            )
+
+        # Only the ranks either side of each quantile are put in their sorted place
+        quantiles = np.array([0.5, *np.divide(PERCENTILES, 100)])
+        positions = quantiles * (n_values - 1)
+        ranks = np.union1d(np.floor(positions), np.ceil(positions)).astype(np.intp)
+        quantiles = interpolate_quantiles(np.partition(values, ranks), quantiles)
+        mean = values.sum(dtype=np.float64) / n_values
+        if n_unique is None:
+            n_unique = len(pd.unique(values))
+        return cls(
+            n_unique=n_unique,
+            n_missing=n_missing,
+            n_zeros=int(np.count_nonzero(values == 0)),
+            n_negatives=int(np.count_nonzero(values < 0)),
+            mean=float(mean),
+            std=float(np.std(values, ddof=1)) if n_values > 1 else np.nan,
+            min=values.min(),
+            max=values.max(),
+            median=float(quantiles[0]),
+            percentiles=tuple(quantiles[1:].tolist()),
+        )
 
 
 @dataclass
@@ -24,82 +172,115 @@ class NumericColumn:
 
     col_name: str
     serie: pd.Series
+    _value_counts: Dict[bool, pd.Series] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _profile: Optional[NumericProfile] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_name(self) -> str:
         """Return name of selected column."""
         return self.col_name
 
+    def profile(self) -> NumericProfile:
+        """Return the scalar metrics of selected column, computed once."""
+        if self._profile is None:
+            values = _get_values(self.serie)
+            # The value counts, once built, already hold the number of unique values
+            counts = self._value_counts.get(True)
+            self._profile = NumericProfile.from_values(
+                values,
+                len(self.serie) - len(values),
+                None if counts is None else len(counts),
+            )
+        return self._profile
+
     def get_unique(self, dropna: bool = True) -> int:
         """Return number of unique values for selected column."""
-        return self.serie.nunique(dropna=dropna)
+        profile = self.profile()
+        return profile.n_unique + int(not dropna and profile.n_missing > 0)
+
+    def get_unique_estimate(
+        self, dropna: bool = True, error: float = 0.01, threshold: int = 100_000
+    ) -> Tuple[int, bool]:
+        """Return number of unique values for selected column and whether it is estimated."""
+        # Exact when the profile is already there or the column is short
+        if self._profile is not None or len(self.serie) <= threshold:
+            return self.get_unique(dropna), False
+
+        return count_distinct(self.serie, dropna, error, threshold)
 
     def get_missing(self) -> int:
         """Return number of missing values for selected column."""
-        return int(self.serie.isna().sum())
+        return self.profile().n_missing
 
     def get_zeros(self) -> int:
         """Return number of occurrence of 0 value for selected column."""
-        return int((self.serie == 0).sum())
+        return self.profile().n_zeros
 
     def get_negatives(self) -> int:
         """Return number of negative values for selected column."""
-        return int((self.serie < 0).sum())
+        return self.profile().n_negatives
 
     def get_mean(self) -> float:
         """Return the average value for selected column."""
-        return self.serie.mean()
+        return self.profile().mean
 
     def get_std(self) -> float:
         """Return the standard deviation value for selected column."""
-        return self.serie.std()
+        return self.profile().std
 
     def get_min(self) -> Union[int, float]:
         """Return the minimum value for selected column."""
-        return self.serie.min()
+        return self.profile().min
 
     def get_max(self) -> Union[int, float]:
         """Return the maximum value for selected column."""
-        return self.serie.max()
+        return self.profile().max
 
     def get_median(self) -> Union[int, float]:
         """Return the median value for selected column."""
-        return self.serie.median()
+        return self.profile().median
+
+    def get_percentiles(self, percentiles: Sequence[float] = PERCENTILES) -> pd.Series:
+        """Return the value at each of the given percentiles for selected column."""
+        if tuple(percentiles) == PERCENTILES:
+            values = self.profile().percentiles
+        elif len(self.serie) - self.get_missing() == 0:
+            values = np.full(len(percentiles), np.nan)
+        else:
+            values = interpolate_quantiles(
+                np.sort(_get_values(self.serie)), np.divide(percentiles, 100)
+            )
+        return pd.Series(
+            values,
+            index=[f"p{percentile:g}" for percentile in percentiles],
+            name="value",
+        )
+
+    def _get_counts(self, dropna: bool = True) -> pd.Series:
+        """Return the value count table of selected column, computed once per dropna setting."""
+        if dropna not in self._value_counts:
+            self._value_counts[dropna] = self.serie.value_counts(dropna=dropna)
+        return self._value_counts[dropna]
 
     def _get_occurrences(self, dropna: bool = True) -> pd.Series:
         """Return the occurrences per value for selected column."""
-        return self.serie.value_counts(dropna=dropna).rename("occurrence")
+        return self._get_counts(dropna).rename("occurrence")
 
     def _get_percentages(self, dropna: bool = True) -> pd.Series:
         """Return the normalised occurrences per value for selected column."""
-        return (
-            self.serie.value_counts(normalize=True, dropna=dropna)
-            .round(decimals=4)
-            .rename("percentage")
-        )
+        counts = self._get_counts(dropna)
+        return (counts / counts.sum()).round(decimals=4).rename("percentage")
 
     def get_histogram(
         self,
         params: FormatHistogram,
-    ) -> Figure:
+    ) -> "Figure":
         """Return the generated histogram for selected column."""
-        fig = px.histogram(
-            pd.DataFrame(self.serie), x=self.col_name, nbins=params.MAX_BINS
-        )
-        fig.update_layout(
-            title=params.TITLE,
-            xaxis=dict(
-                title=f"{self.col_name} (binned)",
-                titlefont_size=params.AXIS_FONT_SIZE,
-                tickfont_size=params.TICK_FONT_SIZE,
-            ),
-            yaxis=dict(
-                title=params.Y_AXIS_LABEL,
-                titlefont_size=params.AXIS_FONT_SIZE,
-                tickfont_size=params.TICK_FONT_SIZE,
-            ),
-            template=params.TEMPLATE,
-        )
-        return fig
+        edges, counts = bin_values(_get_values(self.serie), params.MAX_BINS)
+        return format_histogram(plot_histogram(edges, counts), self.col_name, params)
 
     def get_frequent(self, n_head: int = 20, dropna: bool = True) -> pd.DataFrame:
         """Return the Pandas dataframe containing the occurrences and percentage of the top n_head most frequent values."""
@@ -116,3 +297,10 @@ class NumericColumn:
             .head(n_head)
             .reset_index()
         )
+
+    def get_frequent_estimate(
+        self, n_head: int = 20, dropna: bool = True, capacity: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, int]:
+        """Return the frequency table of the top n_head values and the maximum error of its occurrences."""
+        # The whole column is in memory, so its value counts cost no more than a sketch
+        return self.get_frequent(n_head, dropna), 0
@@ -0,0 +1,59 @@
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _downcast(serie: pd.Series, max_category_ratio: float) -> pd.Series:
+    """Return the serie with the smallest data type that keeps all of its values."""
+    dtype = serie.dtype
+    if not isinstance(dtype, np.dtype):
+        return serie
+
+    if dtype.kind == "i":
+        return pd.to_numeric(serie, downcast="integer")
+
+    if dtype == np.float64:
+        candidate = serie.astype(np.float32)
+        if np.array_equal(
+            candidate.to_numpy(np.float64), serie.to_numpy(), equal_nan=True
+        ):
+            return candidate
+        return serie
+
+    if dtype == object:
+        try:
+            n_unique = serie.nunique()
+        except TypeError:
+            return serie
+        n_values = serie.count()
+        if n_values and n_unique / n_values <= max_category_ratio:
+            return serie.astype("category")
+
+    return serie
+
+
+def optimise_dataframe(
+    df: pd.DataFrame, max_category_ratio: float = 0.5
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Return the DataFrame with compacted data types and the memory report per column.
+
+    Integer columns are downcast to the smallest signed width, float columns to
+    float32 when no value changes, and text columns whose ratio of unique to
+    non-missing values is at most max_category_ratio are turned into categories.
+    """
+    optimised = pd.DataFrame(
+        {col: _downcast(df[col], max_category_ratio) for col in df.columns},
+        index=df.index,
+    )
+    report = pd.DataFrame(
+        {
+            "type_before": df.dtypes.astype(str),
+            "type_after": optimised.dtypes.astype(str),
+            "memory_before": df.memory_usage(deep=True, index=False),
+            "memory_after": optimised.memory_usage(deep=True, index=False),
+        },
+        index=df.columns,
+    )
+    return optimised, report
@@ -0,0 +1,281 @@
+import threading
+from concurrent.futures import Executor, Future, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.cache import DataFrameCache
+from src.data import Dataset
+from src.profiling import ColumnReport, iter_reports, load_column_names
+from src.settings import ParamsApproximation, ParamsSections
+from src.store import ProfileStore
+
+
+class Precomputation:
+    """
+    Class for profiling the columns of a dataset in a background thread.
+
+    Columns are scheduled by kind, and profiled on the executor in batches of
+    batch_size, in the order they were scheduled unless prioritised. Their reports
+    are cached as with `iter_reports` and kept as futures until profiled, so a
+    section waits for a column being profiled rather than profiling it again.
+    Datetime columns that are text columns of the dataset are converted before
+    being profiled, so the columns selected for conversion can be scheduled at any
+    time. The dataset is read again for each batch, through the shared cache, and
+    the thread stops once every scheduled column is profiled, so an abandoned
+    Precomputation holds neither the dataset nor a thread.
+
+    Attributes
+    ----------
+    dataset : Callable[[], Dataset]
+        Function returning the Dataset as read, called in the background thread for each batch.
+
+    params : Dict[str, ParamsSections]
+        Parameters of the section of each kind of column.
+
+    key : str
+        Digest identifying the dataset in the caches.
+
+    executor : Executor, default = None
+        Pool profiling the columns of a batch concurrently, None to profile them one by one.
+
+    partition_rows : int, default = None
+        Number of rows above which a column is profiled by partitions of that size.
+
+    store : ProfileStore, default = None
+        On-disk store of the column reports, reused across sessions.
+
+    cache : DataFrameCache, default = None
+        In-memory cache of the column reports, shared by the sessions of the process.
+
+    approximation : ParamsApproximation, default = None
+        Object with the parameters to estimate the unique values, counted exactly if not given.
+
+    batch_size : int, default = 8
+        Maximum number of columns profiled at once.
+    """
+
+    def __init__(
+        self,
+        dataset: Callable[[], Dataset],
+        params: Dict[str, ParamsSections],
+        key: str,
+        executor: Optional[Executor] = None,
+        partition_rows: Optional[int] = None,
+        store: Optional[ProfileStore] = None,
+        cache: Optional[DataFrameCache] = None,
+        approximation: Optional[ParamsApproximation] = None,
+        batch_size: int = 8,
+    ):
+        self._dataset = dataset
+        self._params = params
+        self._key = key
+        self._executor = executor
+        self._partition_rows = partition_rows
+        self._store = store
+        self._cache = cache
+        self._approximation = approximation
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        # Columns to profile by kind, None standing for every column of the kind
+        self._pending: List[Tuple[str, Optional[str]]] = []
+        # Futures of the columns not profiled yet, the reports being in the caches after
+        self._futures: Dict[Tuple[str, str], Future] = {}
+        self._generation = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def key(self) -> str:
+        """Return the digest identifying the dataset in the caches."""
+        return self._key
+
+    @property
+    def n_pending(self) -> int:
+        """Return the number of scheduled columns not profiled yet."""
+        with self._lock:
+            return sum(not future.done() for future in self._futures.values())
+
+    @property
+    def running(self) -> bool:
+        """Return whether the background thread is profiling columns."""
+        with self._lock:
+            return self._thread is not None
+
+    def schedule(
+        self, kind: str, columns: Optional[List[str]] = None, priority: bool = False
+    ) -> Dict[str, Future]:
+        """Add the given columns of the kind to profile, every one if None, and return their futures."""
+        with self._lock:
+            if columns is None:
+                self._pending.append((kind, None))
+                self._start()
+                return {}
+
+            futures = {}
+            tasks = []
+            for col in columns:
+                future = self._futures.get((kind, col))
+                if future is None or future.cancelled():
+                    future = self._futures[(kind, col)] = Future()
+                    tasks.append((kind, col))
+                elif priority and (kind, col) in self._pending:
+                    self._pending.remove((kind, col))
+                    tasks.append((kind, col))
+                futures[col] = future
+            if priority:
+                self._pending = tasks + self._pending
+            else:
+                self._pending.extend(tasks)
+            self._start()
+        return futures
+
+    def iter_reports(
+        self, kind: str, columns: List[str], cached_only: bool = False
+    ) -> Iterator[Tuple[int, ColumnReport]]:
+        """
+        Yield the position and report of each given column as soon as it is available.
+
+        The columns are moved to the front of the columns to profile, unless
+        cached_only, in which case only the reports already computed are yielded.
+        """
+        if cached_only:
+            yield from iter_reports(
+                self._dataset,
+                kind,
+                self._params[kind],
+                columns,
+                key=self._key,
+                cache=self._cache,
+                store=self._store,
+                approximation=self._approximation,
+                cached_only=True,
+            )
+            return None
+
+        futures = self.schedule(kind, columns, priority=True)
+        positions = {futures[col]: n for n, col in enumerate(columns)}
+        for future in as_completed(positions):
+            if not future.cancelled():
+                yield positions[future], future.result()
+
+    def cancel(self) -> None:
+        """Drop the columns not profiled yet, stopping the batch being profiled."""
+        with self._lock:
+            for kind, col in self._pending:
+                if col is not None:
+                    _cancel(self._futures.pop((kind, col)))
+            self._pending.clear()
+            self._generation += 1
+
+    def close(self) -> None:
+        """Drop the columns not profiled yet and stop the background thread."""
+        self.cancel()
+        with self._lock:
+            self._closed = True
+
+    def _start(self) -> None:
+        """Start the background thread if it stopped, the lock being held."""
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """Profile the scheduled columns batch by batch, until none is left or closed."""
+        while True:
+            with self._lock:
+                if not self._pending or self._closed:
+                    self._thread = None
+                    return None
+
+                kind, col = self._pending.pop(0)
+                batch = [col]
+                while (
+                    col is not None
+                    and len(batch) < self._batch_size
+                    and self._pending
+                    and self._pending[0][0] == kind
+                    and self._pending[0][1] is not None
+                ):
+                    batch.append(self._pending.pop(0)[1])
+                futures = [self._futures.get((kind, col)) for col in batch]
+                generation = self._generation
+
+            try:
+                if col is None:
+                    # Listed from the caches if possible, without loading the dataset
+                    columns = load_column_names(
+                        self._dataset,
+                        kind,
+                        store=self._store,
+                        key=self._key,
+                        cache=self._cache,
+                    )
+                    self.schedule(kind, columns)
+                else:
+                    self._profile(kind, batch, futures, generation)
+            except Exception as error:
+                _set_exception([future for future in futures if future], error)
+            finally:
+                # The waiting sections hold the futures, and the caches the reports
+                with self._lock:
+                    for col, future in zip(batch, futures):
+                        if (
+                            future is not None
+                            and self._futures.get((kind, col)) is future
+                        ):
+                            del self._futures[(kind, col)]
+
+    def _profile(
+        self, kind: str, columns: List[str], futures: List[Future], generation: int
+    ) -> None:
+        """Profile a batch of columns of the same kind and set the result of their futures."""
+
+        def get_dataset() -> Dataset:
+            dataset = self._dataset()
+            if kind != "date":
+                return dataset
+
+            text_columns = dataset.get_text_columns()
+            return dataset.with_datetime(
+                [col for col in columns if col in text_columns]
+            )
+
+        reports = iter_reports(
+            get_dataset,
+            kind,
+            self._params[kind],
+            columns,
+            self._executor,
+            self._partition_rows,
+            self._store,
+            self._key,
+            self._cache,
+            self._approximation,
+        )
+        try:
+            for n, report in reports:
+                futures[n].set_running_or_notify_cancel()
+                futures[n].set_result(report)
+                # Cancelled meanwhile, the columns left are not profiled
+                if self._generation != generation:
+                    break
+        except Exception as error:
+            _set_exception(futures, error)
+        finally:
+            reports.close()
+            for future in futures:
+                if not future.done():
+                    _cancel(future)
+
+
+def _cancel(future: Future) -> None:
+    """Cancel a pending future and wake up the threads waiting for it."""
+    future.cancel()
+    future.set_running_or_notify_cancel()
+
+
+def _set_exception(futures: List[Future], error: Exception) -> None:
+    """Set the exception of the futures not done yet."""
+    for future in futures:
+        if not future.done():
+            future.set_running_or_notify_cancel()
+            future.set_exception(error)
@@ -0,0 +1,713 @@
+import functools
+import pickle
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from src.cache import DataFrameCache, get_digest
+from src.data import Dataset
+from src.datetime import DateColumn, get_future_cutoff
+from src.numeric import NumericColumn, _get_values
+from src.settings import ParamsApproximation, ParamsSections
+from src.sketches import QUANTILE_RANK_ERROR
+from src.store import ProfileStore
+from src.streaming import StreamedDateColumn, StreamedNumericColumn, StreamedTextColumn
+from src.text import TextColumn
+
+if TYPE_CHECKING:
+    from plotly.graph_objs._figure import Figure
+
+Column = Union[NumericColumn, TextColumn, DateColumn]
+
+
+@dataclass
+class ColumnReport:
+    """
+    Class for storing the rendered content of a column.
+
+    Attributes
+    ----------
+    col_name : str
+        Name of the column.
+
+    metrics : pd.Series
+        Metrics of the column, indexed by their label.
+
+    chart : Figure
+        Histogram or bar chart of the column, None if the section has no plot parameters.
+
+    frequent : pd.DataFrame
+        Occurrences and percentages of the most frequent values.
+
+    percentiles : pd.Series, default = None
+        Values at the percentiles of a numeric column, indexed by their label.
+    """
+
+    col_name: str
+    metrics: pd.Series
+    chart: Optional["Figure"]
+    frequent: pd.DataFrame
+    percentiles: Optional[pd.Series] = None
+
+
+@dataclass
+class OverallReport:
+    """
+    Class for storing the rendered content of the overall section.
+
+    Attributes
+    ----------
+    name : str
+        Name of the file.
+
+    n_rows, n_cols, n_duplicates, n_missing : int
+        Number of rows, of columns, of duplicated rows and of rows with missing values.
+
+    cols_dtype : Dict[str, str]
+        Data type of every column, in column order.
+
+    text_columns : List[str]
+        Names of the text columns.
+
+    memory_report : pd.DataFrame
+        Data types and memory usage of each column before and after compaction.
+
+    head, tail, sample : pd.DataFrame
+        First, last and randomly sampled rows kept for display.
+
+    n_duplicates_estimated : bool, default = False
+        Whether the number of duplicated rows is estimated.
+    """
+
+    name: str
+    n_rows: int
+    n_cols: int
+    n_duplicates: int
+    n_missing: int
+    cols_dtype: Dict[str, str]
+    text_columns: List[str]
+    memory_report: Optional[pd.DataFrame]
+    head: pd.DataFrame
+    tail: pd.DataFrame
+    sample: pd.DataFrame
+    n_duplicates_estimated: bool = False
+
+    @classmethod
+    def from_dataset(
+        cls,
+        dataset: Dataset,
+        n_kept_rows: int,
+        approximation: Optional[ParamsApproximation] = None,
+    ) -> "OverallReport":
+        """Return the report of the Dataset, keeping n_kept_rows rows of each table."""
+        n_duplicates, estimated = dataset.get_n_duplicates(), False
+        if approximation is not None and approximation.ENABLED:
+            n_duplicates, estimated = dataset.get_n_duplicates_estimate(
+                approximation.ERROR, approximation.EXACT_THRESHOLD
+            )
+        return cls(
+            name=dataset.get_name(),
+            n_rows=dataset.get_n_rows(),
+            n_cols=dataset.get_n_cols(),
+            n_duplicates=n_duplicates,
+            n_missing=dataset.get_n_missing(),
+            cols_dtype=dataset.get_cols_dtype(),
+            text_columns=dataset.get_text_columns(),
+            memory_report=dataset.memory_report,
+            head=dataset.get_head(n_kept_rows),
+            tail=dataset.get_tail(n_kept_rows),
+            sample=dataset.get_sample(n_kept_rows),
+            n_duplicates_estimated=estimated,
+        )
+
+
+def label_estimate(label: str, error: float) -> str:
+    """Return the label of a metric marked as an estimate with the given error."""
+    return f"{label} (estimate, ±{error:.0%} error)"
+
+
+def label_rank_estimate(label: str, error: float) -> str:
+    """Return the label of a quantile marked as an estimate with the given rank error."""
+    return f"{label} (estimate, rank ±{error:.2%})"
+
+
+def _get_unique_metric(
+    column: Column,
+    params: ParamsSections,
+    approximation: Optional[ParamsApproximation] = None,
+) -> Dict[str, int]:
+    """Return the number of unique values, labelled as an estimate when it is one."""
+    label = "Number of Unique Values"
+    if approximation is None or not approximation.ENABLED:
+        return {label: column.get_unique(params.DROP_NA)}
+
+    n_unique, estimated = column.get_unique_estimate(
+        params.DROP_NA, approximation.ERROR, approximation.EXACT_THRESHOLD
+    )
+    if estimated:
+        label = label_estimate(label, approximation.ERROR)
+    return {label: n_unique}
+
+
+def _get_frequent_table(
+    column: Column,
+    params: ParamsSections,
+    approximation: Optional[ParamsApproximation] = None,
+) -> pd.DataFrame:
+    """Return the frequency table, labelled with the maximum error of its occurrences if any."""
+    capacity = None
+    if approximation is not None and approximation.ENABLED:
+        capacity = approximation.FREQUENT_CAPACITY
+
+    frequent, error = column.get_frequent_estimate(
+        params.TOP_FREQUENCY, params.DROP_NA, capacity
+    )
+    if error > 0:
+        frequent = frequent.rename(
+            columns={
+                "occurrence": f"occurrence (at least, up to {error:,} more)",
+                "percentage": "percentage (at least)",
+            }
+        )
+    return frequent
+
+
+def _report_numeric(
+    column: NumericColumn,
+    params: ParamsSections,
+    approximation: Optional[ParamsApproximation] = None,
+) -> ColumnReport:
+    """Return the report of a numeric column."""
+    # The value counts of the frequency table hold the number of unique values
+    frequent = _get_frequent_table(column, params, approximation)
+    median_label = "Median Value"
+    percentiles = column.get_percentiles()
+    if column.profile().quantiles_estimated:
+        # The error bounds the rank of the quantile, not its value
+        median_label = label_rank_estimate(median_label, QUANTILE_RANK_ERROR)
+        percentiles = percentiles.rename(
+            label_rank_estimate("value", QUANTILE_RANK_ERROR)
+        )
+    metrics = {
+        **_get_unique_metric(column, params, approximation),
+        "Number of Rows with Missing Values": column.get_missing(),
+        "Number of Rows with 0": column.get_zeros(),
+        "Number of Rows with Negative Values": column.get_negatives(),
+        "Average Value": column.get_mean(),
+        "Standard Deviation Value": column.get_std(),
+        "Minimum Value": column.get_min(),
+        "Maximum Value": column.get_max(),
+        median_label: column.get_median(),
+    }
+    chart = None
+    if params.PLOT is not None:
+        chart = column.get_histogram(params.PLOT)
+    return ColumnReport(
+        column.get_name(),
+        pd.Series(metrics, name="value"),
+        chart,
+        frequent,
+        percentiles,
+    )
+
+
+def _report_text(
+    column: TextColumn,
+    params: ParamsSections,
+    approximation: Optional[ParamsApproximation] = None,
+) -> ColumnReport:
+    """Return the report of a text column."""
+    # The value counts of the mode and chart make the number of unique values exact
+    mode = column.get_mode(params.DROP_NA)
+    chart = None
+    if params.PLOT is not None:
+        chart = column.get_barchart(params.PLOT, params.DROP_NA)
+    frequent = _get_frequent_table(column, params, approximation)
+    metrics = {
+        **_get_unique_metric(column, params, approximation),
+        "Number of Rows with Missing Values": column.get_missing(),
+        "Number of Empty Rows": column.get_empty(),
+        "Number of Rows with Only Whitespace": column.get_whitespace(),
+        "Number of Rows with Only Lowercases": column.get_lowercase(),
+        "Number of Rows with Only Uppercases": column.get_uppercase(),
+        "Number of Rows with Only Alphabet": column.get_alphabet(),
+        "Number of Rows with only Digits": column.get_digit(),
+        "Mode Value": mode,
+    }
+    return ColumnReport(
+        column.get_name(), pd.Series(metrics, name="value"), chart, frequent
+    )
+
+
+def _report_date(
+    column: DateColumn,
+    params: ParamsSections,
+    approximation: Optional[ParamsApproximation] = None,
+) -> ColumnReport:
+    """Return the report of a datetime column."""
+    # The value counts of the chart make the number of unique values exact
+    chart = None
+    if params.PLOT is not None:
+        chart = column.get_barchart(params.PLOT, params.DROP_NA)
+    frequent = _get_frequent_table(column, params, approximation)
+    metrics = {
+        **_get_unique_metric(column, params, approximation),
+        "Number of Rows with Missing Values": column.get_missing(),
+        "Number of Weekend Dates": column.get_weekend(),
+        "Number of Weekday Dates": column.get_weekday(),
+        "Number of Dates in Future": column.get_future(),
+        "Number of Rows with 1900-01-01": column.get_empty_1900(),
+        "Number of Rows with 1970-01-01": column.get_empty_1970(),
+        "Minimum Value": column.get_min(),
+        "Maximum Value": column.get_max(),
+    }
+    return ColumnReport(
+        column.get_name(), pd.Series(metrics, name="value"), chart, frequent
+    )
+
+
+KINDS: Dict[str, Tuple[type, Callable[..., ColumnReport]]] = {
+    "numeric": (NumericColumn, _report_numeric),
+    "text": (TextColumn, _report_text),
+    "date": (DateColumn, _report_date),
+}
+
+# Streamed columns hold the partial state of a column over some of its rows
+PARTIALS = {
+    "numeric": StreamedNumericColumn,
+    "text": StreamedTextColumn,
+    "date": StreamedDateColumn,
+}
+
+
+@dataclass(frozen=True)
+class _SharedSerie:
+    """Handle of a serie whose values were copied to a shared memory block."""
+
+    shm_name: str
+    dtype: str
+    length: int
+    name: str
+
+
+def _share(serie: pd.Series) -> Tuple[_SharedSerie, shared_memory.SharedMemory]:
+    """Copy the values of a serie with a NumPy data type to a new shared memory block."""
+    values = serie.to_numpy()
+    shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    np.ndarray(values.shape, values.dtype, buffer=shm.buf)[:] = values
+    return _SharedSerie(shm.name, values.dtype.str, len(values), serie.name), shm
+
+
+def _report_column(
+    kind: str,
+    column: Union[Column, _SharedSerie],
+    params: ParamsSections,
+    approximation: Optional[ParamsApproximation] = None,
+) -> ColumnReport:
+    """Return the report of a column, attaching to its shared memory block if given one."""
+    column_class, report = KINDS[kind]
+    if not isinstance(column, _SharedSerie):
+        return report(column, params, approximation)
+
+    shm = shared_memory.SharedMemory(name=column.shm_name)
+    try:
+        values = np.ndarray((column.length,), np.dtype(column.dtype), buffer=shm.buf)
+        result = report(
+            column_class(column.name, pd.Series(values, name=column.name, copy=False)),
+            params,
+            approximation,
+        )
+        # The block can only be closed once no array points to it
+        del values
+        return result
+    finally:
+        shm.close()
+
+
+def _get_partial(
+    kind: str,
+    source: Union[pd.Series, _SharedSerie],
+    start: int,
+    stop: int,
+    **options: Any,
+) -> Column:
+    """Return the partial state of the rows start to stop of a column."""
+    if not isinstance(source, _SharedSerie):
+        serie = source.iloc[start:stop]
+        partial = PARTIALS[kind](serie.name, serie.dtype, **options)
+        partial.update(serie)
+        return partial
+
+    shm = shared_memory.SharedMemory(name=source.shm_name)
+    try:
+        values = np.ndarray((source.length,), np.dtype(source.dtype), buffer=shm.buf)
+        partial = PARTIALS[kind](source.name, values.dtype, **options)
+        partial.update(pd.Series(values[start:stop], name=source.name, copy=False))
+        # The block can only be closed once no array points to it
+        del values
+        return partial
+    finally:
+        shm.close()
+
+
+def partition_column(
+    column: Column,
+    partition_rows: int,
+    executor: Optional[Executor] = None,
+    max_bins: Optional[int] = None,
+) -> Column:
+    """
+    Return the column profiled by partitions of at most partition_rows rows.
+
+    The partial states of the partitions are computed on the executor and merged
+    into one streamed column, which has the getters of the original. Counts, the
+    unique values, min and max are exact, while the mean and standard deviation are
+    combined from the partial means and sums of squared deviations and may differ
+    from the single-pass values by a few ulps. The median and the frequency tables
+    come from mergeable sketches, exact up to their thresholds: above them the
+    frequency tables only hold the most frequent values, with lower bounds of their
+    occurrences. The histogram of a numeric column is counted exactly in max_bins
+    bins between its minimum and maximum, found beforehand.
+    """
+    kind = next(kind for kind, (cls, _) in KINDS.items() if isinstance(column, cls))
+    options = {}
+    if kind == "numeric" and max_bins is not None:
+        values = _get_values(column.serie)
+        values = values[np.isfinite(values)]
+        if len(values):
+            options = dict(bounds=(values.min(), values.max()), max_bins=max_bins)
+    n_rows = len(column.serie)
+    bounds = [
+        (start, min(start + partition_rows, n_rows))
+        for start in range(0, max(n_rows, 1), partition_rows)
+    ]
+
+    block = None
+    source = column.serie
+    if _is_shareable(column.serie, executor):
+        source, block = _share(column.serie)
+    try:
+        if executor is None:
+            partials = [
+                _get_partial(kind, source, *bound, **options) for bound in bounds
+            ]
+        else:
+            futures = [
+                executor.submit(_get_partial, kind, source, *bound, **options)
+                for bound in bounds
+            ]
+            partials = [future.result() for future in futures]
+    finally:
+        if block is not None:
+            block.close()
+            block.unlink()
+
+    merged = partials[0]
+    for partial in partials[1:]:
+        merged.merge(partial)
+    return merged
+
+
+def _is_shareable(serie: pd.Series, executor: Optional[Executor]) -> bool:
+    """Return whether the values of the serie are handed to the executor in shared memory."""
+    return (
+        isinstance(executor, ProcessPoolExecutor)
+        and isinstance(serie.dtype, np.dtype)
+        and serie.dtype != object
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_executor(kind: str, max_workers: Optional[int] = None) -> Optional[Executor]:
+    """Return the process-wide pool of the given kind, None to profile in the calling thread."""
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    return None
+
+
+def profile_columns(
+    dataset: Dataset,
+    kind: str,
+    params: ParamsSections,
+    executor: Optional[Executor] = None,
+    partition_rows: Optional[int] = None,
+    approximation: Optional[ParamsApproximation] = None,
+    columns: Optional[List[str]] = None,
+) -> List[ColumnReport]:
+    """
+    Return the reports of the given columns, every column of the kind if None, in order.
+
+    The columns are independent, so they are profiled concurrently on the executor.
+    With a process pool, the buffers of numeric and datetime columns are handed over
+    through shared memory rather than pickled; text columns and columns with
+    extension types are still pickled. Columns longer than partition_rows are
+    also split by rows and their partial states merged, see `partition_column`.
+    """
+    reports = dict(
+        _iter_profiles(
+            dataset, kind, params, executor, partition_rows, approximation, columns
+        )
+    )
+    return [reports[n] for n in range(len(reports))]
+
+
+def _iter_profiles(
+    dataset: Dataset,
+    kind: str,
+    params: ParamsSections,
+    executor: Optional[Executor] = None,
+    partition_rows: Optional[int] = None,
+    approximation: Optional[ParamsApproximation] = None,
+    columns: Optional[List[str]] = None,
+) -> Iterator[Tuple[int, ColumnReport]]:
+    """Yield the position and report of each column, in the order they complete."""
+    getter = getattr(dataset, f"get_{kind}_column")
+    if columns is None:
+        columns = getattr(dataset, f"get_{kind}_columns")()
+
+    def get_column(col: str) -> Column:
+        column = getter(col)
+        if (
+            partition_rows is not None
+            and type(column) is KINDS[kind][0]
+            and len(column.serie) > partition_rows
+        ):
+            return partition_column(
+                column, partition_rows, executor, getattr(params.PLOT, "MAX_BINS", None)
+            )
+        return column
+
+    if executor is None:
+        for n, col in enumerate(columns):
+            yield n, _report_column(kind, get_column(col), params, approximation)
+        return None
+
+    blocks = []
+    futures: Dict[Future, int] = {}
+    try:
+        for n, col in enumerate(columns):
+            column = get_column(col)
+            if type(column) is KINDS[kind][0] and _is_shareable(column.serie, executor):
+                column, shm = _share(column.serie)
+                blocks.append(shm)
+            future = executor.submit(
+                _report_column, kind, column, params, approximation
+            )
+            futures[future] = n
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # Stopped early, the profiles not started yet are dropped
+        for future in futures:
+            future.cancel()
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def get_report_inputs(kind: str) -> Dict[str, Any]:
+    """Return the inputs of the reports of the kind other than the dataset and parameters."""
+    # The dates in the future are counted from the day the report is computed
+    if kind == "date":
+        return {"future": get_future_cutoff()}
+    return {}
+
+
+def load_column_names(
+    dataset: Union[Dataset, Callable[[], Dataset]],
+    kind: str,
+    store: Optional[ProfileStore] = None,
+    key: Optional[str] = None,
+    cache: Optional[DataFrameCache] = None,
+) -> List[str]:
+    """Return the names of the columns of the given kind, from the caches if available."""
+    if key is not None:
+        key = get_digest(key.encode(), kind=kind, names=True)
+        names = _get_reports(cache, store, key)
+        if names is not None:
+            return names
+
+    if callable(dataset):
+        dataset = dataset()
+    names = getattr(dataset, f"get_{kind}_columns")()
+    if key is not None:
+        _put_reports(cache, key, names, store)
+    return names
+
+
+def load_reports(
+    dataset: Union[Dataset, Callable[[], Dataset]],
+    kind: str,
+    params: ParamsSections,
+    executor: Optional[Executor] = None,
+    partition_rows: Optional[int] = None,
+    store: Optional[ProfileStore] = None,
+    key: Optional[str] = None,
+    cache: Optional[DataFrameCache] = None,
+    approximation: Optional[ParamsApproximation] = None,
+    columns: Optional[List[str]] = None,
+) -> List[ColumnReport]:
+    """
+    Return the reports of the given columns, every column of the kind if None.
+
+    The dataset can be given as a function returning it, so that it is only loaded
+    when the reports have to be computed. The reports are looked up by the key of
+    the dataset together with the kind and the section parameters, first in the
+    in-memory cache and then in the on-disk store. The reports of given columns are
+    looked up one by one, so only the columns never reported before are profiled.
+    """
+    if columns is not None:
+        reports = dict(
+            iter_reports(
+                dataset,
+                kind,
+                params,
+                columns,
+                executor,
+                partition_rows,
+                store,
+                key,
+                cache,
+                approximation,
+            )
+        )
+        return [reports[n] for n in range(len(columns))]
+
+    if key is not None:
+        key = get_digest(
+            key.encode(),
+            kind=kind,
+            params=params,
+            approximation=approximation,
+            **get_report_inputs(kind),
+        )
+        reports = _get_reports(cache, store, key)
+        if reports is not None:
+            return reports
+
+    if callable(dataset):
+        dataset = dataset()
+    reports = profile_columns(
+        dataset, kind, params, executor, partition_rows, approximation
+    )
+    if key is not None:
+        _put_reports(cache, key, reports, store)
+    return reports
+
+
+def iter_reports(
+    dataset: Union[Dataset, Callable[[], Dataset]],
+    kind: str,
+    params: ParamsSections,
+    columns: List[str],
+    executor: Optional[Executor] = None,
+    partition_rows: Optional[int] = None,
+    store: Optional[ProfileStore] = None,
+    key: Optional[str] = None,
+    cache: Optional[DataFrameCache] = None,
+    approximation: Optional[ParamsApproximation] = None,
+    cached_only: bool = False,
+) -> Iterator[Tuple[int, ColumnReport]]:
+    """
+    Yield the position and report of each given column as soon as it is available.
+
+    The reports found in the caches come first, then the others as their profiles
+    complete on the executor, each one cached as it comes, unless cached_only.
+    Closing the iterator early cancels the profiles not started yet.
+    """
+    inputs = get_report_inputs(kind)
+    keys = [
+        None
+        if key is None
+        else get_digest(
+            key.encode(),
+            kind=kind,
+            params=params,
+            approximation=approximation,
+            column=col,
+            **inputs,
+        )
+        for col in columns
+    ]
+    missing = []
+    for n, col_key in enumerate(keys):
+        report = _get_reports(cache, store, col_key)
+        if report is None:
+            missing.append(n)
+        else:
+            yield n, report
+    if not missing or cached_only:
+        return None
+
+    if callable(dataset):
+        dataset = dataset()
+    profiles = _iter_profiles(
+        dataset,
+        kind,
+        params,
+        executor,
+        partition_rows,
+        approximation,
+        [columns[n] for n in missing],
+    )
+    try:
+        for m, report in profiles:
+            n = missing[m]
+            if keys[n] is not None:
+                _put_reports(cache, keys[n], report, store)
+            yield n, report
+    finally:
+        profiles.close()
+
+
+def _get_reports(
+    cache: Optional[DataFrameCache], store: Optional[ProfileStore], key: Optional[str]
+) -> Optional[object]:
+    """Return the reports kept under the key, from the cache or else the store, if any."""
+    if key is None:
+        return None
+
+    reports = None if cache is None else cache.get(key)
+    if reports is None and store is not None:
+        reports = store.get(key)
+        if reports is not None:
+            _put_reports(cache, key, reports)
+    return reports
+
+
+def _put_reports(
+    cache: Optional[DataFrameCache],
+    key: str,
+    reports: object,
+    store: Optional[ProfileStore] = None,
+) -> None:
+    """Store the reports in the cache, sized by their pickled length, and in the store."""
+    if cache is not None:
+        size = len(pickle.dumps(reports, protocol=pickle.HIGHEST_PROTOCOL))
+        cache.put(key, reports, size=size)
+    if store is not None:
+        store.put(key, reports)
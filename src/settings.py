@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Literal, Optional, Union
 
 from driconfig import DriConfig
 from pydantic import BaseModel
@@ -25,6 +25,8 @@ class FormatBarPlot(FormatPlot):
 
     CATEGORY_ORDER: str
     Y_AXIS_LABEL: str
+    MAX_BARS: int = 30
+    MAX_CARDINALITY: int = 1000
 
 
 class FormatHistogram(FormatPlot):
@@ -39,7 +41,96 @@ class ParamsSections(BaseModel):
 
     TOP_FREQUENCY: int
     DROP_NA: bool
-    PLOT: Union[FormatBarPlot, FormatHistogram]
+    PLOT: Optional[Union[FormatBarPlot, FormatHistogram]] = None
+
+    class Config:
+        """Configuring BaseModel"""
+
+        allow_mutation = False
+
+
+class ParamsCache(BaseModel):
+    """Model for the `CACHE` configuration."""
+
+    MAX_MEMORY_MB: int
+
+    class Config:
+        """Configuring BaseModel"""
+
+        allow_mutation = False
+
+
+class ParamsIngestion(BaseModel):
+    """Model for the `INGESTION` configuration."""
+
+    MODE: Literal["memory", "stream"]
+    CHUNK_SIZE: int
+    ENGINE: Literal["c", "pyarrow"] = "c"
+
+    class Config:
+        """Configuring BaseModel"""
+
+        allow_mutation = False
+
+
+class ParamsOptimisation(BaseModel):
+    """Model for the `OPTIMISATION` configuration."""
+
+    ENABLED: bool
+    MAX_CATEGORY_RATIO: float
+
+    class Config:
+        """Configuring BaseModel"""
+
+        allow_mutation = False
+
+
+class ParamsProfiling(BaseModel):
+    """Model for the `PROFILING` configuration."""
+
+    EXECUTOR: Literal["serial", "thread", "process"]
+    MAX_WORKERS: Optional[int] = None
+    PARTITION_ROWS: Optional[int] = None
+    PRECOMPUTE: bool = False
+
+    class Config:
+        """Configuring BaseModel"""
+
+        allow_mutation = False
+
+
+class ParamsStore(BaseModel):
+    """Model for the `STORE` configuration."""
+
+    ENABLED: bool
+    FOLDER: str
+    MAX_SIZE_MB: int
+
+    class Config:
+        """Configuring BaseModel"""
+
+        allow_mutation = False
+
+
+class ParamsApproximation(BaseModel):
+    """Model for the `APPROXIMATION` configuration."""
+
+    ENABLED: bool
+    ERROR: float
+    EXACT_THRESHOLD: int
+    FREQUENT_CAPACITY: int
+
+    class Config:
+        """Configuring BaseModel"""
+
+        allow_mutation = False
+
+
+class ParamsLayout(BaseModel):
+    """Model for the `LAYOUT` configuration."""
+
+    COLUMNS_PER_PAGE: int
+    EXPANDED: bool = False
 
     class Config:
         """Configuring BaseModel"""
@@ -62,3 +153,10 @@ class AppConfig(DriConfig):
     TEXT_COLS: ParamsSections
     DATE_COLS: ParamsSections
     NUMERIC_COLS: ParamsSections
+    CACHE: ParamsCache
+    INGESTION: ParamsIngestion
+    OPTIMISATION: ParamsOptimisation
+    PROFILING: ParamsProfiling
+    STORE: ParamsStore
+    APPROXIMATION: ParamsApproximation
+    LAYOUT: ParamsLayout
@@ -0,0 +1,390 @@
+from typing import Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Number of rows hashed at once, which bounds the memory of the hashes
+HASH_CHUNK_ROWS = 1_000_000
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Return the number of bits needed to write each unsigned 64-bit integer."""
+    # Each half is exactly representable as a float, whose exponent is the length
+    high = np.frexp((values >> np.uint64(32)).astype(np.float64))[1]
+    low = np.frexp((values & np.uint64(0xFFFFFFFF)).astype(np.float64))[1]
+    return np.where(high > 0, high + 32, low)
+
+
+def hash_values(values: Union[pd.Series, pd.DataFrame]) -> np.ndarray:
+    """Return the 64-bit hash of every value of a serie, or of every row of a frame."""
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+class HyperLogLog:
+    """
+    Class for estimating the number of distinct values from their 64-bit hashes.
+
+    The distinct hashes are kept, and counted exactly, until there are more than
+    threshold of them. The sketch then switches to 2 ** precision registers, each
+    holding the longest run of leading zeros among the hashes routed to it, whose
+    estimate has a relative standard error of about 1.04 / sqrt(2 ** precision)
+    whatever the number of values. Sketches with the same error can be merged.
+
+    Attributes
+    ----------
+    error : float, default = 0.01
+        Relative standard error of the estimates, which sets the number of registers.
+
+    threshold : int, default = None
+        Number of distinct hashes counted exactly, never switching to registers if None.
+    """
+
+    def __init__(self, error: float = 0.01, threshold: Optional[int] = None):
+        self._precision = int(np.clip(np.ceil(np.log2((1.04 / error) ** 2)), 4, 18))
+        self._threshold = threshold
+        self._hashes = np.array([], dtype=np.uint64)
+        self._registers: Optional[np.ndarray] = None
+
+    @property
+    def is_exact(self) -> bool:
+        """Return whether the count is exact rather than estimated."""
+        return self._registers is None
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes held by the sketch."""
+        registers = 0 if self._registers is None else self._registers.nbytes
+        return self._hashes.nbytes + registers
+
+    def update(self, hashes: np.ndarray) -> None:
+        """Add the given 64-bit hashes to the sketch."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if self._registers is not None:
+            self._add(hashes)
+            return None
+
+        self._hashes = np.union1d(self._hashes, hashes)
+        if self._threshold is not None and len(self._hashes) > self._threshold:
+            self._switch()
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Add the hashes seen by another sketch with the same error."""
+        if other._precision != self._precision:
+            raise ValueError("Only sketches with the same error can be merged.")
+
+        if other._registers is None:
+            self.update(other._hashes)
+            return None
+
+        if self._registers is None:
+            self._switch()
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def count(self) -> int:
+        """Return the number of distinct hashes, estimated once above the threshold."""
+        if self._registers is None:
+            return len(self._hashes)
+
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m ** 2 / np.ldexp(1.0, -self._registers.astype(int)).sum()
+        n_zeros = int((self._registers == 0).sum())
+        # Linear counting is more accurate while many registers are still empty
+        if estimate <= 2.5 * m and n_zeros > 0:
+            estimate = m * np.log(m / n_zeros)
+        return int(round(estimate))
+
+    def _switch(self) -> None:
+        """Move the exact hashes to the registers."""
+        hashes, self._hashes = self._hashes, np.array([], dtype=np.uint64)
+        self._registers = np.zeros(1 << self._precision, dtype=np.uint8)
+        self._add(hashes)
+
+    def _add(self, hashes: np.ndarray) -> None:
+        """Route the hashes to the registers by their first bits and keep the ranks."""
+        p = self._precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rank = 65 - _bit_length(hashes << np.uint64(p))
+        np.maximum.at(self._registers, index, np.minimum(rank, 65 - p).astype(np.uint8))
+
+
+def count_distinct(
+    values: Union[pd.Series, pd.DataFrame],
+    dropna: bool = False,
+    error: float = 0.01,
+    threshold: Optional[int] = None,
+) -> Tuple[int, bool]:
+    """Return the number of distinct values (or rows) and whether it is estimated."""
+    sketch = HyperLogLog(error, threshold)
+    for start in range(0, len(values), HASH_CHUNK_ROWS):
+        chunk = values.iloc[start : start + HASH_CHUNK_ROWS]
+        sketch.update(hash_values(chunk.dropna() if dropna else chunk))
+    return sketch.count(), not sketch.is_exact
+
+
+# Rank error of the quantiles of the default sketch, with 99% confidence
+QUANTILE_RANK_ERROR = 0.0165
+
+
+def interpolate_quantiles(ordered: np.ndarray, quantiles: np.ndarray) -> np.ndarray:
+    """
+    Return the quantiles of sorted values, linearly interpolated between ranks.
+
+    The values only need to be sorted at the ranks either side of each quantile,
+    as np.partition leaves them.
+    """
+    positions = np.asarray(quantiles, dtype=np.float64) * (len(ordered) - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.ceil(positions).astype(np.intp)
+    low = ordered[lower].astype(np.float64)
+    high = ordered[upper].astype(np.float64)
+    return low + (high - low) * (positions - lower)
+
+
+class QuantileSketch:
+    """
+    Class for estimating the quantiles of a stream of values in bounded memory (KLL).
+
+    The values are kept, and their quantiles computed exactly, until there are more
+    than threshold of them. The sketch then keeps a hierarchy of compactors: the
+    values of level h stand for 2 ** h values each, and a full level is sorted and
+    every other value, starting at a random one, is promoted to the next level. The
+    level capacities shrink by 2/3 from the top one, of k values, so about 3k values
+    are kept whatever the number of values. With the default k = 200, the rank of
+    each returned value is within about 1.65% of the requested one with 99%
+    confidence (Karnin, Lang and Liberty, 2016). Sketches with the same k can be
+    merged, and the estimates of merged sketches have the same guarantee.
+
+    Attributes
+    ----------
+    k : int, default = 200
+        Capacity of the top compactor, which sets the accuracy.
+
+    threshold : int, default = 100000
+        Number of values whose quantiles are computed exactly.
+
+    seed : int, default = None
+        Seed of the random offsets of the compactions.
+    """
+
+    def __init__(
+        self, k: int = 200, threshold: int = 100_000, seed: Optional[int] = None
+    ):
+        self._k = k
+        self._threshold = threshold
+        self._rng = np.random.default_rng(seed)
+        self._levels = [np.array([], dtype=np.float64)]
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def is_exact(self) -> bool:
+        """Return whether the quantiles are exact rather than estimated."""
+        return len(self._levels) == 1
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes held by the sketch."""
+        return sum(level.nbytes for level in self._levels)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add the given values to the sketch."""
+        values = np.asarray(values, dtype=np.float64)
+        self._n += len(values)
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the values seen by another sketch with the same k."""
+        if other._k != self._k:
+            raise ValueError("Only sketches with the same k can be merged.")
+
+        self._n += other._n
+        for level, items in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.array([], dtype=np.float64))
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._compress()
+
+    def quantiles(self, quantiles: np.ndarray) -> np.ndarray:
+        """Return the values at the given quantiles (between 0 and 1), NaN if empty."""
+        quantiles = np.asarray(quantiles, dtype=np.float64)
+        if self._n == 0:
+            return np.full(quantiles.shape, np.nan)
+
+        if self.is_exact:
+            return interpolate_quantiles(np.sort(self._levels[0]), quantiles)
+
+        items, weights = self.get_items()
+        order = np.argsort(items, kind="mergesort")
+        cumulative = np.cumsum(weights[order])
+        positions = np.searchsorted(
+            cumulative, quantiles * cumulative[-1], side="right"
+        )
+        return items[order][np.minimum(positions, len(items) - 1)]
+
+    def get_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the kept values and the number of values each one stands for."""
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level), 2 ** h, dtype=np.int64)
+                for h, level in enumerate(self._levels)
+            ]
+        )
+        return items, weights
+
+    def _capacity(self, level: int) -> int:
+        """Return the number of values the level can hold before being compacted."""
+        if self.is_exact:
+            return max(self._threshold, self._k)
+
+        depth = len(self._levels) - level - 1
+        return max(2, int(np.ceil(self._k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        """Compact the lowest full level until every level is within its capacity."""
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) <= self._capacity(level):
+                level += 1
+                continue
+
+            if level + 1 == len(self._levels):
+                self._levels.append(np.array([], dtype=np.float64))
+            items = np.sort(items)
+            # An odd value out stays, the others are halved into the next level
+            n_kept = len(items) % 2
+            offset = n_kept + int(self._rng.integers(2))
+            self._levels[level] = items[:n_kept]
+            self._levels[level + 1] = np.concatenate(
+                [self._levels[level + 1], items[offset::2]]
+            )
+            level = 0
+
+
+# Number of counters of the default frequent values sketch
+FREQUENT_CAPACITY = 10_000
+
+# Number of rows whose values are counted at once, which bounds the chunk counts
+COUNT_CHUNK_ROWS = 1_000_000
+
+
+def _add_counts(counts: pd.Series, chunk_counts: pd.Series) -> pd.Series:
+    """Return the sum of two value count tables aligned on their values."""
+    if counts.empty:
+        return chunk_counts.astype("int64")
+
+    return counts.add(chunk_counts, fill_value=0).astype("int64")
+
+
+class FrequentValues:
+    """
+    Class for counting the most frequent values of a stream in bounded memory.
+
+    The sketch keeps a counter per value (Misra-Gries), and counts every value
+    exactly while there are at most capacity distinct ones. Above that, the
+    capacity + 1-th largest counter is subtracted from all the counters and the
+    ones left at zero are dropped. Each counter is then a lower bound of the
+    occurrences of its value, missing at most `error` of them, which never exceeds
+    the number of values over capacity + 1, and every value seen more often than
+    that keeps its counter. Sketches with the same capacity can be merged with the
+    same guarantee (Agarwal et al., 2012). Missing values are always counted exactly.
+
+    Attributes
+    ----------
+    capacity : int, default = 10000
+        Maximum number of counters, which sets the accuracy.
+    """
+
+    def __init__(self, capacity: int = FREQUENT_CAPACITY):
+        self._capacity = capacity
+        self._counts = pd.Series([], dtype="int64")
+        self._n = 0
+        self._n_missing = 0
+        self._error = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def is_exact(self) -> bool:
+        """Return whether the counts are exact rather than lower bounds."""
+        return self._error == 0
+
+    @property
+    def error(self) -> int:
+        """Return the maximum number of occurrences missing from any count."""
+        return self._error
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes held by the sketch."""
+        return int(self._counts.memory_usage(index=True, deep=True))
+
+    def update(self, counts: pd.Series) -> None:
+        """Add the values of a value count table, missing values included."""
+        self._n += int(counts.sum())
+        self._n_missing += int(counts[counts.index.isna()].sum())
+        self._counts = _add_counts(self._counts, counts)
+        self._compress()
+
+    def merge(self, other: "FrequentValues") -> None:
+        """Add the values seen by another sketch with the same capacity."""
+        if other._capacity != self._capacity:
+            raise ValueError("Only sketches with the same capacity can be merged.")
+
+        self._n += other._n
+        self._n_missing += other._n_missing
+        self._error += other._error
+        self._counts = _add_counts(self._counts, other._counts)
+        self._compress()
+
+    def get_n_values(self, dropna: bool = True) -> int:
+        """Return the number of values seen, missing values included if not dropna."""
+        return self._n - self._n_missing if dropna else self._n
+
+    def get_counts(self, dropna: bool = True) -> pd.Series:
+        """Return the counts of the kept values, the most frequent first."""
+        counts = self._counts
+        if dropna:
+            counts = counts[counts.index.notna()]
+        return counts.sort_values(ascending=False, kind="mergesort")
+
+    def get_frequent(self, n_head: int = 20, dropna: bool = True) -> pd.DataFrame:
+        """Return the occurrences and percentage of the top n_head most frequent values."""
+        occurrences = self.get_counts(dropna).head(n_head).rename("occurrence")
+        n_values = max(self.get_n_values(dropna), 1)
+        percentages = (occurrences / n_values).round(decimals=4).rename("percentage")
+        return (
+            pd.concat([occurrences, percentages], axis=1)
+            .rename_axis("value")
+            .reset_index()
+        )
+
+    def _compress(self) -> None:
+        """Subtract the capacity + 1-th largest counter if there are too many counters."""
+        # The counter of the missing values is exact and never subtracted from
+        missing = self._counts.index.isna()
+        values = self._counts.to_numpy()[~missing]
+        if len(values) <= self._capacity:
+            return None
+
+        position = len(values) - self._capacity - 1
+        threshold = int(np.partition(values, position)[position])
+        kept = missing | (self._counts.to_numpy() > threshold)
+        self._counts = self._counts[kept] - np.where(missing[kept], 0, threshold)
+        self._error += threshold
+
+
+def top_values(serie: pd.Series, capacity: int = FREQUENT_CAPACITY) -> FrequentValues:
+    """Return the frequent values sketch of a serie, counted by chunks of rows."""
+    sketch = FrequentValues(capacity)
+    for start in range(0, len(serie), COUNT_CHUNK_ROWS):
+        chunk = serie.iloc[start : start + COUNT_CHUNK_ROWS]
+        counts = chunk.value_counts(dropna=False)
+        sketch.update(counts[counts > 0])
+    return sketch
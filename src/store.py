@@ -0,0 +1,130 @@
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from typing import Any, List, Optional, Tuple
+
+from src import __version__
+
+# File marking the folders created by a store, the only ones it ever removes
+MARKER = ".profile_store"
+
+
+def get_namespace(config_path: str, version: str = __version__) -> str:
+    """Return the digest of the parameters file and the app version the results depend on."""
+    digest = hashlib.sha256(version.encode())
+    with open(config_path, "rb") as file:
+        digest.update(file.read())
+    return digest.hexdigest()[:16]
+
+
+class ProfileStore:
+    """
+    Class for storing computed results on disk, evicting the least recently used ones.
+
+    Entries live in a subfolder named after the namespace, so changing the
+    parameters file or the app version starts from an empty store and the folders
+    of any other namespace are removed. Only the folders marked as created by a
+    store are removed, so anything else kept in the folder is left alone.
+
+    Attributes
+    ----------
+    folder : str
+        Folder holding the stored results.
+
+    max_size_mb : float
+        Maximum size (in MB) of the stored results on disk.
+
+    namespace : str
+        Identifier of the configuration the stored results were computed with.
+    """
+
+    def __init__(self, folder: str, max_size_mb: float, namespace: str):
+        self._folder = os.path.join(folder, namespace)
+        self._max_size = int(max_size_mb * 1024 ** 2)
+        os.makedirs(self._folder, exist_ok=True)
+        open(os.path.join(self._folder, MARKER), "a").close()
+        for name in os.listdir(folder):
+            path = os.path.join(folder, name)
+            if name != namespace and os.path.isfile(os.path.join(path, MARKER)):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes used by the stored results."""
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._folder, f"{key}.pkl")
+
+    def _entries(self) -> List[Tuple[str, os.stat_result]]:
+        """Return the path and status of every entry, the least recently used first."""
+        entries = []
+        for entry in os.scandir(self._folder):
+            try:
+                if entry.name.endswith(".pkl"):
+                    entries.append((entry.path, entry.stat()))
+            except FileNotFoundError:
+                # Removed by another session in the meantime
+                continue
+        return sorted(entries, key=lambda entry: entry[1].st_mtime)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the result stored under the given key, if any."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Unreadable entries are dropped and computed again
+            self.pop(key)
+            return None
+
+        # The modification time orders the entries for the eviction
+        os.utime(path)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store the result under the given key, evicting the oldest entries if needed."""
+        content = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(content) > self._max_size:
+            return None
+
+        self.pop(key)
+        entries = self._entries()
+        size = sum(stat.st_size for _, stat in entries)
+        while entries and size + len(content) > self._max_size:
+            path, stat = entries.pop(0)
+            size -= stat.st_size
+            self._remove(path)
+
+        # Written aside and renamed, so a reader never sees a partial entry
+        descriptor, temporary = tempfile.mkstemp(dir=self._folder, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(content)
+        os.replace(temporary, self._path(key))
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def pop(self, key: str) -> None:
+        """Remove the result stored under the given key, if any."""
+        self._remove(self._path(key))
+
+    def clear(self) -> None:
+        """Remove every stored result."""
+        for path, _ in self._entries():
+            self._remove(path)
@@ -0,0 +1,718 @@
+import copy
+from dataclasses import astuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.data import Dataset
+from src.datetime import DateColumn, DateProfile, parse_datetime
+from src.formats import Source, read_batches
+from src.numeric import (
+    PERCENTILES,
+    NumericColumn,
+    NumericProfile,
+    _get_values,
+    bin_values,
+    format_histogram,
+    plot_histogram,
+)
+from src.settings import FormatBarPlot, FormatHistogram
+from src.sketches import (
+    FREQUENT_CAPACITY,
+    FrequentValues,
+    HyperLogLog,
+    QuantileSketch,
+    hash_values,
+)
+from src.text import TextColumn, TextProfile
+
+if TYPE_CHECKING:
+    from plotly.graph_objs._figure import Figure
+
+
+class _StreamedColumnMixin:
+    """Accumulators shared by every streamed column."""
+
+    def _init_accumulators(
+        self, capacity: int, error: float, exact_threshold: Optional[int]
+    ) -> None:
+        self._n_missing = 0
+        self._frequent = FrequentValues(capacity)
+        self._distinct = HyperLogLog(error, exact_threshold)
+
+    def _update_counts(self, serie: pd.Series) -> pd.Series:
+        """Add the values of the chunk to the sketches and return its value counts."""
+        counts = serie.value_counts(dropna=False)
+        # Categorical chunks also count their unused categories
+        counts = counts[counts > 0]
+        self._n_missing += int(serie.isna().sum())
+        self._frequent.update(counts)
+        # Hashing the distinct values of the chunk is enough to count them
+        values = counts.index[counts.index.notna()]
+        self._distinct.update(hash_values(pd.Series(values, dtype=serie.dtype)))
+        return counts
+
+    def _merge_counts(self, other: "_StreamedColumnMixin") -> None:
+        self._n_missing += other._n_missing
+        self._frequent.merge(other._frequent)
+        self._distinct.merge(other._distinct)
+
+    def _get_counts(self, dropna: bool = True) -> pd.Series:
+        return self._frequent.get_counts(dropna)
+
+    def get_missing(self) -> int:
+        """Return number of missing values for selected column."""
+        return self._n_missing
+
+    def get_unique(self, dropna: bool = True) -> int:
+        """Return number of unique values for selected column."""
+        return self._distinct.count() + int(not dropna and self._n_missing > 0)
+
+    def get_unique_estimate(
+        self, dropna: bool = True, error: float = 0.01, threshold: int = 100_000
+    ) -> Tuple[int, bool]:
+        """Return number of unique values for selected column and whether it is estimated, as read."""
+        return self.get_unique(dropna), not self._distinct.is_exact
+
+    def _get_occurrences(self, dropna: bool = True) -> pd.Series:
+        """Return the occurrences per value for selected column."""
+        return self._get_counts(dropna).rename("occurrence")
+
+    def get_barchart(self, params: FormatBarPlot, dropna: bool = True) -> "Figure":
+        """Return the generated bar chart for selected column."""
+        from src.charts import plot_occurrences
+
+        n_values = None
+        if not self._frequent.is_exact:
+            n_values = self._frequent.get_n_values(dropna)
+        return plot_occurrences(
+            self._get_occurrences(dropna), self.col_name, params, n_values
+        )
+
+    def get_frequent(self, n_head: int = 20, dropna: bool = True) -> pd.DataFrame:
+        """Return the Pandas dataframe containing the occurrences and percentage of the top n_head most frequent values."""
+        return self._frequent.get_frequent(n_head, dropna)
+
+    def get_frequent_estimate(
+        self, n_head: int = 20, dropna: bool = True, capacity: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, int]:
+        """Return the frequency table of the top n_head values and the maximum error of its occurrences, as read."""
+        return self.get_frequent(n_head, dropna), self._frequent.error
+
+
+class StreamedNumericColumn(_StreamedColumnMixin, NumericColumn):
+    """
+    Class for accumulating the information of a numeric column read in chunks.
+
+    Attributes
+    ----------
+    col_name: str
+        Name of the numeric pandas column.
+
+    dtype: np.dtype
+        Data type of the numeric pandas column.
+
+    capacity : int, default = 10000
+        Number of counters of the frequent values sketch.
+
+    error : float, default = 0.01
+        Relative standard error of the number of unique values once estimated.
+
+    exact_threshold : int, default = None
+        Number of unique values counted exactly, all of them if None.
+
+    bounds : Tuple[float, float], default = None
+        Minimum and maximum finite values of the whole column, known beforehand.
+
+    max_bins : int, default = None
+        Number of histogram bins counted exactly between the bounds, the histogram
+        being drawn from the quantile sketch if not given.
+    """
+
+    def __init__(
+        self,
+        col_name: str,
+        dtype: Union[str, np.dtype] = "float64",
+        capacity: int = FREQUENT_CAPACITY,
+        error: float = 0.01,
+        exact_threshold: Optional[int] = None,
+        bounds: Optional[Tuple[float, float]] = None,
+        max_bins: Optional[int] = None,
+    ):
+        super().__init__(col_name, pd.Series([], name=col_name, dtype=dtype))
+        self._init_accumulators(capacity, error, exact_threshold)
+        # Bins fixed from the bounds, so the counts of the chunks add up exactly
+        self._range = None
+        self._max_bins = max_bins
+        if bounds is not None and max_bins is not None:
+            value_dtype = self.serie.dtype
+            if not isinstance(value_dtype, np.dtype):
+                value_dtype = value_dtype.numpy_dtype
+            self._range = tuple(np.array(bounds, dtype=value_dtype))
+            self._bin_counts = np.zeros(max_bins, dtype=np.int64)
+        self._n_zeros = 0
+        self._n_negatives = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = np.nan
+        self._max = np.nan
+        self._quantiles = QuantileSketch()
+
+    def update(self, serie: pd.Series) -> None:
+        """Add the values of the given chunk to the accumulators."""
+        chunk = NumericColumn(self.col_name, serie).profile()
+        values = _get_values(serie)
+        self._quantiles.update(values)
+        if self._range is not None:
+            counts, _ = np.histogram(
+                values[np.isfinite(values)], bins=self._max_bins, range=self._range
+            )
+            self._bin_counts += counts
+        self._profile = None
+        self._update_counts(serie)
+        self._n_zeros += chunk.n_zeros
+        self._n_negatives += chunk.n_negatives
+
+        count = len(serie) - chunk.n_missing
+        m2 = chunk.std ** 2 * (count - 1) if count > 1 else 0.0
+        self._add_moments(count, chunk.mean, m2, chunk.min, chunk.max)
+
+    def merge(self, other: "StreamedNumericColumn") -> None:
+        """Add the accumulators of the same column read from other rows."""
+        if (self._range, self._max_bins) != (other._range, other._max_bins):
+            raise ValueError("Cannot merge columns binned differently.")
+
+        self._profile = None
+        self._merge_counts(other)
+        if self._range is not None:
+            self._bin_counts += other._bin_counts
+        self._n_zeros += other._n_zeros
+        self._n_negatives += other._n_negatives
+        self._quantiles.merge(other._quantiles)
+        self._add_moments(other._count, other._mean, other._m2, other._min, other._max)
+
+    def _add_moments(
+        self,
+        count: int,
+        mean: float,
+        m2: float,
+        minimum: Union[int, float],
+        maximum: Union[int, float],
+    ) -> None:
+        """Combine the partial mean and squared deviations of other values (Chan et al.)."""
+        if count == 0:
+            return None
+
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta ** 2 * self._count * count / total
+        self._count = total
+        self._min = np.nanmin([self._min, minimum])
+        self._max = np.nanmax([self._max, maximum])
+
+    def profile(self) -> NumericProfile:
+        """Return the scalar metrics of the accumulated chunks."""
+        if self._profile is None:
+            quantiles = self._quantiles.quantiles([0.5, *np.divide(PERCENTILES, 100)])
+            self._profile = NumericProfile(
+                n_unique=self._distinct.count(),
+                n_missing=self._n_missing,
+                n_zeros=self._n_zeros,
+                n_negatives=self._n_negatives,
+                mean=self._mean if self._count > 0 else np.nan,
+                std=(
+                    float(np.sqrt(self._m2 / (self._count - 1)))
+                    if self._count > 1
+                    else np.nan
+                ),
+                min=self._min,
+                max=self._max,
+                median=float(quantiles[0]),
+                percentiles=tuple(quantiles[1:].tolist()),
+                quantiles_estimated=not self._quantiles.is_exact,
+            )
+        return self._profile
+
+    def get_percentiles(self, percentiles: Sequence[float] = PERCENTILES) -> pd.Series:
+        """Return the value at each of the given percentiles, from the quantile sketch."""
+        return pd.Series(
+            self._quantiles.quantiles(np.divide(percentiles, 100)),
+            index=[f"p{percentile:g}" for percentile in percentiles],
+            name="value",
+        )
+
+    def get_histogram(self, params: FormatHistogram) -> "Figure":
+        """Return the generated histogram for selected column, exact if binned as read."""
+        if self._range is not None and params.MAX_BINS == self._max_bins:
+            edges = np.histogram_bin_edges(
+                np.array(self._range), bins=self._max_bins, range=self._range
+            )
+            return format_histogram(
+                plot_histogram(edges, self._bin_counts), self.col_name, params
+            )
+
+        # Otherwise binned from the items of the quantile sketch, weighted
+        items, weights = self._quantiles.get_items()
+        edges, bin_counts = bin_values(items, params.MAX_BINS, weights=weights)
+        if not self._quantiles.is_exact:
+            params = params.copy(update={"TITLE": f"{params.TITLE} (approximate)"})
+        return format_histogram(
+            plot_histogram(edges, bin_counts), self.col_name, params
+        )
+
+
+class StreamedTextColumn(_StreamedColumnMixin, TextColumn):
+    """
+    Class for accumulating the information of a text column read in chunks.
+
+    Attributes
+    ----------
+    col_name : str
+        Name of the text pandas column.
+
+    dtype : np.dtype, default = object
+        Data type of the text pandas column.
+
+    capacity : int, default = 10000
+        Number of counters of the frequent values sketch.
+
+    error : float, default = 0.01
+        Relative standard error of the number of unique values once estimated.
+
+    exact_threshold : int, default = None
+        Number of unique values counted exactly, all of them if None.
+    """
+
+    def __init__(
+        self,
+        col_name: str,
+        dtype: Union[str, np.dtype] = object,
+        capacity: int = FREQUENT_CAPACITY,
+        error: float = 0.01,
+        exact_threshold: Optional[int] = None,
+    ):
+        super().__init__(col_name, pd.Series([], name=col_name, dtype=dtype))
+        self._init_accumulators(capacity, error, exact_threshold)
+        self._profile = TextProfile.from_counts(pd.Series([], dtype="int64"))
+
+    def update(self, serie: pd.Series) -> None:
+        """Add the values of the given chunk to the accumulators."""
+        counts = self._update_counts(serie)
+        self._add_profile(TextProfile.from_counts(counts))
+
+    def merge(self, other: "StreamedTextColumn") -> None:
+        """Add the accumulators of the same column read from other rows."""
+        self._merge_counts(other)
+        self._add_profile(other._profile)
+
+    def _add_profile(self, other: TextProfile) -> None:
+        """Add up the character class counts."""
+        self._profile = TextProfile(
+            *(a + b for a, b in zip(astuple(self._profile), astuple(other)))
+        )
+
+
+class StreamedDateColumn(_StreamedColumnMixin, DateColumn):
+    """
+    Class for accumulating the information of a datetime column read in chunks.
+
+    Attributes
+    ----------
+    col_name : str
+        Name of the datetime pandas column.
+
+    dtype : np.dtype, default = "datetime64[ns]"
+        Data type of the datetime pandas column, with its time zone if any.
+
+    capacity : int, default = 10000
+        Number of counters of the frequent values sketch.
+
+    error : float, default = 0.01
+        Relative standard error of the number of unique values once estimated.
+
+    exact_threshold : int, default = None
+        Number of unique values counted exactly, all of them if None.
+    """
+
+    def __init__(
+        self,
+        col_name: str,
+        dtype: Union[str, np.dtype] = "datetime64[ns]",
+        capacity: int = FREQUENT_CAPACITY,
+        error: float = 0.01,
+        exact_threshold: Optional[int] = None,
+    ):
+        super().__init__(col_name, pd.Series([], name=col_name, dtype=dtype))
+        self._init_accumulators(capacity, error, exact_threshold)
+        self._profile = DateProfile.from_nanoseconds(np.array([], dtype=np.int64))
+
+    def update(self, serie: pd.Series) -> None:
+        """Add the values of the given chunk to the accumulators."""
+        self._update_counts(serie)
+        self._add_profile(DateColumn(self.col_name, serie).profile())
+
+    def merge(self, other: "StreamedDateColumn") -> None:
+        """Add the accumulators of the same column read from other rows."""
+        self._merge_counts(other)
+        self._add_profile(other._profile)
+
+    def _add_profile(self, other: DateProfile) -> None:
+        """Add up the date counts and keep the earliest and latest dates."""
+        dates = [self._profile.min, self._profile.max, other.min, other.max]
+        dates = [value for value in dates if value is not None]
+        self._profile = DateProfile(
+            n_missing=self._profile.n_missing + other.n_missing,
+            n_weekend=self._profile.n_weekend + other.n_weekend,
+            n_weekday=self._profile.n_weekday + other.n_weekday,
+            n_future=self._profile.n_future + other.n_future,
+            n_empty_1900=self._profile.n_empty_1900 + other.n_empty_1900,
+            n_empty_1970=self._profile.n_empty_1970 + other.n_empty_1970,
+            min=min(dates, default=None),
+            max=max(dates, default=None),
+        )
+
+
+class StreamedDataset(Dataset):
+    """
+    Class for storing and displaying information about a file read in chunks.
+
+    Only a zero-row frame with the resolved column types is kept in `df`, so the
+    column classification methods behave exactly as for an in-memory Dataset.
+
+    Attributes
+    ----------
+    name : str
+        Name of the file.
+
+    df : pd.DataFrame
+        Empty Pandas DataFrame with the column types of the file.
+
+    loaded_file : Source
+        File object or path to read the chunks from.
+
+    file_format : str, default = "csv"
+        Format of the file, as returned by `get_format`.
+
+    chunk_size : int, default = 100000
+        Number of rows of each chunk.
+
+    n_kept_rows : int, default = 50
+        Number of rows kept for the head, tail and sample tables.
+
+    error : float, default = 0.01
+        Relative standard error of the number of distinct rows once estimated.
+
+    exact_threshold : int, default = None
+        Number of distinct rows, and of unique values of each column, counted
+        exactly, all of them if None.
+
+    frequent_capacity : int, default = 10000
+        Number of counters of the frequent values sketch of each column.
+
+    max_bins : int, default = None
+        Number of histogram bins counted exactly for each numeric column.
+
+    bounds : Dict[str, Tuple[float, float]], default = None
+        Minimum and maximum finite values of each numeric column, the histograms
+        being drawn from the quantile sketches for the columns without them.
+
+    options : Any
+        Keyword arguments passed to `pd.read_csv` for CSV files.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        df: pd.DataFrame,
+        loaded_file: Source,
+        file_format: str = "csv",
+        chunk_size: int = 100_000,
+        n_kept_rows: int = 50,
+        error: float = 0.01,
+        exact_threshold: Optional[int] = None,
+        frequent_capacity: int = FREQUENT_CAPACITY,
+        max_bins: Optional[int] = None,
+        bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+        **options: Any,
+    ):
+        super().__init__(name, df)
+        self._loaded_file = loaded_file
+        self._file_format = file_format
+        self._chunk_size = chunk_size
+        self._options = options
+        self._n_kept_rows = n_kept_rows
+        self._n_rows = 0
+        self._n_missing = 0
+        self._rows = HyperLogLog(error, exact_threshold)
+        self._head = df
+        self._tail = df
+        self._sample = df.assign(_key=pd.Series([], dtype="float64"))
+        self._rng = np.random.default_rng()
+        self._sketch_options = dict(
+            capacity=frequent_capacity, error=error, exact_threshold=exact_threshold
+        )
+        self._columns: Dict[str, Any] = {
+            **{
+                col: StreamedNumericColumn(
+                    col,
+                    df[col].dtype,
+                    bounds=(bounds or {}).get(col),
+                    max_bins=max_bins,
+                    **self._sketch_options,
+                )
+                for col in self.get_numeric_columns()
+            },
+            **{
+                col: StreamedTextColumn(col, **self._sketch_options)
+                for col in self.get_text_columns()
+            },
+            **{
+                col: StreamedDateColumn(col, **self._sketch_options)
+                for col in self.get_date_columns()
+            },
+        }
+        self._converted: Dict[str, StreamedDateColumn] = {}
+
+    def read(self) -> None:
+        """Feed every chunk of the file to the accumulators."""
+        for chunk in read_batches(
+            self._loaded_file,
+            self._file_format,
+            self._chunk_size,
+            columns=self.get_cols_list(),
+            dtype=self.df.dtypes.to_dict(),
+            **self._options,
+        ):
+            self.update(chunk)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Add the rows of the given chunk to the accumulators."""
+        self._n_rows += len(chunk)
+        self._n_missing += int(chunk.isnull().any(axis=1).sum())
+        self._rows.update(hash_values(chunk))
+
+        # Keep the first, last and a uniform random sample of rows
+        k = self._n_kept_rows
+        if len(self._head) < k:
+            self._head = pd.concat([self._head, chunk.head(k - len(self._head))])
+        self._tail = pd.concat([self._tail, chunk.tail(k)]).tail(k)
+        keyed = chunk.assign(_key=self._rng.random(len(chunk))).nsmallest(k, "_key")
+        self._sample = pd.concat([self._sample, keyed]).nsmallest(k, "_key")
+
+        for col, column in self._columns.items():
+            column.update(chunk[col])
+
+    def get_n_rows(self) -> int:
+        """Return number of rows of loaded dataset."""
+        return self._n_rows
+
+    def get_n_duplicates(self) -> int:
+        """Return number of duplicated rows of loaded dataset."""
+        return max(self._n_rows - self._rows.count(), 0)
+
+    def get_n_duplicates_estimate(
+        self, error: float = 0.01, threshold: int = 100_000
+    ) -> Tuple[int, bool]:
+        """Return number of duplicated rows and whether it is estimated, as read, 0 if within the error."""
+        n_duplicates = self.get_n_duplicates()
+        if self._rows.is_exact:
+            return n_duplicates, False
+
+        # The error is relative to the distinct rows, so fewer duplicates than three
+        # standard errors of them cannot be told apart from none
+        if n_duplicates <= 3 * error * (self._n_rows - n_duplicates):
+            return 0, True
+        return n_duplicates, True
+
+    def get_n_missing(self) -> int:
+        """Return number of rows with missing values of loaded dataset."""
+        return self._n_missing
+
+    def get_head(self, n=5) -> pd.DataFrame:
+        """Return Pandas Dataframe with top rows of loaded dataset."""
+        return self._head.head(n)
+
+    def get_tail(self, n=5) -> pd.DataFrame:
+        """Return Pandas Dataframe with bottom rows of loaded dataset."""
+        return self._tail.tail(n)
+
+    def get_sample(self, n=5):
+        """Return Pandas Dataframe with random sampled rows of loaded dataset."""
+        sample = self._sample.drop(columns="_key")
+        return sample.sample(min(n, len(sample)))
+
+    def get_numeric_column(self, col: str) -> StreamedNumericColumn:
+        """Return the accumulated numeric column."""
+        return self._columns[col]
+
+    def get_text_column(self, col: str) -> StreamedTextColumn:
+        """Return the accumulated text column."""
+        return self._columns[col]
+
+    def get_date_column(self, col: str) -> StreamedDateColumn:
+        """Return the accumulated datetime column."""
+        return self._columns[col]
+
+    def with_datetime(self, columns: List[str]) -> "StreamedDataset":
+        """Return the Dataset with the given columns read again as datetime."""
+        if not columns:
+            return self
+
+        # Only the columns never converted before are read again
+        missing = {
+            col: StreamedDateColumn(col, **self._sketch_options)
+            for col in columns
+            if col not in self._converted
+        }
+        if missing:
+            for chunk in read_batches(
+                self._loaded_file,
+                self._file_format,
+                self._chunk_size,
+                columns=list(missing),
+                dtype=object,
+                **self._options,
+            ):
+                for col, column in missing.items():
+                    column.update(parse_datetime(chunk[col]))
+            self._converted.update(missing)
+
+        dataset = copy.copy(self)
+        dataset.df = self.df.astype({col: "datetime64[ns]" for col in columns})
+        dataset._columns = {
+            **self._columns,
+            **{col: self._converted[col] for col in columns},
+        }
+        return dataset
+
+    def get_memory_usage(self) -> int:
+        """Return an estimate of the number of bytes held by the accumulators."""
+        buffers = [self._head, self._tail, self._sample]
+        return int(
+            sum(df.memory_usage(deep=True, index=True).sum() for df in buffers)
+            + self._rows.nbytes
+            + sum(
+                column._frequent.nbytes + column._distinct.nbytes
+                for column in self._columns.values()
+            )
+            + sum(
+                column._quantiles.nbytes
+                for column in self._columns.values()
+                if isinstance(column, StreamedNumericColumn)
+            )
+        )
+
+
+def _promote(left: Optional[np.dtype], right: np.dtype) -> np.dtype:
+    """Return the data type holding the values of both data types, as read_csv would."""
+    if left is None or left == right:
+        return right
+
+    numeric = [
+        np.issubdtype(dtype, np.number) and not np.issubdtype(dtype, np.bool_)
+        for dtype in (left, right)
+    ]
+    if all(numeric):
+        return np.result_type(left, right)
+
+    return np.dtype(object)
+
+
+def _resolve_dtypes(
+    loaded_file: Source,
+    file_format: str,
+    chunk_size: int,
+    columns: Optional[List[str]] = None,
+    **options: Any,
+) -> Tuple[Dict[str, np.dtype], Dict[str, Tuple[float, float]]]:
+    """
+    Return the data type that reading the whole file at once gives each column.
+
+    The minimum and maximum finite values of the numeric columns are returned too,
+    so their histograms can be binned as the chunks are read.
+    """
+    resolved: Dict[str, Optional[np.dtype]] = {}
+    has_missing: Dict[str, bool] = {}
+    bounds: Dict[str, Tuple[float, float]] = {}
+    n_rows = 0
+    for chunk in read_batches(
+        loaded_file, file_format, chunk_size, columns=columns, **options
+    ):
+        n_rows += len(chunk)
+        for col in chunk.columns:
+            resolved.setdefault(col, None)
+            has_missing[col] = has_missing.get(col, False) or bool(
+                chunk[col].isna().any()
+            )
+            # A chunk with only missing values says nothing about the type
+            if chunk[col].notna().any():
+                resolved[col] = _promote(resolved[col], chunk[col].dtype)
+            if chunk[col].dtype.kind in "iuf":
+                values = _get_values(chunk[col])
+                values = values[np.isfinite(values)]
+                if len(values):
+                    low, high = bounds.get(col, (values.min(), values.max()))
+                    bounds[col] = (min(low, values.min()), max(high, values.max()))
+
+    dtypes = {}
+    for col, dtype in resolved.items():
+        if dtype is None:
+            dtype = np.dtype("float64") if n_rows else np.dtype(object)
+        elif has_missing[col] and np.issubdtype(dtype, np.integer):
+            dtype = np.dtype("float64")
+        elif has_missing[col] and np.issubdtype(dtype, np.bool_):
+            dtype = np.dtype(object)
+        dtypes[col] = dtype
+
+    return dtypes, bounds
+
+
+def stream_dataset(
+    name: str,
+    loaded_file: Source,
+    chunk_size: int = 100_000,
+    n_kept_rows: int = 50,
+    file_format: str = "csv",
+    columns: Optional[List[str]] = None,
+    error: float = 0.01,
+    exact_threshold: Optional[int] = None,
+    frequent_capacity: int = FREQUENT_CAPACITY,
+    max_bins: Optional[int] = None,
+    **options: Any,
+) -> StreamedDataset:
+    """
+    Return the StreamedDataset of a file read in chunks of chunk_size rows.
+
+    The file is read twice: once to resolve the type of every column over all the
+    chunks, and once to feed the accumulators. Peak memory is bounded by the chunk
+    size plus, for each column, at most frequent_capacity value counters and a
+    quantile sketch of fixed size, and one 8-byte hash per distinct row and per
+    distinct value, up to exact_threshold of them above which they are estimated
+    with HyperLogLog sketches of fixed size. The histograms of the numeric columns
+    are counted exactly in max_bins bins between the bounds found by the first read.
+    """
+    dtypes, bounds = _resolve_dtypes(
+        loaded_file, file_format, chunk_size, columns, **options
+    )
+    schema = pd.DataFrame(
+        {col: pd.Series([], dtype=dtype) for col, dtype in dtypes.items()}
+    )
+    dataset = StreamedDataset(
+        name,
+        schema,
+        loaded_file,
+        file_format,
+        chunk_size,
+        n_kept_rows,
+        error,
+        exact_threshold,
+        frequent_capacity,
+        max_bins,
+        bounds,
+        **options,
+    )
+    dataset.read()
+    return dataset
@@ -0,0 +1,159 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+from src.batch import (
+    column_to_dict,
+    get_destinations,
+    iter_profile_files,
+    profile_file,
+)
+from src.data import Dataset
+from src.profiling import profile_columns
+from src.settings import AppConfig
+
+
+class TestBatch(unittest.TestCase):
+    """Class containing the tests for the command-line profiling of files."""
+
+    def setUp(self) -> None:
+        """Setting up two files in a temporary folder and the parameters."""
+
+        # Instantiated files and parameters
+        self.folder = tempfile.TemporaryDirectory()
+        self.df = pd.DataFrame(
+            {
+                "int_col": [1, 2, 2, 3],
+                "text_col": ["a", "b", "b", None],
+                "date_raw_col": ["2021-10-03", "2021-10-02", None, "1970-01-01"],
+            }
+        )
+        self.paths = [
+            os.path.join(self.folder.name, "file.csv"),
+            os.path.join(self.folder.name, "file.parquet"),
+        ]
+        self.df.to_csv(self.paths[0], index=False)
+        self.df.to_parquet(self.paths[1])
+        self.params = AppConfig()
+
+    def tearDown(self) -> None:
+        """Delete the variables and the folder after each test."""
+        self.folder.cleanup()
+        del self.folder, self.df, self.paths, self.params
+
+    def test_profile_file(self) -> None:
+        """Test that the profile of a file holds the reports of every section."""
+
+        # Expected
+        expected = [
+            column_to_dict(report)
+            for report in profile_columns(
+                Dataset("file.csv", self.df).with_datetime(["date_raw_col"]),
+                "text",
+                self.params.TEXT_COLS.copy(update={"PLOT": None}),
+                approximation=self.params.APPROXIMATION,
+            )
+        ]
+
+        # Act
+        result = profile_file(self.paths[0], self.params, datetime=["date_raw_col"])
+
+        # Assert: expected result
+        self.assertEqual(result["overall"]["n_rows"], 4)
+        self.assertListEqual(result["text"], expected)
+        self.assertListEqual(
+            [column["name"] for column in result["date"]], ["date_raw_col"]
+        )
+        self.assertNotIn("chart", result["numeric"][0])
+        # Assert: serialisable output
+        json.dumps(result)
+
+    def test_profile_file_charts(self) -> None:
+        """Test that the charts are only added when asked for."""
+
+        # Act
+        result = profile_file(self.paths[0], self.params, charts=True)
+
+        # Assert: expected result
+        self.assertIn("data", result["numeric"][0]["chart"])
+        self.assertIn("data", result["text"][0]["chart"])
+
+    def test_iter_profile_files(self) -> None:
+        """Test that every file is written as JSON with its time and memory."""
+
+        for max_workers in [1, 2]:
+            with self.subTest(max_workers=max_workers):
+                # Act
+                output = os.path.join(self.folder.name, f"output_{max_workers}")
+                paths = self.paths + [os.path.join(self.folder.name, "missing.csv")]
+                result = {
+                    profile.path: profile
+                    for profile in iter_profile_files(
+                        paths, output, self.params, max_workers=max_workers
+                    )
+                }
+
+                # Assert: expected result
+                for path in self.paths:
+                    with open(result[path].output) as file:
+                        profile = json.load(file)
+                    self.assertEqual(profile["overall"]["n_cols"], 3)
+                    self.assertGreater(result[path].wall_time, 0)
+                    self.assertGreater(result[path].peak_memory, 0)
+                    self.assertIsNone(result[path].error)
+                self.assertIsNone(result[paths[-1]].output)
+                self.assertIsNotNone(result[paths[-1]].error)
+
+    def test_get_destinations(self) -> None:
+        """Test that files named the same in different folders get different outputs."""
+
+        # Expected
+        expected = [
+            os.path.join("output", "a", "extract.csv.json"),
+            os.path.join("output", "b", "extract.csv.json"),
+        ]
+
+        # Act
+        result = get_destinations(
+            [
+                os.path.join(self.folder.name, "a", "extract.csv"),
+                os.path.join(self.folder.name, "b", "extract.csv"),
+            ],
+            "output",
+        )
+
+        # Assert: expected result
+        self.assertListEqual(result, expected)
+        self.assertListEqual(
+            get_destinations(self.paths[:1], "output"),
+            [os.path.join("output", "file.csv.json")],
+        )
+        # Assert: same file given twice
+        with self.assertRaises(ValueError):
+            get_destinations(self.paths[:1] * 2, "output")
+
+    def test_no_charting_import(self) -> None:
+        """Test that the command line loads neither streamlit nor plotly."""
+
+        # Act
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, src.batch; print('plotly' in sys.modules, 'streamlit' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Assert: expected result
+        self.assertEqual(result.stdout.strip(), "False False")
+
+
+if __name__ == "__main__":
+    unittest.main()
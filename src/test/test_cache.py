@@ -0,0 +1,175 @@
+import io
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pandas.testing as pd_testing
+from src.cache import DataFrameCache, get_digest, get_shared_cache
+from src.loader import load_dataset
+
+
+class TestDataFrameCache(unittest.TestCase):
+    """Class containing the tests for the methods of the DataFrameCache class."""
+
+    def setUp(self) -> None:
+        """Setting up a DataFrameCache with room for two small dataframes."""
+
+        # Instantiated DataFrameCache class and parameters
+        self.df = pd.DataFrame({"int_col": range(1000)})
+        self.df_size = int(self.df.memory_usage(deep=True, index=True).sum())
+        self.cache = DataFrameCache(max_memory_mb=2 * self.df_size / 1024 ** 2)
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.df, self.df_size, self.cache
+
+    def test_get_digest(self) -> None:
+        """Test that the digest depends on both the content and the parse options."""
+
+        # Act
+        result = get_digest(b"a,b\n1,2\n", sep=",")
+
+        # Assert: type of output
+        self.assertIsInstance(result, str)
+        # Assert: expected result
+        self.assertEqual(result, get_digest(b"a,b\n1,2\n", sep=","))
+        self.assertNotEqual(result, get_digest(b"a,b\n1,3\n", sep=","))
+        self.assertNotEqual(result, get_digest(b"a,b\n1,2\n", sep=";"))
+
+    def test_get_missing_key(self) -> None:
+        """Test that an unknown key returns None."""
+
+        # Act
+        result = self.cache.get("missing")
+
+        # Assert: expected result
+        self.assertIsNone(result)
+
+    def test_put_get(self) -> None:
+        """Test that a stored dataframe is returned and accounted for."""
+
+        # Act
+        self.cache.put("a", self.df)
+        result = self.cache.get("a")
+
+        # Assert: expected result
+        self.assertIs(result, self.df)
+        self.assertEqual(self.cache.memory_usage, self.df_size)
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used dataframe is evicted first."""
+
+        # Act
+        self.cache.put("a", self.df)
+        self.cache.put("b", self.df.copy())
+        self.cache.get("a")
+        self.cache.put("c", self.df.copy())
+
+        # Assert: expected result
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertIn("c", self.cache)
+        self.assertLessEqual(self.cache.memory_usage, 2 * self.df_size)
+
+    def test_put_too_large(self) -> None:
+        """Test that a dataframe larger than the memory cap is not stored."""
+
+        # Act
+        self.cache.put("big", pd.concat([self.df] * 3, ignore_index=True))
+
+        # Assert: expected result
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.memory_usage, 0)
+
+    def test_counters(self) -> None:
+        """Test that the hits, misses and evictions are counted."""
+
+        # Act
+        self.cache.get("a")
+        self.cache.put("a", self.df)
+        self.cache.get("a")
+        self.cache.put("b", self.df.copy())
+        self.cache.put("c", self.df.copy())
+
+        # Assert: expected result
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_concurrent_sessions(self) -> None:
+        """Test that the memory is accounted for when many threads share the cache."""
+
+        # Act
+        def session(n: int) -> None:
+            for i in range(50):
+                key = str((n + i) % 7)
+                if self.cache.get(key) is None:
+                    self.cache.put(key, self.df)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(session, range(8)))
+
+        # Assert: expected result
+        self.assertEqual(self.cache.memory_usage, len(self.cache) * self.df_size)
+        self.assertLessEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.hits + self.cache.misses, 8 * 50)
+
+    def test_get_shared_cache(self) -> None:
+        """Test that one cache is kept per memory cap."""
+
+        # Assert: expected result
+        self.assertIs(get_shared_cache(1), get_shared_cache(1))
+        self.assertIsNot(get_shared_cache(1), get_shared_cache(2))
+
+
+class TestLoadDataset(unittest.TestCase):
+    """Class containing the tests for the cached loading of uploaded files."""
+
+    def setUp(self) -> None:
+        """Setting up an in-memory CSV file and an empty cache."""
+        self.loaded_file = io.BytesIO(b"int_col,text_col\n1,a\n2,b\n")
+        self.cache = DataFrameCache(max_memory_mb=1)
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.loaded_file, self.cache
+
+    def test_load_without_cache(self) -> None:
+        """Test that the file is parsed when no cache is given."""
+
+        # Expected
+        expected = pd.DataFrame({"int_col": [1, 2], "text_col": ["a", "b"]})
+
+        # Act
+        result = load_dataset("file.csv", self.loaded_file)
+
+        # Assert: expected result
+        pd_testing.assert_frame_equal(result.df, expected)
+
+    def test_load_reuses_cache(self) -> None:
+        """Test that a second load of the same content returns the cached dataset."""
+
+        # Act
+        first = load_dataset("file.csv", self.loaded_file, cache=self.cache)
+        second = load_dataset("file.csv", self.loaded_file, cache=self.cache)
+
+        # Assert: expected result
+        self.assertIs(first, second)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_load_options_in_key(self) -> None:
+        """Test that loading other columns of the same content parses the file again."""
+
+        # Act
+        first = load_dataset("file.csv", self.loaded_file, cache=self.cache)
+        second = load_dataset(
+            "file.csv", self.loaded_file, cache=self.cache, columns=["int_col"]
+        )
+
+        # Assert: expected result
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.cache), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+import pandas as pd
+from plotly.graph_objs._figure import Figure
+from src.charts import get_top_occurrences, plot_occurrences
+from src.settings import FormatBarPlot
+
+
+class TestCharts(unittest.TestCase):
+    """Class containing the tests for the bar charts of occurrences."""
+
+    def setUp(self) -> None:
+        """Setting up the occurrences of a high-cardinality column and the parameters."""
+
+        # Instantiated occurrences and parameters
+        self.occurrences = pd.Series(
+            range(100, 0, -1), index=[f"id_{i}" for i in range(100)], name="occurrence"
+        )
+        self.params = FormatBarPlot(
+            Y_AXIS_LABEL="y_axis_label",
+            AXIS_FONT_SIZE=14,
+            TICK_FONT_SIZE=16,
+            CATEGORY_ORDER="total descending",
+            TEMPLATE="simple_white",
+            TITLE="title",
+            MAX_BARS=10,
+            MAX_CARDINALITY=50,
+        )
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.occurrences, self.params
+
+    def test_get_top_occurrences(self) -> None:
+        """Test that the rarest values are folded into one "Other" bar."""
+
+        # Act
+        result = get_top_occurrences(self.occurrences, self.params.MAX_BARS)
+
+        # Assert: expected result
+        self.assertEqual(len(result), self.params.MAX_BARS)
+        self.assertEqual(result.index[-1], "Other")
+        self.assertEqual(result.sum(), self.occurrences.sum())
+        self.assertListEqual(result.iloc[:-1].tolist(), list(range(100, 91, -1)))
+
+    def test_get_top_occurrences_small(self) -> None:
+        """Test that columns within the budget keep all of their values."""
+
+        # Act
+        result = get_top_occurrences(self.occurrences.head(5), self.params.MAX_BARS)
+
+        # Assert: expected result
+        pd.testing.assert_series_equal(result, self.occurrences.head(5))
+
+    def test_get_top_occurrences_partial(self) -> None:
+        """Test that the values missing from partial occurrences go to the "Other" bar."""
+
+        # Act
+        result = get_top_occurrences(
+            self.occurrences.head(5), self.params.MAX_BARS, 100
+        )
+
+        # Assert: expected result
+        self.assertEqual(result.index[-1], "Other")
+        self.assertEqual(result.sum(), 100)
+        self.assertListEqual(result.iloc[:-1].tolist(), list(range(100, 95, -1)))
+
+    def test_plot_occurrences(self) -> None:
+        """Test that the number of bars is bounded by the chart budget."""
+
+        for n_values in [5, 40, 100]:
+            with self.subTest(n_values=n_values):
+                # Act
+                result = plot_occurrences(
+                    self.occurrences.head(n_values), "col", self.params
+                )
+
+                # Assert: type of output
+                self.assertIsInstance(result, Figure)
+                # Assert: bounded number of bars
+                self.assertLessEqual(len(result.data[0].x), self.params.MAX_BARS)
+
+    def test_plot_occurrences_summary(self) -> None:
+        """Test that the summary counts every distinct value once."""
+
+        # Act
+        result = plot_occurrences(self.occurrences, "col", self.params)
+
+        # Assert: expected result
+        self.assertEqual(result.data[0].y.sum(), len(self.occurrences))
+
+    def test_plot_occurrences_partial(self) -> None:
+        """Test that partial occurrences are shown as bars rather than summarised."""
+
+        # Act
+        result = plot_occurrences(
+            self.occurrences, "col", self.params, self.occurrences.sum() + 100
+        )
+
+        # Assert: expected result
+        self.assertEqual(len(result.data[0].y), self.params.MAX_BARS)
+        self.assertEqual(result.data[0].y.sum(), self.occurrences.sum() + 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -268,6 +268,23 @@ class TestMethodsDataset(ABC):
         # Assert: expected result
         pd_testing.assert_frame_equal(result, expected)
 
+    def test_incremental_with_datetime(self):
+        """Test that converted columns are reused and the other columns are not copied."""
+
+        # Act
+        first = self.dataset.with_datetime(self.string_to_date_cols)
+        second = self.dataset.with_datetime(self.string_to_date_cols)
+
+        # Assert: expected result
+        for col in self.string_to_date_cols:
+            self.assertTrue(
+                np.shares_memory(first.df[col].values, second.df[col].values)
+            )
+        for col in self.dataset.df.select_dtypes(np.float64).columns:
+            self.assertTrue(
+                np.shares_memory(second.df[col].values, self.dataset.df[col].values)
+            )
+
 
 class TestEmptyDataFrame(TestMethodsDataset, unittest.TestCase):
     """Test the methods of Dataset with an empty dataframe as input."""
@@ -0,0 +1,94 @@
+import unittest
+
+import pandas as pd
+from src.dataflow import Dataflow
+
+
+class TestDataflow(unittest.TestCase):
+    """Class containing the tests for the methods of the Dataflow class."""
+
+    def setUp(self) -> None:
+        """Setting up a Dataflow and a counter of the computations."""
+
+        # Instantiated Dataflow class and parameters
+        self.dataflow = Dataflow()
+        self.calls = []
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.dataflow, self.calls
+
+    def compute(self, value: int) -> pd.DataFrame:
+        """Return a dataframe with the value, recording the call."""
+        self.calls.append(value)
+        return pd.DataFrame({"col": [value]})
+
+    def test_node(self) -> None:
+        """Test that a node is only recomputed when its inputs change."""
+
+        # Act
+        first = self.dataflow.node("a", lambda: self.compute(1), key="x", n_rows=5)
+        second = self.dataflow.node("a", lambda: self.compute(2), key="x", n_rows=5)
+        third = self.dataflow.node("a", lambda: self.compute(3), key="x", n_rows=10)
+
+        # Assert: expected result
+        self.assertIs(first, second)
+        self.assertEqual(third["col"][0], 3)
+        self.assertListEqual(self.calls, [1, 3])
+        self.assertEqual(self.dataflow.hits, 1)
+        self.assertEqual(self.dataflow.misses, 2)
+
+    def test_get_put(self) -> None:
+        """Test that a stored node is only returned for the same inputs."""
+
+        # Act
+        self.dataflow.put("a", 1, key="x")
+
+        # Assert: expected result
+        self.assertEqual(self.dataflow.get("a", key="x"), 1)
+        self.assertIsNone(self.dataflow.get("a", key="y"))
+        self.assertIsNone(self.dataflow.get("b", key="x"))
+
+    def test_iter_nodes(self) -> None:
+        """Test that only the nodes whose inputs changed are computed, together."""
+
+        # Expected
+        expected = [(1, "b"), (0, "new_a"), (2, "new_c")]
+        batches = []
+
+        def compute(missing):
+            batches.append(missing)
+            for m, n in enumerate(missing):
+                yield m, f"new_{'abc'[n]}"
+
+        # Act
+        self.dataflow.put("b", "b", key="x")
+        result = list(self.dataflow.iter_nodes(["a", "b", "c"], compute, key="x"))
+
+        # Assert: expected result
+        self.assertListEqual(result, expected)
+        self.assertListEqual(batches, [[0, 2]])
+        self.assertListEqual(
+            list(self.dataflow.iter_nodes(["a"], compute, key="x")), [(0, "new_a")]
+        )
+        self.assertEqual(len(batches), 1)
+
+    def test_prune(self) -> None:
+        """Test that the nodes not used by the last run are dropped."""
+
+        # Act
+        self.dataflow.start()
+        self.dataflow.put("a", 1, key="x")
+        self.dataflow.put("b", 2, key="x")
+        self.dataflow.start()
+        self.dataflow.get("a", key="x")
+        self.dataflow.prune()
+
+        # Assert: expected result
+        self.assertIn("a", self.dataflow)
+        self.assertNotIn("b", self.dataflow)
+        self.assertEqual(len(self.dataflow), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import warnings
 from abc import ABC, abstractmethod
 from datetime import datetime
 
@@ -6,7 +7,8 @@ import numpy as np
 import pandas as pd
 import pandas.api.types as ptypes
 from plotly.graph_objs._figure import Figure
-from src.datetime import DateColumn
+from src.datetime import DateColumn, DateProfile, get_future_cutoff, parse_datetime
+from src.profiling import partition_column
 from src.settings import FormatBarPlot, ParamsSections
 
 
@@ -294,6 +296,62 @@ class TestMethodsValidDateColumn(TestMethodsDate, unittest.TestCase):
         # Assert: upper bound for sum of percentages
         self.assertLessEqual(result.percentage.sum(), expected_upper_bound_perc)
 
+    def test_valid_future(self):
+        """Test that the dates in the future are the ones from tomorrow on."""
+
+        # Condition test: dates at the end of today and the start of tomorrow
+        cutoff = get_future_cutoff()
+        nanoseconds = np.array([cutoff - 1, cutoff, cutoff + 1], dtype=np.int64)
+
+        # Act
+        result = DateProfile.from_nanoseconds(nanoseconds)
+
+        # Assert: expected result
+        self.assertEqual(result.n_future, 2)
+        self.assertEqual(
+            DateProfile.from_nanoseconds(nanoseconds, future=cutoff + 1).n_future, 1
+        )
+
+    def test_valid_nanosecond_metrics(self):
+        """Test that the integer arithmetic matches the datetime accessors."""
+
+        # Condition test: dates around midnight, before 1970 and with a time zone
+        serie = pd.concat(
+            [
+                pd.Series(pd.date_range("1899-12-30 23:00", periods=200, freq="37H")),
+                pd.Series(pd.to_datetime(["1970-01-01 23:59:59", None])),
+            ],
+            ignore_index=True,
+        )
+
+        for tz in [None, "America/Bogota"]:
+            with self.subTest(tz=tz):
+                values = serie if tz is None else serie.dt.tz_localize(tz)
+                date_class = DateColumn("dates", values)
+
+                # Expected
+                expected = [
+                    int(values.dt.weekday.isin([5, 6]).sum()),
+                    int(values.dt.weekday.isin([0, 1, 2, 3, 4]).sum()),
+                    int((values.dt.date == datetime(1900, 1, 1).date()).sum()),
+                    int((values.dt.date == datetime(1970, 1, 1).date()).sum()),
+                    values.min(),
+                    values.max(),
+                ]
+
+                # Act
+                result = [
+                    date_class.get_weekend(),
+                    date_class.get_weekday(),
+                    date_class.get_empty_1900(),
+                    date_class.get_empty_1970(),
+                    date_class.get_min(),
+                    date_class.get_max(),
+                ]
+
+                # Assert: expected result
+                self.assertListEqual(result, expected)
+
 
 class TestMethodsEmptyDateColumn(TestMethodsDate, unittest.TestCase):
     """Class containing the setup and customised tests for the scenario of empty serie as input."""
@@ -409,5 +467,75 @@ class TestMethodsNullDateColumn(TestMethodsDate, unittest.TestCase):
         )
 
 
+class TestMethodsPartitionedValidDateColumn(TestMethodsValidDateColumn):
+    """Class running the same tests on the DateColumn profiled by partitions of 2 rows."""
+
+    def setUp(self) -> None:
+        """Setting up the merged partial states of the DateColumn before each test."""
+        super().setUp()
+        self.date_class = partition_column(self.date_class, partition_rows=2)
+
+
+class TestMethodsPartitionedEmptyDateColumn(TestMethodsEmptyDateColumn):
+    """Class running the same tests on the DateColumn profiled by partitions of 2 rows."""
+
+    def setUp(self) -> None:
+        """Setting up the merged partial states of the DateColumn before each test."""
+        super().setUp()
+        self.date_class = partition_column(self.date_class, partition_rows=2)
+
+
+class TestMethodsPartitionedNullDateColumn(TestMethodsNullDateColumn):
+    """Class running the same tests on the DateColumn profiled by partitions of 2 rows."""
+
+    def setUp(self) -> None:
+        """Setting up the merged partial states of the DateColumn before each test."""
+        super().setUp()
+        self.date_class = partition_column(self.date_class, partition_rows=2)
+
+
+class TestParseDatetime(unittest.TestCase):
+    """Class containing the tests comparing the parser with the coercing pandas one."""
+
+    def test_parse_datetime(self) -> None:
+        """Test that the parser gives the result of `pd.to_datetime(errors="coerce")`."""
+
+        for name, values in [
+            ("iso", ["2021-01-01", "2021-02-03", None, "2021-01-01"] * 30),
+            ("month_first", ["01/13/2021", "02/03/2021", np.nan, "12/31/1999"]),
+            ("day_first", ["13/01/2021", "02/03/2021", "31/12/1999"]),
+            ("mixed", ["2021-01-01", "01/02/2021", "Jan 5 2021", "foo", "", "NaT"]),
+            ("time_zone", ["2021-01-01T00:00:00+02:00", "2021-01-02T00:00:00+05:00"]),
+            ("objects", [1, "2021-01-01", 3.5, None]),
+            ("empty", []),
+        ]:
+            with self.subTest(name=name):
+                # Expected
+                serie = pd.Series(values, index=range(3, 3 + len(values)), dtype=object)
+                with warnings.catch_warnings():
+                    # Both warn about the day-first dates parsed one by one
+                    warnings.simplefilter("ignore", UserWarning)
+                    expected = pd.to_datetime(serie, errors="coerce")
+
+                    # Act
+                    result = parse_datetime(serie)
+
+                # Assert: expected result
+                pd.testing.assert_series_equal(result, expected)
+
+    def test_parse_categorical(self) -> None:
+        """Test that categorical columns are parsed through their categories."""
+
+        # Expected
+        serie = pd.Series(pd.Categorical(["2021-01-01", "2021-01-02", None]))
+        expected = pd.to_datetime(serie, errors="coerce")
+
+        # Act
+        result = parse_datetime(serie)
+
+        # Assert: expected result
+        pd.testing.assert_series_equal(result, expected)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,209 @@
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pd_testing
+import pyarrow as pa
+from src.data import Dataset
+from src.formats import get_format, read_batches, read_columns, read_table
+from src.streaming import stream_dataset
+from src.test import test_data
+
+
+class TestFormats(unittest.TestCase):
+    """Class containing the tests for reading files of every supported format."""
+
+    def setUp(self) -> None:
+        """Setting up a dataframe written in every supported format."""
+
+        # Instantiated dataframe and files
+        self.df = pd.DataFrame(
+            {
+                "int_col": [1, 2, 3, 4, 5],
+                "float_col": [0.1, np.nan, 0.4, 1.0, 3.0],
+                "object_col": ["a", "a", None, "1", "b"],
+            }
+        )
+        self.files = {}
+        for file_format in ["csv", "parquet", "feather", "arrow"]:
+            buffer = io.BytesIO()
+            if file_format == "csv":
+                self.df.to_csv(buffer, index=False)
+            elif file_format == "parquet":
+                self.df.to_parquet(buffer, index=False)
+            elif file_format == "feather":
+                self.df.to_feather(buffer)
+            else:
+                table = pa.Table.from_pandas(self.df, preserve_index=False)
+                with pa.ipc.new_file(buffer, table.schema) as writer:
+                    writer.write_table(table)
+            self.files[file_format] = io.BytesIO(buffer.getvalue())
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.df, self.files
+
+    def test_get_format(self) -> None:
+        """Test that the format is taken from the file extension."""
+
+        # Assert: expected result
+        self.assertEqual(get_format("table.CSV"), "csv")
+        self.assertEqual(get_format("table.parquet"), "parquet")
+        self.assertEqual(get_format("table.feather"), "feather")
+        self.assertEqual(get_format("table.arrow"), "arrow")
+        self.assertEqual(get_format("table"), "csv")
+
+    def test_read_columns(self) -> None:
+        """Test that the column names are read for every format."""
+
+        for file_format, loaded_file in self.files.items():
+            with self.subTest(file_format=file_format):
+                # Act
+                result = read_columns(loaded_file, file_format)
+
+                # Assert: expected result
+                self.assertListEqual(result, self.df.columns.tolist())
+
+    def test_read_table(self) -> None:
+        """Test that every format gives the same dataframe as the CSV file."""
+
+        for file_format, loaded_file in self.files.items():
+            with self.subTest(file_format=file_format):
+                # Act
+                result = read_table(loaded_file, file_format)
+
+                # Assert: expected result
+                pd_testing.assert_frame_equal(result, self.df)
+
+    def test_read_table_projection(self) -> None:
+        """Test that only the requested columns are read."""
+
+        # Expected
+        expected = self.df[["float_col", "object_col"]]
+
+        for file_format, loaded_file in self.files.items():
+            with self.subTest(file_format=file_format):
+                # Act
+                result = read_table(
+                    loaded_file, file_format, columns=["float_col", "object_col"]
+                )
+
+                # Assert: expected result
+                pd_testing.assert_frame_equal(result, expected)
+
+    def test_read_batches(self) -> None:
+        """Test that the batches cover the whole file with a continuous index."""
+
+        for file_format, loaded_file in self.files.items():
+            with self.subTest(file_format=file_format):
+                # Act
+                result = list(
+                    read_batches(
+                        loaded_file,
+                        file_format,
+                        chunk_size=2,
+                        dtype=self.df.dtypes.to_dict(),
+                    )
+                )
+
+                # Assert: expected result
+                self.assertListEqual([len(chunk) for chunk in result], [2, 2, 1])
+                pd_testing.assert_frame_equal(pd.concat(result), self.df)
+
+    def test_read_memory_mapped_path(self) -> None:
+        """Test that a file given by its path is read through a memory map."""
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "table.arrow")
+            with open(path, "wb") as file:
+                file.write(self.files["arrow"].getvalue())
+
+            # Act
+            result = read_table(path, "arrow", columns=["int_col"])
+
+        # Assert: expected result
+        pd_testing.assert_frame_equal(result, self.df[["int_col"]])
+
+    def test_stream_columnar(self) -> None:
+        """Test that a columnar file can be read in chunks."""
+
+        # Act
+        result = stream_dataset(
+            "table.parquet", self.files["parquet"], chunk_size=2, file_format="parquet"
+        )
+
+        # Assert: expected result
+        self.assertEqual(result.get_n_rows(), 5)
+        self.assertEqual(result.get_text_columns(), ["object_col"])
+        self.assertEqual(result.get_numeric_column("float_col").get_missing(), 1)
+
+
+class TestArrowEngineDataFrame(test_data.TestMethodsDataset, unittest.TestCase):
+    """Test the methods of Dataset with the regular dataframe parsed by the pyarrow engine."""
+
+    def setUp(self) -> None:
+        """Setting the regular dataframe fixture parsed by both engines before each test"""
+
+        # Instantiated Dataset class and parameters
+        fixture = test_data.TestCompleteDataFrame()
+        fixture.setUp()
+        content = fixture.df.to_csv(index=False).encode()
+        self.df = pd.read_csv(io.BytesIO(content))
+        self.df_name = fixture.df_name
+        self.dataset = Dataset(
+            self.df_name, read_table(io.BytesIO(content), "csv", engine="pyarrow")
+        )
+
+        # Condition test
+        self.string_to_date_cols = fixture.string_to_date_cols
+        self.n = fixture.n
+
+        # Expected: the results of the C engine
+        expected_dataset = Dataset(self.df_name, self.df)
+        self.dtypes = expected_dataset.get_cols_dtype()
+        self.rows = expected_dataset.get_n_rows()
+        self.columns = expected_dataset.get_n_cols()
+        self.duplicates = expected_dataset.get_n_duplicates()
+        self.missings = expected_dataset.get_n_missing()
+        self.num_cols = expected_dataset.get_numeric_columns()
+        self.text_cols = expected_dataset.get_text_columns()
+        self.date_cols = expected_dataset.get_date_columns()
+        fixture.tearDown()
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test"""
+        del (
+            self.df,
+            self.df_name,
+            self.dataset,
+            self.string_to_date_cols,
+            self.n,
+            self.dtypes,
+            self.rows,
+            self.columns,
+            self.duplicates,
+            self.missings,
+            self.num_cols,
+            self.text_cols,
+            self.date_cols,
+        )
+
+    def test_frame_equal(self) -> None:
+        """Test that both engines give the same dataframe, missing values included."""
+
+        # Assert: expected result
+        pd_testing.assert_frame_equal(self.dataset.df, self.df)
+
+    def test_unsupported_options(self) -> None:
+        """Test that pd.read_csv options are rejected by the pyarrow engine."""
+
+        # Assert: expected error
+        with self.assertRaises(ValueError):
+            read_table(io.BytesIO(b"a\n1\n"), "csv", engine="pyarrow", sep=";")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,8 @@ import numpy as np
 import pandas as pd
 import pandas.api.types as ptypes
 from plotly.graph_objs._figure import Figure
-from src.numeric import NumericColumn
+from src.numeric import PERCENTILES, NumericColumn, NumericProfile
+from src.profiling import partition_column
 from src.settings import FormatHistogram, ParamsSections
 
 
@@ -177,6 +178,42 @@ class TestMethodsNumeric(ABC):
             expected = self.expected_median
             self.assertEqual(result, expected)
 
+    def test_get_percentiles(self):
+        """Test that the percentiles match the linearly interpolated pandas ones."""
+
+        # Expected
+        expected = self.serie.astype("float64").quantile(np.divide(PERCENTILES, 100))
+
+        # Act
+        result = self.numeric_class.get_percentiles()
+
+        # Assert: type of output
+        self.assertIsInstance(result, pd.Series)
+        # Assert: expected result
+        self.assertListEqual(
+            result.index.tolist(), ["p1", "p5", "p25", "p75", "p95", "p99"]
+        )
+        np.testing.assert_allclose(result.to_numpy(), expected.to_numpy())
+        np.testing.assert_allclose(
+            self.numeric_class.get_percentiles([50]).to_numpy(),
+            [self.numeric_class.get_median()],
+        )
+
+    def test_profile(self):
+        """Test that the metrics are computed once and match the getters."""
+
+        # Act
+        result = self.numeric_class.profile()
+
+        # Assert: type of output
+        self.assertIsInstance(result, NumericProfile)
+        # Assert: the profile is computed once
+        self.assertIs(self.numeric_class.profile(), result)
+        # Assert: expected result
+        self.assertEqual(result.n_missing, self.numeric_class.get_missing())
+        self.assertEqual(result.n_zeros, self.numeric_class.get_zeros())
+        self.assertEqual(result.n_negatives, self.numeric_class.get_negatives())
+
     def test_get_histogram(self):
         """Test that the output class is Figure type."""
 
@@ -288,6 +325,34 @@ class TestMethodsValidNumericColumn(TestMethodsNumeric, unittest.TestCase):
         # Assert: upper bound for sum of percentages
         self.assertLessEqual(result.percentage.sum(), expected_upper_bound_perc)
 
+    def test_valid_profile_counts(self):
+        """Test that the profile reuses the value counts when they are built first."""
+
+        # Act
+        column = NumericColumn(self.expected_name, self.serie)
+        column.get_frequent(self.params.TOP_FREQUENCY, self.params.DROP_NA)
+        result = column.profile()
+
+        # Assert: expected result
+        self.assertEqual(result.n_unique, self.expected_get_unique)
+        self.assertEqual(result.median, self.expected_median)
+        self.assertEqual(result.max, self.expected_max)
+
+    def test_valid_get_histogram(self):
+        """Test that the histogram only holds the bin counts of the values."""
+
+        # Condition test: more values than bins
+        serie = pd.Series(np.arange(10_000, dtype="float64"), name="large")
+        numeric_class = NumericColumn("large", serie)
+
+        # Act
+        result = numeric_class.get_histogram(params=self.params.PLOT).data[0]
+
+        # Assert: one bar per bin
+        self.assertEqual(len(result.x), self.params.PLOT.MAX_BINS)
+        # Assert: every value is counted once
+        self.assertEqual(result.y.sum(), len(serie))
+
 
 class TestMethodsEmptyNumericColumn(TestMethodsNumeric, unittest.TestCase):
     """Class containing the setup and customised tests for the scenario of empty serie as input."""
@@ -389,5 +454,32 @@ class TestMethodsNullNumericColumn(TestMethodsNumeric, unittest.TestCase):
         )
 
 
+class TestMethodsPartitionedValidNumericColumn(TestMethodsValidNumericColumn):
+    """Class running the same tests on the NumericColumn profiled by partitions of 2 rows."""
+
+    def setUp(self) -> None:
+        """Setting up the merged partial states of the NumericColumn before each test."""
+        super().setUp()
+        self.numeric_class = partition_column(self.numeric_class, partition_rows=2)
+
+
+class TestMethodsPartitionedEmptyNumericColumn(TestMethodsEmptyNumericColumn):
+    """Class running the same tests on the NumericColumn profiled by partitions of 2 rows."""
+
+    def setUp(self) -> None:
+        """Setting up the merged partial states of the NumericColumn before each test."""
+        super().setUp()
+        self.numeric_class = partition_column(self.numeric_class, partition_rows=2)
+
+
+class TestMethodsPartitionedNullNumericColumn(TestMethodsNullNumericColumn):
+    """Class running the same tests on the NumericColumn profiled by partitions of 2 rows."""
+
+    def setUp(self) -> None:
+        """Setting up the merged partial states of the NumericColumn before each test."""
+        super().setUp()
+        self.numeric_class = partition_column(self.numeric_class, partition_rows=2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pd_testing
+from src.data import Dataset
+from src.numeric import NumericColumn
+from src.optimisation import optimise_dataframe
+
+
+class TestOptimiseDataframe(unittest.TestCase):
+    """Class containing the tests for the compaction of the dataframe data types."""
+
+    def setUp(self) -> None:
+        """Setting up a dataframe with columns of every compactable type."""
+
+        # Instantiated dataframe and parameters
+        self.df = pd.DataFrame(
+            {
+                "small_int_col": np.array([1, -2, 3, 4, 100, 5], dtype="int64"),
+                "large_int_col": np.array([1, 2, 3, 4, 5, 2 ** 40], dtype="int64"),
+                "exact_float_col": [0.5, 0.25, np.nan, 1.0, 3.0, -2.0],
+                "float_col": [0.1, 0.2, np.nan, 1.0, 3.0, -2.0],
+                "repeated_object_col": ["a", "a", "b", np.nan, "b", "a"],
+                "unique_object_col": ["a", "b", "c", "d", "e", "f"],
+                "bool_col": [True, False, True, True, False, False],
+            }
+        )
+        self.dataset = Dataset("this_is_the_dataframe_filename", self.df)
+
+        # Act
+        self.optimised, self.report = optimise_dataframe(self.df, 0.5)
+        self.optimised_dataset = Dataset(
+            "this_is_the_dataframe_filename", self.optimised, self.report
+        )
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.df, self.dataset, self.optimised, self.report, self.optimised_dataset
+
+    def test_dtypes(self) -> None:
+        """Test that each column gets the smallest data type keeping its values."""
+
+        # Expected
+        expected = {
+            "small_int_col": "int8",
+            "large_int_col": "int64",
+            "exact_float_col": "float32",
+            "float_col": "float64",
+            "repeated_object_col": "category",
+            "unique_object_col": "object",
+            "bool_col": "bool",
+        }
+
+        # Assert: expected result
+        self.assertDictEqual(self.optimised_dataset.get_cols_dtype(), expected)
+
+    def test_values(self) -> None:
+        """Test that no value changes after the compaction."""
+
+        # Assert: expected result
+        pd_testing.assert_frame_equal(
+            self.optimised, self.df, check_dtype=False, check_categorical=False
+        )
+
+    def test_classification(self) -> None:
+        """Test that the columns are classified as before the compaction."""
+
+        # Assert: expected result
+        self.assertListEqual(
+            self.optimised_dataset.get_numeric_columns(),
+            self.dataset.get_numeric_columns(),
+        )
+        self.assertListEqual(
+            self.optimised_dataset.get_text_columns(),
+            self.dataset.get_text_columns(),
+        )
+
+    def test_text_metrics(self) -> None:
+        """Test that the text metrics of a compacted column are unchanged."""
+
+        # Act
+        expected_column = self.dataset.get_text_column("repeated_object_col")
+        column = self.optimised_dataset.get_text_column("repeated_object_col")
+
+        for method in ["get_unique", "get_missing", "get_empty", "get_lowercase"]:
+            with self.subTest(method=method):
+                # Assert: expected result
+                self.assertEqual(
+                    getattr(column, method)(), getattr(expected_column, method)()
+                )
+        self.assertEqual(column.get_mode(), expected_column.get_mode())
+
+    def test_numeric_metrics(self) -> None:
+        """Test that the numeric metrics of a column downcast to float32 are unchanged."""
+
+        # Instantiated column whose float32 sums round differently
+        serie = pd.Series(np.random.default_rng(0).integers(0, 10 ** 6, 10 ** 5) / 4)
+
+        # Expected
+        expected = NumericColumn("col", serie).profile()
+
+        # Act
+        optimised, _ = optimise_dataframe(serie.to_frame("col"))
+        result = NumericColumn("col", optimised["col"]).profile()
+
+        # Assert: expected result
+        self.assertEqual(optimised["col"].dtype, np.float32)
+        self.assertEqual(result, expected)
+
+    def test_report(self) -> None:
+        """Test that the memory report has one row per column and never grows the memory."""
+
+        # Expected
+        expected_columns = [
+            "type_before",
+            "type_after",
+            "memory_before",
+            "memory_after",
+        ]
+
+        # Assert: expected result
+        self.assertListEqual(self.report.columns.tolist(), expected_columns)
+        self.assertListEqual(self.report.index.tolist(), self.df.columns.tolist())
+        self.assertTrue((self.report.memory_after <= self.report.memory_before).all())
+        self.assertLess(
+            self.optimised_dataset.get_memory_usage(), self.dataset.get_memory_usage()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+import gc
+import threading
+import time
+import unittest
+import weakref
+
+import pandas as pd
+import pandas.testing as pd_testing
+from src.cache import DataFrameCache
+from src.data import Dataset
+from src.precompute import Precomputation
+from src.profiling import load_column_names, load_reports
+from src.settings import FormatBarPlot, FormatHistogram, ParamsSections
+
+
+class TestPrecomputation(unittest.TestCase):
+    """Class containing the tests for the background profiling of the columns."""
+
+    def setUp(self) -> None:
+        """Setting up a dataset with every kind of column and the parameters."""
+
+        # Instantiated Dataset class and parameters
+        self.dataset = Dataset(
+            "file.csv",
+            pd.DataFrame(
+                {
+                    "int_col": [1, 2, 2, 3],
+                    "float_col": [0.5, None, 1.5, 0.5],
+                    "text_col": ["a", "b", "b", None],
+                    "date_raw_col": ["2021-10-03", "2021-10-02", None, "1970-01-01"],
+                }
+            ),
+        )
+        bar_plot = FormatBarPlot(
+            Y_AXIS_LABEL="y_axis_label",
+            AXIS_FONT_SIZE=14,
+            TICK_FONT_SIZE=16,
+            CATEGORY_ORDER="total descending",
+            TEMPLATE="simple_white",
+            TITLE="title",
+        )
+        self.params = {
+            "numeric": ParamsSections(
+                DROP_NA=True,
+                TOP_FREQUENCY=5,
+                PLOT=FormatHistogram(
+                    Y_AXIS_LABEL="y_axis_label",
+                    MAX_BINS=10,
+                    AXIS_FONT_SIZE=14,
+                    TICK_FONT_SIZE=16,
+                    TEMPLATE="simple_white",
+                    TITLE="title",
+                ),
+            ),
+            "text": ParamsSections(DROP_NA=True, TOP_FREQUENCY=5, PLOT=bar_plot),
+            "date": ParamsSections(DROP_NA=True, TOP_FREQUENCY=5, PLOT=bar_plot),
+        }
+        self.cache = DataFrameCache(10)
+        self.job = Precomputation(
+            lambda: self.dataset, self.params, "key", cache=self.cache, batch_size=2
+        )
+
+    def tearDown(self) -> None:
+        """Stop the background thread and delete the variables after each test."""
+        self.job.close()
+        del self.dataset, self.params, self.cache, self.job
+
+    def test_schedule(self) -> None:
+        """Test that every scheduled column is profiled and cached in the background."""
+
+        for kind in ["numeric", "text"]:
+            with self.subTest(kind=kind):
+                # Expected
+                expected = load_reports(self.dataset, kind, self.params[kind])
+                columns = [report.col_name for report in expected]
+
+                # Act
+                futures = self.job.schedule(kind, columns)
+                results = [futures[col].result(timeout=30) for col in columns]
+
+                # Assert: expected result
+                for result, expected_report in zip(results, expected):
+                    pd_testing.assert_series_equal(
+                        result.metrics, expected_report.metrics
+                    )
+                cached = load_reports(
+                    None,
+                    kind,
+                    self.params[kind],
+                    key="key",
+                    cache=self.cache,
+                    columns=columns,
+                )
+                self.assertListEqual([report.col_name for report in cached], columns)
+
+    def test_schedule_all(self) -> None:
+        """Test that scheduling a kind without columns profiles all of them."""
+
+        # Act
+        self.job.schedule("numeric")
+        result = list(self.job.iter_reports("numeric", ["int_col", "float_col"]))
+
+        # Assert: expected result
+        self.assertListEqual(sorted(n for n, _ in result), [0, 1])
+        self.assertEqual(self.job.n_pending, 0)
+
+    def test_schedule_all_cached(self) -> None:
+        """Test that scheduling a kind already profiled does not load the dataset."""
+
+        # Instantiated job on the same cache counting the loads of the dataset
+        loads = []
+
+        def load() -> Dataset:
+            loads.append(1)
+            return self.dataset
+
+        job = Precomputation(load, self.params, "key", cache=self.cache)
+        load_column_names(self.dataset, "numeric", key="key", cache=self.cache)
+        list(self.job.iter_reports("numeric", ["int_col", "float_col"]))
+        list(self.job.iter_reports("text", ["text_col"]))
+
+        # Act
+        job.schedule("numeric")
+        # Scheduled after the numeric columns are listed, so completed after them
+        result = job.schedule("text", ["text_col"])["text_col"].result(timeout=30)
+
+        # Assert: expected result
+        self.assertEqual(result.col_name, "text_col")
+        self.assertListEqual(loads, [])
+        job.close()
+
+    def test_idle(self) -> None:
+        """Test that an idle job holds neither a thread nor the dataset, and restarts when scheduled."""
+
+        # Instantiated job reading a new Dataset for each batch
+        datasets = []
+
+        def load() -> Dataset:
+            dataset = Dataset(self.dataset.name, self.dataset.df.copy())
+            datasets.append(weakref.ref(dataset))
+            return dataset
+
+        job = Precomputation(load, self.params, "other_key", batch_size=1)
+
+        for kind, columns in [("numeric", ["int_col"]), ("text", ["text_col"])]:
+            with self.subTest(kind=kind):
+                # Act
+                result = list(job.iter_reports(kind, columns))
+                deadline = time.monotonic() + 30
+                while job.running and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                gc.collect()
+
+                # Assert: expected result
+                self.assertEqual(result[0][1].col_name, columns[0])
+                self.assertFalse(job.running)
+                self.assertEqual(job.n_pending, 0)
+                self.assertTrue(datasets)
+                self.assertTrue(all(dataset() is None for dataset in datasets))
+        job.close()
+
+    def test_converted_column(self) -> None:
+        """Test that a text column scheduled as datetime is converted first."""
+
+        # Expected
+        expected = load_reports(
+            self.dataset.with_datetime(["date_raw_col"]),
+            "date",
+            self.params["date"],
+            columns=["date_raw_col"],
+        )
+
+        # Act
+        result = list(self.job.iter_reports("date", ["date_raw_col"]))
+
+        # Assert: expected result
+        pd_testing.assert_series_equal(result[0][1].metrics, expected[0].metrics)
+
+    def test_cancel(self) -> None:
+        """Test that cancelled columns are not profiled and can be scheduled again."""
+
+        # Instantiated job whose dataset is only loaded once released
+        released = threading.Event()
+
+        def load() -> Dataset:
+            released.wait(30)
+            return self.dataset
+
+        job = Precomputation(load, self.params, "other_key", batch_size=1)
+        futures = job.schedule("numeric", ["int_col", "float_col"])
+
+        # Act
+        job.cancel()
+        released.set()
+
+        # Assert: expected result
+        self.assertTrue(futures["float_col"].cancelled())
+        self.assertListEqual(
+            list(job.iter_reports("numeric", ["int_col"], cached_only=True)), []
+        )
+        result = list(job.iter_reports("numeric", ["float_col"]))
+        self.assertEqual(result[0][1].col_name, "float_col")
+        job.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
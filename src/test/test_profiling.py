@@ -0,0 +1,309 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pd_testing
+from src.cache import DataFrameCache
+from src.data import Dataset
+from src.numeric import NumericColumn
+from src.profiling import (
+    ColumnReport,
+    get_executor,
+    iter_reports,
+    partition_column,
+    profile_columns,
+)
+from src.settings import (
+    FormatBarPlot,
+    FormatHistogram,
+    ParamsApproximation,
+    ParamsSections,
+)
+
+
+class TestProfileColumns(unittest.TestCase):
+    """Class containing the tests comparing the reports of every executor."""
+
+    def setUp(self) -> None:
+        """Setting up a dataset with every kind of column and the parameters."""
+
+        # Instantiated Dataset class and parameters
+        df = pd.DataFrame(
+            {
+                "int_col": np.arange(100) % 7 - 2,
+                "float_col": np.where(
+                    np.arange(100) % 9 == 0, np.nan, np.arange(100) / 4
+                ),
+                "text_col": ["a", "B", "", "  ", None] * 20,
+                "category_col": pd.Categorical(["x", "y"] * 50),
+                "date_col": [f"2021-10-{day % 28 + 1:02d}" for day in range(100)],
+            }
+        )
+        self.dataset = Dataset("file.csv", df).with_datetime(["date_col"])
+        bar_plot = FormatBarPlot(
+            Y_AXIS_LABEL="y_axis_label",
+            AXIS_FONT_SIZE=14,
+            TICK_FONT_SIZE=16,
+            CATEGORY_ORDER="total descending",
+            TEMPLATE="simple_white",
+            TITLE="title",
+        )
+        self.params = {
+            "numeric": ParamsSections(
+                DROP_NA=True,
+                TOP_FREQUENCY=5,
+                PLOT=FormatHistogram(
+                    Y_AXIS_LABEL="y_axis_label",
+                    MAX_BINS=10,
+                    AXIS_FONT_SIZE=14,
+                    TICK_FONT_SIZE=16,
+                    TEMPLATE="simple_white",
+                    TITLE="title",
+                ),
+            ),
+            "text": ParamsSections(DROP_NA=True, TOP_FREQUENCY=5, PLOT=bar_plot),
+            "date": ParamsSections(DROP_NA=True, TOP_FREQUENCY=5, PLOT=bar_plot),
+        }
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.dataset, self.params
+
+    def test_get_executor(self) -> None:
+        """Test that one pool is kept per configuration."""
+
+        # Assert: expected result
+        self.assertIsNone(get_executor("serial"))
+        self.assertIs(get_executor("thread", 2), get_executor("thread", 2))
+
+    def test_serial(self) -> None:
+        """Test that every column of the kind is reported, in column order."""
+
+        for kind, expected in [
+            ("numeric", ["int_col", "float_col"]),
+            ("text", ["text_col", "category_col"]),
+            ("date", ["date_col"]),
+        ]:
+            with self.subTest(kind=kind):
+                # Act
+                result = profile_columns(self.dataset, kind, self.params[kind])
+
+                # Assert: type of output
+                self.assertIsInstance(result[0], ColumnReport)
+                # Assert: expected result
+                self.assertListEqual([report.col_name for report in result], expected)
+
+    def test_executors(self) -> None:
+        """Test that the thread and process pools give the serial reports."""
+
+        for executor in ["thread", "process"]:
+            for kind in ["numeric", "text", "date"]:
+                with self.subTest(executor=executor, kind=kind):
+                    # Expected
+                    expected = profile_columns(self.dataset, kind, self.params[kind])
+
+                    # Act
+                    result = profile_columns(
+                        self.dataset, kind, self.params[kind], get_executor(executor, 2)
+                    )
+
+                    # Assert: expected result
+                    for report, expected_report in zip(result, expected):
+                        self.assertEqual(report.col_name, expected_report.col_name)
+                        pd_testing.assert_series_equal(
+                            report.metrics, expected_report.metrics
+                        )
+                        pd_testing.assert_frame_equal(
+                            report.frequent, expected_report.frequent
+                        )
+                        self.assertEqual(
+                            report.chart.to_json(), expected_report.chart.to_json()
+                        )
+
+    def test_partitioned(self) -> None:
+        """Test that the reports of partitioned columns match the single-pass ones."""
+
+        for executor in ["serial", "thread", "process"]:
+            for kind in ["numeric", "text", "date"]:
+                with self.subTest(executor=executor, kind=kind):
+                    # Expected
+                    expected = profile_columns(self.dataset, kind, self.params[kind])
+
+                    # Act
+                    result = profile_columns(
+                        self.dataset,
+                        kind,
+                        self.params[kind],
+                        get_executor(executor, 2),
+                        partition_rows=30,
+                    )
+
+                    # Assert: expected result
+                    for report, expected_report in zip(result, expected):
+                        pd_testing.assert_series_equal(
+                            report.metrics, expected_report.metrics, check_dtype=False
+                        )
+                        # Values tied on their occurrences can be kept in any order
+                        self.assertListEqual(
+                            report.frequent.occurrence.tolist(),
+                            expected_report.frequent.occurrence.tolist(),
+                        )
+
+    def test_iter_reports(self) -> None:
+        """Test that every column is yielded once, the cached ones first."""
+
+        # Instantiated cache holding the report of the last column
+        cache = DataFrameCache(1)
+        columns = ["int_col", "float_col"]
+        next(
+            iter_reports(
+                self.dataset,
+                "numeric",
+                self.params["numeric"],
+                columns[1:],
+                key="key",
+                cache=cache,
+            )
+        )
+
+        for executor in ["serial", "thread", "process"]:
+            with self.subTest(executor=executor):
+                # Act
+                result = list(
+                    iter_reports(
+                        self.dataset,
+                        "numeric",
+                        self.params["numeric"],
+                        columns,
+                        get_executor(executor, 2),
+                        key=f"{executor}_key",
+                        cache=cache,
+                    )
+                )
+                cached = list(
+                    iter_reports(
+                        self.dataset,
+                        "numeric",
+                        self.params["numeric"],
+                        columns,
+                        key="key",
+                        cache=cache,
+                        cached_only=True,
+                    )
+                )
+
+                # Assert: expected result
+                self.assertListEqual(
+                    sorted((n, report.col_name) for n, report in result),
+                    list(enumerate(columns)),
+                )
+                self.assertListEqual(
+                    [(n, report.col_name) for n, report in cached], [(1, "float_col")]
+                )
+
+    def test_iter_reports_closed(self) -> None:
+        """Test that an iterator closed early stops yielding reports."""
+
+        # Act
+        reports = iter_reports(
+            self.dataset,
+            "text",
+            self.params["text"],
+            ["text_col", "category_col"] * 20,
+            get_executor("thread", 1),
+        )
+        first = next(reports)
+        reports.close()
+
+        # Assert: expected result
+        self.assertIn(first[1].col_name, ["text_col", "category_col"])
+        with self.assertRaises(StopIteration):
+            next(reports)
+
+    def test_exact_unique(self) -> None:
+        """Test that the number of unique values is exact once the value counts are built."""
+
+        # Instantiated approximation of the columns longer than 10 rows
+        approximation = ParamsApproximation(
+            ENABLED=True, ERROR=0.01, EXACT_THRESHOLD=10, FREQUENT_CAPACITY=10
+        )
+
+        for kind, expected in [("text", 4), ("date", 28)]:
+            with self.subTest(kind=kind):
+                # Act
+                result = profile_columns(
+                    self.dataset, kind, self.params[kind], approximation=approximation
+                )
+
+                # Assert: expected result
+                self.assertEqual(result[0].metrics["Number of Unique Values"], expected)
+
+    def test_partition_column(self) -> None:
+        """Test that the merged moments are within rounding of the single-pass ones."""
+
+        # Instantiated column with values of very different magnitudes
+        column = NumericColumn(
+            "col", pd.Series(np.random.default_rng(0).lognormal(5, 3, 10_000))
+        )
+
+        # Act
+        result = partition_column(column, 999, get_executor("process", 2))
+
+        # Assert: expected result
+        self.assertEqual(result.get_median(), column.get_median())
+        self.assertEqual(result.get_max(), column.get_max())
+        self.assertAlmostEqual(result.get_mean() / column.get_mean(), 1, places=12)
+        self.assertAlmostEqual(result.get_std() / column.get_std(), 1, places=12)
+
+    def test_partition_histogram(self) -> None:
+        """Test that the histogram of a partitioned column is counted exactly."""
+
+        # Instantiated column longer than the quantile sketch holds exactly
+        column = NumericColumn(
+            "col", pd.Series(np.random.default_rng(0).normal(size=300_000))
+        )
+        params = FormatHistogram(
+            Y_AXIS_LABEL="y_axis_label",
+            MAX_BINS=20,
+            AXIS_FONT_SIZE=14,
+            TICK_FONT_SIZE=16,
+            TEMPLATE="simple_white",
+            TITLE="title",
+        )
+
+        # Expected
+        expected = column.get_histogram(params).data[0]
+
+        # Act
+        result = partition_column(column, 70_000, max_bins=20).get_histogram(params)
+
+        # Assert: expected result
+        np.testing.assert_array_equal(result.data[0].y, expected.y)
+        np.testing.assert_array_equal(result.data[0].x, expected.x)
+        self.assertEqual(result.layout.title.text, "title")
+
+        # Assert: binned from the sketch and labelled otherwise
+        result = partition_column(column, 70_000).get_histogram(params)
+        self.assertEqual(result.layout.title.text, "title (approximate)")
+
+    def test_quantile_estimate_label(self) -> None:
+        """Test that the estimated quantiles are labelled with their rank error."""
+
+        # Instantiated dataset longer than the quantile sketch holds exactly
+        dataset = Dataset(
+            "file.csv",
+            pd.DataFrame({"col": np.random.default_rng(0).normal(size=300_000)}),
+        )
+
+        # Act
+        result = profile_columns(
+            dataset, "numeric", self.params["numeric"], partition_rows=70_000
+        )
+
+        # Assert: expected result
+        self.assertIn("Median Value (estimate, rank ±1.65%)", result[0].metrics.index)
+        self.assertEqual(result[0].percentiles.name, "value (estimate, rank ±1.65%)")
+
+
+if __name__ == "__main__":
+    unittest.main()
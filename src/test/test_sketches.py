@@ -0,0 +1,355 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from src.data import Dataset
+from src.numeric import NumericColumn
+from src.sketches import (
+    QUANTILE_RANK_ERROR,
+    FrequentValues,
+    HyperLogLog,
+    QuantileSketch,
+    count_distinct,
+    hash_values,
+    top_values,
+)
+from src.text import TextColumn
+
+
+class TestHyperLogLog(unittest.TestCase):
+    """Class containing the tests for the distinct count sketch."""
+
+    def setUp(self) -> None:
+        """Setting up the hashes of 200,000 distinct values seen twice."""
+
+        # Instantiated hashes and parameters
+        values = pd.Series(np.arange(200_000))
+        self.hashes = hash_values(pd.concat([values, values]))
+        self.n_distinct = 200_000
+        self.error = 0.01
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.hashes, self.n_distinct, self.error
+
+    def test_exact_below_threshold(self) -> None:
+        """Test that the distinct hashes are counted exactly below the threshold."""
+
+        # Act
+        sketch = HyperLogLog(self.error, threshold=self.n_distinct)
+        sketch.update(self.hashes)
+
+        # Assert: expected result
+        self.assertTrue(sketch.is_exact)
+        self.assertEqual(sketch.count(), self.n_distinct)
+
+    def test_estimate_above_threshold(self) -> None:
+        """Test that the estimate is within three standard errors above the threshold."""
+
+        # Act
+        sketch = HyperLogLog(self.error, threshold=1000)
+        sketch.update(self.hashes)
+
+        # Assert: expected result
+        self.assertFalse(sketch.is_exact)
+        self.assertAlmostEqual(
+            sketch.count() / self.n_distinct, 1, delta=3 * self.error
+        )
+        self.assertLess(sketch.nbytes, 100_000)
+
+    def test_merge(self) -> None:
+        """Test that merging exact and estimated sketches gives the sketch of all hashes."""
+
+        for threshold in [None, 1000]:
+            with self.subTest(threshold=threshold):
+                # Expected
+                expected = HyperLogLog(self.error, threshold)
+                expected.update(self.hashes)
+
+                # Act
+                result = HyperLogLog(self.error, threshold)
+                result.update(self.hashes[:250_000])
+                other = HyperLogLog(self.error, threshold)
+                other.update(self.hashes[150_000:])
+                result.merge(other)
+
+                # Assert: expected result
+                self.assertEqual(result.count(), expected.count())
+
+    def test_merge_other_error(self) -> None:
+        """Test that sketches with different errors cannot be merged."""
+
+        # Assert: expected result
+        with self.assertRaises(ValueError):
+            HyperLogLog(0.01).merge(HyperLogLog(0.05))
+
+    def test_count_distinct(self) -> None:
+        """Test that missing values are counted as one value unless dropped."""
+
+        # Instantiated serie with missing values
+        serie = pd.Series(["a", "b", None, "a", None])
+
+        # Assert: expected result
+        self.assertEqual(count_distinct(serie), (serie.nunique(dropna=False), False))
+        self.assertEqual(count_distinct(serie, dropna=True), (serie.nunique(), False))
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Class containing the tests for the quantile sketch."""
+
+    def setUp(self) -> None:
+        """Setting up 200,000 values of very different magnitudes."""
+
+        # Instantiated values and parameters
+        self.values = np.random.default_rng(0).lognormal(5, 3, 200_000)
+        self.quantiles = np.array([0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99])
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.values, self.quantiles
+
+    def get_rank_errors(self, result: np.ndarray) -> np.ndarray:
+        """Return the difference between the ranks of the results and the quantiles."""
+        ranks = np.searchsorted(np.sort(self.values), result) / len(self.values)
+        return np.abs(ranks - self.quantiles)
+
+    def test_exact_below_threshold(self) -> None:
+        """Test that the quantiles are exact below the threshold."""
+
+        # Act
+        sketch = QuantileSketch(threshold=len(self.values))
+        sketch.update(self.values)
+
+        # Assert: expected result
+        self.assertTrue(sketch.is_exact)
+        np.testing.assert_allclose(
+            sketch.quantiles(self.quantiles), np.quantile(self.values, self.quantiles)
+        )
+
+    def test_estimate_above_threshold(self) -> None:
+        """Test that the estimated quantiles are within the rank error in bounded memory."""
+
+        # Act
+        sketch = QuantileSketch(threshold=1000, seed=0)
+        for chunk in np.array_split(self.values, 20):
+            sketch.update(chunk)
+
+        # Assert: expected result
+        self.assertFalse(sketch.is_exact)
+        self.assertEqual(len(sketch), len(self.values))
+        self.assertTrue(
+            (
+                self.get_rank_errors(sketch.quantiles(self.quantiles))
+                < QUANTILE_RANK_ERROR
+            ).all()
+        )
+        self.assertLess(sketch.nbytes, 3 * 200 * 8 + 1000)
+
+    def test_merge(self) -> None:
+        """Test that merged sketches are within the rank error of all the values."""
+
+        # Act
+        sketch = QuantileSketch(threshold=1000, seed=0)
+        for chunk in np.array_split(self.values, 20):
+            partial = QuantileSketch(threshold=1000, seed=1)
+            partial.update(chunk)
+            sketch.merge(partial)
+
+        # Assert: expected result
+        self.assertEqual(len(sketch), len(self.values))
+        self.assertTrue(
+            (
+                self.get_rank_errors(sketch.quantiles(self.quantiles))
+                < QUANTILE_RANK_ERROR
+            ).all()
+        )
+        with self.assertRaises(ValueError):
+            sketch.merge(QuantileSketch(k=100))
+
+    def test_empty(self) -> None:
+        """Test that an empty sketch has NaN quantiles."""
+
+        # Assert: expected result
+        self.assertTrue(np.isnan(QuantileSketch().quantiles(self.quantiles)).all())
+
+
+class TestFrequentValues(unittest.TestCase):
+    """Class containing the tests for the frequent values sketch."""
+
+    def setUp(self) -> None:
+        """Setting up 200,000 values with a long tail and some missing values."""
+
+        # Instantiated serie and parameters
+        values = np.random.default_rng(0).zipf(1.5, 200_000).astype("float64")
+        values[::100] = np.nan
+        self.serie = pd.Series(values)
+        self.expected = self.serie.value_counts(dropna=False)
+        self.capacity = 100
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.serie, self.expected, self.capacity
+
+    def assert_bounds(self, sketch: FrequentValues) -> None:
+        """Assert that the counts are lower bounds within the error of the occurrences."""
+        counts = sketch.get_counts(dropna=False)
+        expected = self.expected[counts.index]
+        self.assertTrue((counts <= expected).all())
+        self.assertTrue((expected - counts <= sketch.error).all())
+        self.assertLessEqual(sketch.error, len(self.serie) / (self.capacity + 1))
+        # Every value more frequent than the error keeps its counter
+        self.assertTrue(
+            self.expected[self.expected > sketch.error].index.isin(counts.index).all()
+        )
+
+    def test_exact_below_capacity(self) -> None:
+        """Test that the values are counted exactly below the capacity."""
+
+        # Act
+        sketch = top_values(self.serie, capacity=len(self.expected))
+
+        # Assert: expected result
+        self.assertTrue(sketch.is_exact)
+        pd.testing.assert_series_equal(
+            sketch.get_counts(dropna=False).sort_index(), self.expected.sort_index()
+        )
+
+    def test_estimate_above_capacity(self) -> None:
+        """Test that the counts are within the error bound in bounded memory."""
+
+        # Act
+        sketch = FrequentValues(self.capacity)
+        for chunk in np.array_split(self.serie, 20):
+            sketch.update(chunk.value_counts(dropna=False))
+
+        # Assert: expected result
+        self.assertFalse(sketch.is_exact)
+        self.assertEqual(len(sketch), len(self.serie))
+        self.assertLessEqual(len(sketch.get_counts()), self.capacity)
+        self.assert_bounds(sketch)
+
+    def test_merge(self) -> None:
+        """Test that merged sketches keep the error bound of all the values."""
+
+        # Act
+        sketch = FrequentValues(self.capacity)
+        for chunk in np.array_split(self.serie, 20):
+            partial = FrequentValues(self.capacity)
+            partial.update(chunk.value_counts(dropna=False))
+            sketch.merge(partial)
+
+        # Assert: expected result
+        self.assertEqual(len(sketch), len(self.serie))
+        self.assert_bounds(sketch)
+        with self.assertRaises(ValueError):
+            sketch.merge(FrequentValues(10))
+
+    def test_get_frequent(self) -> None:
+        """Test that the missing values are counted exactly and dropped from the percentages."""
+
+        # Expected
+        n_missing = int(self.serie.isna().sum())
+
+        # Act
+        sketch = top_values(self.serie, self.capacity)
+        result = sketch.get_frequent(5)
+
+        # Assert: expected result
+        self.assertEqual(
+            sketch.get_n_values(dropna=False) - sketch.get_n_values(), n_missing
+        )
+        self.assertEqual(sketch.get_counts(dropna=False)[np.nan], n_missing)
+        self.assertListEqual(result.value.tolist(), [1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(
+            result.percentage[0],
+            round(result.occurrence[0] / sketch.get_n_values(), 4),
+        )
+
+
+class TestApproximateCounts(unittest.TestCase):
+    """Class containing the tests for the estimated counts of datasets and columns."""
+
+    def setUp(self) -> None:
+        """Setting up a dataset with 100,000 distinct rows seen 3 times."""
+
+        # Instantiated Dataset class and parameters
+        values = np.tile(np.arange(100_000), 3)
+        self.df = pd.DataFrame({"int_col": values, "text_col": values.astype(str)})
+        self.dataset = Dataset("file.csv", self.df)
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.df, self.dataset
+
+    def test_n_duplicates_estimate(self) -> None:
+        """Test that the duplicated rows are counted exactly from the row hashes above the threshold."""
+
+        # Expected
+        expected = self.dataset.get_n_duplicates()
+
+        # Act
+        exact = self.dataset.get_n_duplicates_estimate(threshold=len(self.df))
+        hashed = self.dataset.get_n_duplicates_estimate(threshold=1000)
+
+        # Assert: expected result
+        self.assertEqual(exact, (expected, False))
+        self.assertEqual(hashed, (expected, False))
+
+    def test_n_duplicates_unique(self) -> None:
+        """Test that a frame of unique rows has no duplicated rows above the threshold."""
+
+        # Act
+        result = Dataset(
+            "file.csv", self.df.drop_duplicates()
+        ).get_n_duplicates_estimate(threshold=1000)
+
+        # Assert: expected result
+        self.assertEqual(result, (0, False))
+
+    def test_unique_estimate(self) -> None:
+        """Test that the unique values are estimated until the exact counts are known."""
+
+        for column in [
+            NumericColumn("int_col", self.df.int_col),
+            TextColumn("text_col", self.df.text_col),
+        ]:
+            with self.subTest(column=column.get_name()):
+                # Act
+                estimate, estimated = column.get_unique_estimate(threshold=1000)
+
+                # Assert: expected result
+                self.assertTrue(estimated)
+                self.assertAlmostEqual(estimate / 100_000, 1, delta=0.03)
+                column.get_unique()
+                self.assertEqual(
+                    column.get_unique_estimate(threshold=1000), (100_000, False)
+                )
+
+    def test_frequent_estimate(self) -> None:
+        """Test that the frequency table of an in-memory column is exact whatever the capacity."""
+
+        # Instantiated values 0 to 4 seen 1,000 more times, among 100,000 distinct values
+        frequent_values = np.arange(5).repeat(1000)
+        for column in [
+            NumericColumn(
+                "int_col", pd.concat([self.df.int_col, pd.Series(frequent_values)])
+            ),
+            TextColumn(
+                "text_col",
+                pd.concat([self.df.text_col, pd.Series(frequent_values.astype(str))]),
+            ),
+        ]:
+            with self.subTest(column=column.get_name()):
+                # Act
+                frequent, error = column.get_frequent_estimate(10, capacity=1000)
+
+                # Assert: expected result
+                self.assertEqual(error, 0)
+                self.assertListEqual(
+                    sorted(frequent.value.astype(str)[:5]), ["0", "1", "2", "3", "4"]
+                )
+                self.assertListEqual(frequent.occurrence.tolist(), [1003] * 5 + [3] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
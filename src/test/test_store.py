@@ -0,0 +1,237 @@
+import os
+import tempfile
+import time
+import unittest
+
+import pandas as pd
+import pandas.testing as pd_testing
+from src.cache import DataFrameCache
+from src.data import Dataset
+from src.profiling import OverallReport, load_column_names, load_reports
+from src.settings import FormatBarPlot, ParamsSections
+from src.store import ProfileStore, get_namespace
+
+
+class TestProfileStore(unittest.TestCase):
+    """Class containing the tests for the on-disk store of results."""
+
+    def setUp(self) -> None:
+        """Setting up an empty store in a temporary folder."""
+
+        # Instantiated store and parameters
+        self.folder = tempfile.TemporaryDirectory()
+        self.store = ProfileStore(self.folder.name, 1, "namespace")
+        self.df = pd.DataFrame({"text_col": ["a", "b", "b", None]})
+        self.params = ParamsSections(
+            DROP_NA=True,
+            TOP_FREQUENCY=5,
+            PLOT=FormatBarPlot(
+                Y_AXIS_LABEL="y_axis_label",
+                AXIS_FONT_SIZE=14,
+                TICK_FONT_SIZE=16,
+                CATEGORY_ORDER="total descending",
+                TEMPLATE="simple_white",
+                TITLE="title",
+            ),
+        )
+
+    def tearDown(self) -> None:
+        """Delete the variables and the folder after each test."""
+        self.folder.cleanup()
+        del self.folder, self.store, self.df, self.params
+
+    def test_get_namespace(self) -> None:
+        """Test that the namespace changes with the parameters file and the version."""
+
+        # Act
+        path = os.path.join(self.folder.name, "parameters.yml")
+        with open(path, "w") as file:
+            file.write("APP_NAME: a")
+        result = get_namespace(path, "1.0.0")
+        with open(path, "w") as file:
+            file.write("APP_NAME: b")
+
+        # Assert: expected result
+        self.assertNotEqual(result, get_namespace(path, "1.0.0"))
+        self.assertNotEqual(get_namespace(path, "1.0.0"), get_namespace(path, "1.0.1"))
+
+    def test_put_get(self) -> None:
+        """Test that a stored result is read back, and a missing one is None."""
+
+        # Act
+        self.store.put("key", self.df)
+
+        # Assert: expected result
+        pd_testing.assert_frame_equal(self.store.get("key"), self.df)
+        self.assertIsNone(self.store.get("other"))
+        self.assertIn("key", self.store)
+
+    def test_invalidation(self) -> None:
+        """Test that opening the store with another namespace drops the stored results."""
+
+        # Act
+        self.store.put("key", self.df)
+        store = ProfileStore(self.folder.name, 1, "other_namespace")
+
+        # Assert: expected result
+        self.assertIsNone(store.get("key"))
+        self.assertEqual(os.listdir(self.folder.name), ["other_namespace"])
+
+    def test_unrelated_folder(self) -> None:
+        """Test that opening the store leaves the folders it did not create."""
+
+        # Instantiated folder placed next to the stores
+        unrelated = os.path.join(self.folder.name, "unrelated")
+        os.makedirs(unrelated)
+        with open(os.path.join(unrelated, "file.txt"), "w") as file:
+            file.write("content")
+
+        # Act
+        ProfileStore(self.folder.name, 1, "other_namespace")
+
+        # Assert: expected result
+        self.assertEqual(
+            sorted(os.listdir(self.folder.name)), ["other_namespace", "unrelated"]
+        )
+        self.assertEqual(os.listdir(unrelated), ["file.txt"])
+
+    def test_eviction(self) -> None:
+        """Test that the least recently used results are evicted above the maximum size."""
+
+        # Instantiated results of about 0.4 MB
+        content = b"x" * 400_000
+        self.store.put("first", content)
+        time.sleep(0.01)
+        self.store.put("second", content)
+        time.sleep(0.01)
+
+        # Act
+        self.store.get("first")
+        time.sleep(0.01)
+        self.store.put("third", content)
+
+        # Assert: expected result
+        self.assertIn("first", self.store)
+        self.assertNotIn("second", self.store)
+        self.assertIn("third", self.store)
+        self.assertLessEqual(self.store.size, 1024 ** 2)
+
+    def test_corrupted_entry(self) -> None:
+        """Test that an unreadable result is dropped."""
+
+        # Act
+        with open(os.path.join(self.folder.name, "namespace", "key.pkl"), "wb") as file:
+            file.write(b"not a pickle")
+
+        # Assert: expected result
+        self.assertIsNone(self.store.get("key"))
+        self.assertNotIn("key", self.store)
+
+    def test_load_reports(self) -> None:
+        """Test that stored reports are returned without loading the dataset."""
+
+        # Expected
+        expected = load_reports(
+            Dataset("file.csv", self.df),
+            "text",
+            self.params,
+            store=self.store,
+            key="key",
+        )
+
+        # Act
+        def fail() -> Dataset:
+            raise AssertionError("The dataset should not be loaded")
+
+        result = load_reports(fail, "text", self.params, store=self.store, key="key")
+
+        # Assert: expected result
+        pd_testing.assert_series_equal(result[0].metrics, expected[0].metrics)
+
+    def test_load_reports_cache(self) -> None:
+        """Test that the reports are kept in the in-memory cache before the store."""
+
+        # Expected
+        cache = DataFrameCache(1)
+        expected = load_reports(
+            Dataset("file.csv", self.df), "text", self.params, key="key", cache=cache
+        )
+
+        # Act
+        result = load_reports(None, "text", self.params, key="key", cache=cache)
+
+        # Assert: expected result
+        self.assertIs(result, expected)
+        self.assertEqual(cache.hits, 1)
+
+    def test_load_reports_columns(self) -> None:
+        """Test that only the columns never reported before are profiled."""
+
+        # Instantiated dataset with two text columns, counting its loads
+        dataset = Dataset("file.csv", self.df.assign(other_col=["c", "c", "d", "d"]))
+        loads = []
+
+        def load() -> Dataset:
+            loads.append(True)
+            return dataset
+
+        # Act
+        first = load_reports(
+            load, "text", self.params, store=self.store, key="key", columns=["text_col"]
+        )
+        result = load_reports(
+            load,
+            "text",
+            self.params,
+            store=self.store,
+            key="key",
+            columns=["other_col", "text_col"],
+        )
+
+        # Assert: expected result
+        self.assertEqual(len(loads), 2)
+        self.assertListEqual(
+            [report.col_name for report in result], ["other_col", "text_col"]
+        )
+        pd_testing.assert_series_equal(result[1].metrics, first[0].metrics)
+        self.assertEqual(
+            load_reports(
+                load, "text", self.params, store=self.store, key="key", columns=[]
+            ),
+            [],
+        )
+        self.assertEqual(len(loads), 2)
+
+    def test_load_column_names(self) -> None:
+        """Test that the stored column names are returned without loading the dataset."""
+
+        # Expected
+        expected = load_column_names(
+            Dataset("file.csv", self.df), "text", store=self.store, key="key"
+        )
+
+        # Act
+        def fail() -> Dataset:
+            raise AssertionError("The dataset should not be loaded")
+
+        result = load_column_names(fail, "text", store=self.store, key="key")
+
+        # Assert: expected result
+        self.assertListEqual(result, ["text_col"])
+        self.assertListEqual(result, expected)
+
+    def test_overall_report(self) -> None:
+        """Test that the overall report keeps the metrics and rows of the Dataset."""
+
+        # Act
+        result = OverallReport.from_dataset(Dataset("file.csv", self.df), 2)
+
+        # Assert: expected result
+        self.assertEqual(result.n_rows, 4)
+        self.assertEqual(result.n_duplicates, 1)
+        self.assertEqual(result.text_columns, ["text_col"])
+        self.assertEqual(len(result.head), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
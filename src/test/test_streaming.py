@@ -0,0 +1,271 @@
+import io
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pd_testing
+from plotly.graph_objs._figure import Figure
+from src.data import Dataset
+from src.settings import FormatBarPlot, FormatHistogram
+from src.streaming import StreamedDataset, stream_dataset
+
+CSV_CONTENT = b"""int_col,float_col,text_col,date_raw_col,sparse_col
+1,0.5,cc,2021-10-03,
+2,,cc,2021-10-02,
+1,0.5,DD,,
+-3,2.5,,1970-01-01,
+0,4.0,123,1900-01-01,
+1,0.5,cc,2021-10-03,
+7,-1.0,ab c,s,x
+"""
+
+
+class TestStreamedDataset(unittest.TestCase):
+    """Class containing the tests comparing a streamed Dataset with an in-memory one."""
+
+    def setUp(self) -> None:
+        """Setting up the same CSV file read at once and in chunks of two rows."""
+
+        # Instantiated Dataset classes and parameters
+        self.expected_dataset = Dataset(
+            "file.csv", pd.read_csv(io.BytesIO(CSV_CONTENT))
+        )
+        self.dataset = stream_dataset(
+            "file.csv", io.BytesIO(CSV_CONTENT), chunk_size=2, n_kept_rows=5
+        )
+        self.hist_params = FormatHistogram(
+            Y_AXIS_LABEL="y_axis_label",
+            MAX_BINS=50,
+            AXIS_FONT_SIZE=14,
+            TICK_FONT_SIZE=16,
+            TEMPLATE="simple_white",
+            TITLE="title",
+        )
+        self.bar_params = FormatBarPlot(
+            Y_AXIS_LABEL="y_axis_label",
+            AXIS_FONT_SIZE=14,
+            TICK_FONT_SIZE=16,
+            CATEGORY_ORDER="total descending",
+            TEMPLATE="simple_white",
+            TITLE="title",
+        )
+
+    def tearDown(self) -> None:
+        """Delete the variables after each test."""
+        del self.expected_dataset, self.dataset, self.hist_params, self.bar_params
+
+    def test_init(self) -> None:
+        """Test that the streamed dataset is a StreamedDataset and a Dataset."""
+
+        # Assert: type of instantiated class
+        self.assertIsInstance(self.dataset, StreamedDataset)
+        self.assertIsInstance(self.dataset, Dataset)
+
+    def test_dataset_metrics(self) -> None:
+        """Test that the dataset metrics match the in-memory ones."""
+
+        for method in [
+            "get_n_rows",
+            "get_n_cols",
+            "get_cols_list",
+            "get_cols_dtype",
+            "get_n_duplicates",
+            "get_n_missing",
+            "get_numeric_columns",
+            "get_text_columns",
+            "get_date_columns",
+        ]:
+            with self.subTest(method=method):
+                # Expected
+                expected = getattr(self.expected_dataset, method)()
+
+                # Act
+                result = getattr(self.dataset, method)()
+
+                # Assert: expected result
+                self.assertEqual(result, expected)
+
+    def test_kept_rows(self) -> None:
+        """Test that the head, tail and sample tables are taken from the whole file."""
+
+        # Act
+        head = self.dataset.get_head(3)
+        tail = self.dataset.get_tail(3)
+        sample = self.dataset.get_sample(10)
+
+        # Assert: expected result
+        pd_testing.assert_frame_equal(head, self.expected_dataset.get_head(3))
+        pd_testing.assert_frame_equal(tail, self.expected_dataset.get_tail(3))
+        self.assertEqual(sample.shape, (5, 5))
+
+    def test_numeric_column(self) -> None:
+        """Test that the numeric metrics match the in-memory ones."""
+
+        for col in self.expected_dataset.get_numeric_columns():
+            expected_column = self.expected_dataset.get_numeric_column(col)
+            column = self.dataset.get_numeric_column(col)
+            for method in [
+                "get_unique",
+                "get_missing",
+                "get_zeros",
+                "get_negatives",
+                "get_mean",
+                "get_std",
+                "get_min",
+                "get_max",
+                "get_median",
+            ]:
+                with self.subTest(col=col, method=method):
+                    # Expected
+                    expected = getattr(expected_column, method)()
+
+                    # Act
+                    result = getattr(column, method)()
+
+                    # Assert: expected result
+                    if isinstance(expected, float) and math.isnan(expected):
+                        self.assertTrue(math.isnan(result))
+                    else:
+                        self.assertAlmostEqual(result, expected)
+
+            # Assert: type of the chart
+            self.assertIsInstance(column.get_histogram(self.hist_params), Figure)
+
+    def test_text_column(self) -> None:
+        """Test that the text metrics match the in-memory ones."""
+
+        for col in self.expected_dataset.get_text_columns():
+            expected_column = self.expected_dataset.get_text_column(col)
+            column = self.dataset.get_text_column(col)
+            for method in [
+                "get_unique",
+                "get_missing",
+                "get_empty",
+                "get_whitespace",
+                "get_lowercase",
+                "get_uppercase",
+                "get_alphabet",
+                "get_digit",
+                "get_mode",
+            ]:
+                with self.subTest(col=col, method=method):
+                    # Expected
+                    expected = getattr(expected_column, method)()
+
+                    # Act
+                    result = getattr(column, method)()
+
+                    # Assert: expected result
+                    self.assertEqual(result, expected)
+
+            # Assert: expected frequency table
+            pd_testing.assert_frame_equal(
+                column.get_frequent(5).sort_values("value", ignore_index=True),
+                expected_column.get_frequent(5).sort_values("value", ignore_index=True),
+            )
+
+    def test_with_datetime(self) -> None:
+        """Test that the converted datetime columns match the in-memory ones."""
+
+        # Act
+        expected_dataset = self.expected_dataset.with_datetime(["date_raw_col"])
+        dataset = self.dataset.with_datetime(["date_raw_col"])
+        expected_column = expected_dataset.get_date_column("date_raw_col")
+        column = dataset.get_date_column("date_raw_col")
+
+        # Assert: expected classification
+        self.assertEqual(dataset.get_date_columns(), ["date_raw_col"])
+        self.assertEqual(dataset.get_text_columns(), ["text_col", "sparse_col"])
+        for method in [
+            "get_unique",
+            "get_missing",
+            "get_weekend",
+            "get_weekday",
+            "get_future",
+            "get_empty_1900",
+            "get_empty_1970",
+            "get_min",
+            "get_max",
+        ]:
+            with self.subTest(method=method):
+                self.assertEqual(
+                    getattr(column, method)(), getattr(expected_column, method)()
+                )
+
+        # Assert: type of the chart
+        self.assertIsInstance(column.get_barchart(self.bar_params), Figure)
+
+    def test_bounded_frequent(self) -> None:
+        """Test that the frequency tables are lower bounds within the error above the capacity."""
+
+        # Instantiated text column with a few frequent values and a long tail
+        values = [f"v{i % 5}" for i in range(500)] + [f"t{i}" for i in range(500)]
+        content = "text_col\n" + "\n".join(values) + "\n"
+        expected = pd.Series(values).value_counts()
+
+        # Act
+        dataset = stream_dataset(
+            "file.csv",
+            io.BytesIO(content.encode()),
+            chunk_size=100,
+            frequent_capacity=20,
+        )
+        column = dataset.get_text_column("text_col")
+        frequent, error = column.get_frequent_estimate(5)
+
+        # Assert: expected result
+        self.assertGreater(error, 0)
+        self.assertLessEqual(error, len(values) / 21)
+        self.assertListEqual(sorted(frequent.value), ["v0", "v1", "v2", "v3", "v4"])
+        occurrences = expected[frequent.value].to_numpy()
+        self.assertTrue((frequent.occurrence.to_numpy() <= occurrences).all())
+        self.assertTrue((frequent.occurrence.to_numpy() + error >= occurrences).all())
+        self.assertEqual(column.get_unique(), expected.size)
+        self.assertEqual(column.get_mode(), "v0")
+        self.assertIsInstance(column.get_barchart(self.bar_params), Figure)
+
+    def test_unique_rows(self) -> None:
+        """Test that estimated duplicated rows within the error of unique rows are none."""
+
+        # Instantiated file of 100,000 unique rows, seen as 664 duplicates by the sketch
+        content = "int_col\n" + "\n".join(map(str, range(100_000))) + "\n"
+
+        # Act
+        dataset = stream_dataset(
+            "file.csv",
+            io.BytesIO(content.encode()),
+            chunk_size=50_000,
+            exact_threshold=1000,
+        )
+
+        # Assert: expected result
+        self.assertGreater(dataset.get_n_duplicates(), 0)
+        self.assertEqual(dataset.get_n_duplicates_estimate(), (0, True))
+
+    def test_exact_histogram(self) -> None:
+        """Test that the histogram of a streamed column is counted exactly in the given bins."""
+
+        # Instantiated file longer than the quantile sketch holds exactly
+        values = np.random.default_rng(0).normal(size=200_000)
+        content = io.BytesIO()
+        pd.DataFrame({"float_col": values}).to_csv(content, index=False)
+        expected_dataset = Dataset(
+            "file.csv", pd.read_csv(io.BytesIO(content.getvalue()))
+        )
+        expected = expected_dataset.get_numeric_column("float_col")
+
+        # Act
+        dataset = stream_dataset(
+            "file.csv", content, chunk_size=30_000, max_bins=self.hist_params.MAX_BINS
+        )
+        result = dataset.get_numeric_column("float_col").get_histogram(self.hist_params)
+
+        # Assert: expected result
+        expected_bars = expected.get_histogram(self.hist_params).data[0]
+        np.testing.assert_array_equal(result.data[0].y, expected_bars.y)
+        np.testing.assert_array_equal(result.data[0].x, expected_bars.x)
+
+
+if __name__ == "__main__":
+    unittest.main()
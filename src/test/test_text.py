@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 import pandas.api.types as ptypes
 from plotly.graph_objs._figure import Figure
+from src.profiling import partition_column
 from src.settings import FormatBarPlot, ParamsSections
 from src.text import TextColumn
 
@@ -286,6 +287,91 @@ class TestMethodsValidTextColumn(TestMethodsText, unittest.TestCase):
         # Assert: upper bound for sum of percentages
         self.assertLessEqual(result.percentage.sum(), expected_upper_bound_perc)
 
+    def test_valid_value_counts(self):
+        """Test that the metrics taken from the value count table match pandas."""
+
+        for dropna in [True, False]:
+            with self.subTest(dropna=dropna):
+                # Expected
+                expected_unique = self.serie.nunique(dropna=dropna)
+                expected_mode = self.serie.mode(dropna=dropna)[0]
+                expected_percentages = self.serie.value_counts(
+                    normalize=True, dropna=dropna
+                ).round(decimals=4)
+
+                # Act
+                result = self.text_class.get_frequent(
+                    n_head=len(self.serie), dropna=dropna
+                )
+
+                # Assert: expected result
+                self.assertEqual(self.text_class.get_unique(dropna), expected_unique)
+                self.assertEqual(self.text_class.get_mode(dropna), expected_mode)
+                self.assertListEqual(
+                    sorted(result.percentage), sorted(expected_percentages)
+                )
+
+    def test_valid_unused_category(self):
+        """Test that the unused categories of a categorical column are not counted."""
+
+        # Condition test: categories a, b and zzz, of which zzz is unused
+        serie = pd.Series(
+            pd.Categorical(["a", "b", "a", None], categories=["a", "b", "zzz"])
+        )
+        column = TextColumn("categorical", serie)
+
+        for text_class in [column, partition_column(column, 2)]:
+            with self.subTest(text_class=type(text_class).__name__):
+                # Act
+                result = text_class.get_frequent(n_head=5)
+
+                # Assert: expected result
+                self.assertEqual(text_class.get_unique(), 2)
+                self.assertListEqual(result.value.tolist(), ["a", "b"])
+                self.assertListEqual(result.occurrence.tolist(), [2, 1])
+
+    def test_valid_character_classes(self):
+        """Test that the single classification pass matches the .str accessor."""
+
+        # Condition test: mixed values and categories
+        serie = pd.Series(["", "É", "ǅ", "٣", "\t", "aB", 3, None, "x", "x"] * 2)
+
+        for dtype in [object, "category"]:
+            with self.subTest(dtype=dtype):
+                # Expected
+                accessor = serie.astype(dtype).str
+                expected = [
+                    accessor.fullmatch("").sum(),
+                    accessor.isspace().sum(),
+                    accessor.islower().sum(),
+                    accessor.isupper().sum(),
+                    accessor.isalpha().sum(),
+                    accessor.isdigit().sum(),
+                ]
+
+                # Act
+                text_class = TextColumn("mixed", serie.astype(dtype))
+                result = [
+                    text_class.get_empty(),
+                    text_class.get_whitespace(),
+                    text_class.get_lowercase(),
+                    text_class.get_uppercase(),
+                    text_class.get_alphabet(),
+                    text_class.get_digit(),
+                ]
+
+                # Assert: expected result
+                self.assertListEqual(result, [int(count) for count in expected])
+
+
+class TestMethodsPartitionedValidTextColumn(TestMethodsValidTextColumn):
+    """Class running the same tests on the TextColumn profiled by partitions of 2 rows."""
+
+    def setUp(self) -> None:
+        """Setting up the merged partial states of the TextColumn before each test."""
+        super().setUp()
+        self.text_class = partition_column(self.text_class, partition_rows=2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,57 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 import pandas as pd
-import plotly.express as px
-from plotly.graph_objs._figure import Figure
 
 from src.settings import FormatBarPlot
+from src.sketches import count_distinct
+
+if TYPE_CHECKING:
+    from plotly.graph_objs._figure import Figure
+
+
+@dataclass(frozen=True)
+class TextProfile:
+    """
+    Class for storing the character class counts of a text column.
+
+    Attributes
+    ----------
+    n_empty: int
+        Number of empty strings.
+
+    n_whitespace, n_lowercase, n_uppercase, n_alphabet, n_digit: int
+        Number of strings made only of whitespaces, of lower case characters, of
+        upper case characters, of alphabet characters and of numbers.
+    """
+
+    n_empty: int
+    n_whitespace: int
+    n_lowercase: int
+    n_uppercase: int
+    n_alphabet: int
+    n_digit: int
+
+    @classmethod
+    def from_counts(cls, counts: pd.Series) -> "TextProfile":
+        """Return the profile of a value count table, classifying each distinct value once."""
+        totals = [0] * 6
+        for value, count in counts.items():
+            # Values that are not strings are not counted, as with the .str accessor
+            if not count or not isinstance(value, str):
+                continue
+            flags = (
+                value == "",
+                value.isspace(),
+                value.islower(),
+                value.isupper(),
+                value.isalpha(),
+                value.isdigit(),
+            )
+            for i, flag in enumerate(flags):
+                if flag:
+                    totals[i] += count
+        return cls(*(int(total) for total in totals))
 
 
 @dataclass
@@ -23,6 +70,12 @@ class TextColumn:
 
     col_name: str
     serie: pd.Series
+    _value_counts: Dict[bool, pd.Series] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _profile: Optional[TextProfile] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_name(self) -> str:
         """Return name of selected column."""
@@ -30,71 +83,87 @@ class TextColumn:
 
     def get_unique(self, dropna: bool = True) -> int:
         """Return number of unique values for selected column."""
-        return self.serie.nunique(dropna=dropna)
+        return len(self._get_counts(dropna))
+
+    def get_unique_estimate(
+        self, dropna: bool = True, error: float = 0.01, threshold: int = 100_000
+    ) -> Tuple[int, bool]:
+        """Return number of unique values for selected column and whether it is estimated."""
+        # Exact when the value counts are already there or the column is short
+        if dropna in self._value_counts or len(self.serie) <= threshold:
+            return self.get_unique(dropna), False
+
+        return count_distinct(self.serie, dropna, error, threshold)
 
     def get_missing(self) -> int:
         """Return number of missing values for selected column."""
         return int(self.serie.isna().sum())
 
+    def profile(self) -> TextProfile:
+        """Return the character class counts of selected column, computed once."""
+        if self._profile is None:
+            self._profile = TextProfile.from_counts(self._get_counts(dropna=True))
+        return self._profile
+
     def get_empty(self) -> int:
         """Return number of rows with empty string for selected column."""
-        return int(self.serie.str.fullmatch("").sum())
+        return self.profile().n_empty
 
     def get_whitespace(self) -> int:
         """Return number of rows with only whitespaces for selected column."""
-        return int(self.serie.str.isspace().sum())
+        return self.profile().n_whitespace
 
     def get_lowercase(self) -> int:
         """Return number of rows with only lower case characters for selected column."""
-        return int(self.serie.str.islower().sum())
+        return self.profile().n_lowercase
 
     def get_uppercase(self) -> int:
         """Return number of rows with only upper case characters for selected column."""
-        return int(self.serie.str.isupper().sum())
+        return self.profile().n_uppercase
 
     def get_alphabet(self) -> int:
         """Return number of rows with only alphabet characters for selected column."""
-        return int(self.serie.str.isalpha().sum())
+        return self.profile().n_alphabet
 
     def get_digit(self) -> int:
         """Return number of rows with only numbers as characters for selected column."""
-        return int(self.serie.str.isdigit().sum())
+        return self.profile().n_digit
 
     def get_mode(self, dropna: bool = True) -> str:
         """Return the mode value for selected column."""
-        return self.serie.mode(dropna=dropna)[0]
+        counts = self._get_counts(dropna)
+        modes = counts[counts == counts.max()]
+        try:
+            # Ties are broken by the smallest value, as in pd.Series.mode
+            modes = modes.sort_index()
+        except TypeError:
+            pass
+        return modes.index[0]
+
+    def _get_counts(self, dropna: bool = True) -> pd.Series:
+        """Return the value count table of selected column, computed once per dropna setting."""
+        if dropna not in self._value_counts:
+            counts = self.serie.value_counts(dropna=dropna)
+            # Categorical columns also count their unused categories
+            self._value_counts[dropna] = counts[counts > 0]
+        return self._value_counts[dropna]
 
     def _get_occurrences(self, dropna: bool = True) -> pd.Series:
         """Return the occurrences per value for selected column."""
-        return self.serie.value_counts(dropna=dropna).rename("occurrence")
+        return self._get_counts(dropna).rename("occurrence")
 
     def _get_percentages(self, dropna: bool = True) -> pd.Series:
         """Return the normalised occurrences per value for selected column."""
-        return (
-            self.serie.value_counts(normalize=True, dropna=dropna)
-            .round(decimals=4)
-            .rename("percentage")
-        )
+        counts = self._get_counts(dropna)
+        return (counts / counts.sum()).round(decimals=4).rename("percentage")
 
-    def get_barchart(self, params: FormatBarPlot, dropna: bool = True) -> Figure:
+    def get_barchart(self, params: FormatBarPlot, dropna: bool = True) -> "Figure":
         """Return the generated bar chart for selected column."""
-        fig = px.bar(self._get_occurrences(dropna=dropna))
-        fig.update_layout(
-            title=params.TITLE,
-            xaxis=dict(
-                title=self.col_name,
-                titlefont_size=params.AXIS_FONT_SIZE,
-                tickfont_size=params.TICK_FONT_SIZE,
-            ),
-            yaxis=dict(
-                title=params.Y_AXIS_LABEL,
-                titlefont_size=params.AXIS_FONT_SIZE,
-                tickfont_size=params.TICK_FONT_SIZE,
-            ),
-            showlegend=False,
-            template=params.TEMPLATE,
+        from src.charts import plot_occurrences
+
+        return plot_occurrences(
+            self._get_occurrences(dropna=dropna), self.col_name, params
         )
-        return fig
 
     def get_frequent(self, n_head: int = 20, dropna: bool = True) -> pd.DataFrame:
         """Return the Pandas dataframe containing the occurrences and percentage of the top n_head most frequent values."""
@@ -111,3 +180,10 @@ class TextColumn:
             .head(n_head)
             .reset_index()
         )
+
+    def get_frequent_estimate(
+        self, n_head: int = 20, dropna: bool = True, capacity: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, int]:
+        """Return the frequency table of the top n_head values and the maximum error of its occurrences."""
+        # The whole column is in memory, so its value counts cost no more than a sketch
+        return self.get_frequent(n_head, dropna), 0